@@ -12,11 +12,33 @@ DROPBOX_SALESFORCE_FOLDER = os.getenv('DROPBOX_SALESFORCE_FOLDER')
 DROPBOX_USERNAME = os.getenv('DROPBOX_USERNAME')
 DROPBOX_PASSWORD = os.getenv('DROPBOX_PASSWORD')
 
+# Dropbox incremental sync state (saved list_folder cursor per root folder)
+DROPBOX_SYNC_STATE_FILE = os.getenv('DROPBOX_SYNC_STATE_FILE', 'data/dropbox_sync_state.json')
+
+# Dropbox metadata cache (SQLite snapshot of the account tree; empty path disables it)
+DROPBOX_METADATA_CACHE_DB = os.getenv('DROPBOX_METADATA_CACHE_DB', 'data/dropbox_metadata.db')
+
 # Salesforce configuration
 SALESFORCE_URL = os.getenv('SALESFORCE_URL', 'https://capitalprotect.lightning.force.com')
 SALESFORCE_USERNAME = os.getenv('SALESFORCE_USERNAME')
 SALESFORCE_PASSWORD = os.getenv('SALESFORCE_PASSWORD')
 
+# Salesforce account search backend: 'ui' types into the search boxes, 'soql' queries the REST API with the browser session
+SALESFORCE_SEARCH_BACKEND = os.getenv('SALESFORCE_SEARCH_BACKEND', 'ui')
+SALESFORCE_API_URL = os.getenv('SALESFORCE_API_URL', SALESFORCE_URL.replace('.lightning.force.com', '.my.salesforce.com'))
+SALESFORCE_API_VERSION = os.getenv('SALESFORCE_API_VERSION', '59.0')
+SALESFORCE_SOQL_LIMIT = int(os.getenv('SALESFORCE_SOQL_LIMIT', '200'))
+# Account Ids (or names) per SOQL query when listing files or resolving accounts in bulk
+SALESFORCE_SOQL_BATCH_SIZE = int(os.getenv('SALESFORCE_SOQL_BATCH_SIZE', '200'))
+
+# Local snapshot of the account list view used to search accounts offline (refreshed when older than the TTL, in seconds)
+SALESFORCE_ACCOUNT_DIRECTORY_DB = os.getenv('SALESFORCE_ACCOUNT_DIRECTORY_DB', 'data/account_directory.db')
+SALESFORCE_ACCOUNT_DIRECTORY_TTL = int(os.getenv('SALESFORCE_ACCOUNT_DIRECTORY_TTL', '86400'))
+
+# Last-name search results reused by folders sharing a last name, across runs while younger than the TTL (in seconds)
+SALESFORCE_SEARCH_CACHE_DB = os.getenv('SALESFORCE_SEARCH_CACHE_DB', 'data/search_cache.db')
+SALESFORCE_SEARCH_CACHE_TTL = int(os.getenv('SALESFORCE_SEARCH_CACHE_TTL', '21600'))
+
 # File patterns
 ACCOUNT_INFO_PATTERN = os.getenv('ACCOUNT_INFO_PATTERN', '*App.pdf')
 DRIVERS_LICENSE_PATTERN = os.getenv('DRIVERS_LICENSE_PATTERN', '*DL.jpeg')
@@ -27,14 +49,65 @@ UPLOAD_TIMEOUT = int(os.getenv('UPLOAD_TIMEOUT', '300'))
 # Browser configuration
 CHROME_DEBUG_PORT = int(os.getenv('CHROME_DEBUG_PORT', '9222'))
 
+# Salesforce page pool (browser tabs searching accounts in parallel; 1 keeps a single tab)
+SALESFORCE_PAGE_POOL_SIZE = int(os.getenv('SALESFORCE_PAGE_POOL_SIZE', '1'))
+SALESFORCE_PAGE_MAX_ATTEMPTS = int(os.getenv('SALESFORCE_PAGE_MAX_ATTEMPTS', '2'))
+SALESFORCE_PAGE_RECYCLE_AFTER = int(os.getenv('SALESFORCE_PAGE_RECYCLE_AFTER', '50'))
+
+# Read list view and Files rows from Lightning's aura/UI API responses (the table is scraped when none lands in time)
+SALESFORCE_CAPTURE_RESPONSES = os.getenv('SALESFORCE_CAPTURE_RESPONSES', 'true').lower() == 'true'
+SALESFORCE_RESPONSE_TIMEOUT_MS = int(os.getenv('SALESFORCE_RESPONSE_TIMEOUT_MS', '5000'))
+
+# Navigate between Lightning pages client-side, with a full load after this many client-side navigations.
+# Off by default: Lightning can keep earlier views hidden in the DOM, and the page selectors are not scoped to the active view
+SALESFORCE_SOFT_NAVIGATION = os.getenv('SALESFORCE_SOFT_NAVIGATION', 'false').lower() == 'true'
+SALESFORCE_MAX_SOFT_NAVIGATIONS = int(os.getenv('SALESFORCE_MAX_SOFT_NAVIGATIONS', '100'))
+SALESFORCE_NAVIGATION_TIMEOUT_MS = int(os.getenv('SALESFORCE_NAVIGATION_TIMEOUT_MS', '10000'))
+
+# Abort image, font, media and analytics requests of the Salesforce session (URL fragments in the allowlist are kept)
+SALESFORCE_BLOCK_ASSETS = os.getenv('SALESFORCE_BLOCK_ASSETS', 'false').lower() == 'true'
+SALESFORCE_BLOCK_ASSETS_ALLOW = [
+    pattern.strip() for pattern in os.getenv('SALESFORCE_BLOCK_ASSETS_ALLOW', '').split(',') if pattern.strip()
+]
+
+# Longest wait for a page condition (rows rendered, count updated, toast) and the DOM quiet time that counts as settled
+SALESFORCE_WAIT_TIMEOUT_MS = int(os.getenv('SALESFORCE_WAIT_TIMEOUT_MS', '5000'))
+SALESFORCE_WAIT_QUIET_MS = int(os.getenv('SALESFORCE_WAIT_QUIET_MS', '300'))
+
 # Logging configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
 # Temporary directory configuration
 TEMP_DIR = os.getenv('TEMP_DIR', '/tmp/sync-files')
 
+# Dropbox download cache (files stored once per content_hash, least recently used evicted first)
+DROPBOX_DOWNLOAD_CACHE_DIR = os.getenv('DROPBOX_DOWNLOAD_CACHE_DIR', 'data/download_cache')
+DROPBOX_DOWNLOAD_CACHE_MAX_MB = int(os.getenv('DROPBOX_DOWNLOAD_CACHE_MAX_MB', '2048'))
+
+# Parsed holiday workbook cache (sheets saved per Dropbox file revision)
+HOLIDAY_WORKBOOK_CACHE_DIR = os.getenv('HOLIDAY_WORKBOOK_CACHE_DIR', 'data/workbook_cache')
+
 # Retry configuration
 MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
 
+# Dropbox request concurrency (worker threads and request start rate shared by all workers)
+DROPBOX_MAX_WORKERS = int(os.getenv('DROPBOX_MAX_WORKERS', '8'))
+DROPBOX_REQUESTS_PER_SECOND = float(os.getenv('DROPBOX_REQUESTS_PER_SECOND', '10'))
+
+# Driver's license OCR (results cached per file content hash; debug images and raw OCR text only when DL_OCR_DEBUG is true)
+DL_OCR_CACHE_DB = os.getenv('DL_OCR_CACHE_DB', 'data/ocr_cache.db')
+DL_OCR_DEBUG = os.getenv('DL_OCR_DEBUG', 'false').lower() == 'true'
+# Worker processes running driver's license OCR in the background (0 runs it inline)
+DL_OCR_WORKERS = int(os.getenv('DL_OCR_WORKERS', '4'))
+# Seconds the account loop waits for one background OCR result before skipping it
+DL_OCR_TIMEOUT = float(os.getenv('DL_OCR_TIMEOUT', '300'))
+# PDF pages read for driver's license text, and the DPI of the first and escalated OCR passes
+DL_PDF_TEXT_MAX_PAGES = int(os.getenv('DL_PDF_TEXT_MAX_PAGES', '2'))
+DL_PDF_OCR_DPI = int(os.getenv('DL_PDF_OCR_DPI', '150'))
+DL_PDF_OCR_MAX_DPI = int(os.getenv('DL_PDF_OCR_MAX_DPI', '300'))
+
+# FlatFile output (workbook and CSV are rewritten after this many accounts, and at the end of the run)
+FLATFILE_FLUSH_EVERY = int(os.getenv('FLATFILE_FLUSH_EVERY', '25'))
+
 # Batch processing configuration
 MAX_BATCH_SIZE = int(os.getenv('MAX_BATCH_SIZE', '10')) 
\ No newline at end of file
@@ -110,6 +110,11 @@ from pathlib import Path
 from src.sync.salesforce_client.pages.account_manager import AccountManager
 from src.sync.salesforce_client.pages.file_manager import SalesforceFileManager
 from src.sync.salesforce_client.utils.browser import get_salesforce_page
+from src.sync.salesforce_client.utils.page_pool import SalesforcePagePool
+from src.sync.salesforce_client.utils.asset_blocker import AssetBlocker
+from src.sync.salesforce_client.utils.account_directory import AccountDirectory
+from src.sync.salesforce_client.utils.search_cache import LastNameSearchCache
+from src.sync.salesforce_client.utils.soql_search import SalesforceRestClient
 from src.sync.dropbox_client.utils.account_utils import (
     read_accounts_folders,
     read_ignored_folders
@@ -122,6 +127,14 @@ from src.sync.dropbox_client.utils.dropbox_utils import (
     get_folder_creation_date
 )
 from src.sync.dropbox_client.utils.date_utils import has_date_prefix
+from src.sync.dropbox_client.utils.flatfile_writer import FlatFileWriter
+from src.sync.dropbox_client.utils.ocr_service import DlOcrService
+from src.config import DL_OCR_WORKERS, SALESFORCE_PAGE_POOL_SIZE, SALESFORCE_BLOCK_ASSETS
+from src.sync.dropbox_client.utils.sync_state import (
+    load_sync_state,
+    save_sync_state,
+    get_changed_account_names
+)
 from dropbox.exceptions import ApiError
 import dropbox
 from typing import List, Union
@@ -304,6 +317,52 @@ def parse_args():
     parser.add_argument('--dl',
                       help='Process driver\'s license information',
                       action='store_true')
+    parser.add_argument('--dl-debug',
+                      help='Write driver\'s license OCR debug images and raw text to the temp directory',
+                      action='store_true')
+    parser.add_argument('--salesforce-pages',
+                      help='Search Salesforce accounts (and list their files) on this many browser tabs in parallel before the account loop (default: SALESFORCE_PAGE_POOL_SIZE)',
+                      type=int)
+    parser.add_argument('--search-backend',
+                      help='Salesforce account search: ui types into the search boxes, soql runs one REST API query with the browser session (default: SALESFORCE_SEARCH_BACKEND)',
+                      choices=['ui', 'soql'])
+    parser.add_argument('--bulk-salesforce-files',
+                      help='List the files of all matched Salesforce accounts with batched SOQL queries before the account loop (with --salesforce-account-files)',
+                      action='store_true')
+    parser.add_argument('--account-directory',
+                      help='Match Salesforce accounts against a local snapshot of the list view, searching the browser only when it has no exact match',
+                      action='store_true')
+    parser.add_argument('--refresh-account-directory',
+                      help='Snapshot the Salesforce list view into the account directory even if the saved one is within SALESFORCE_ACCOUNT_DIRECTORY_TTL (implies --account-directory)',
+                      action='store_true')
+    parser.add_argument('--no-search-cache',
+                      help='Search Salesforce for every folder instead of reusing the result of an earlier search for the same last name',
+                      action='store_true')
+    parser.add_argument('--refresh-search-cache',
+                      help='Discard the saved Salesforce last-name search results before the run',
+                      action='store_true')
+    parser.add_argument('--block-assets',
+                      help='Skip downloading images, fonts, media and analytics in the Salesforce tabs (default: SALESFORCE_BLOCK_ASSETS)',
+                      action='store_true')
+    parser.add_argument('--dl-workers',
+                      help='Number of background driver\'s license OCR processes; 0 runs OCR inline (default: DL_OCR_WORKERS)',
+                      type=int)
+    parser.add_argument('--incremental',
+                      help='Only process account folders changed since the last --incremental run (uses the saved Dropbox cursor)',
+                      action='store_true')
+    parser.add_argument('--dropbox-workers',
+                      help='Number of parallel Dropbox listing/download workers (default: DROPBOX_MAX_WORKERS)',
+                      type=int,
+                      default=None)
+    parser.add_argument('--refresh-dropbox-cache',
+                      help='Ignore the cached Dropbox metadata snapshot and list the account tree again',
+                      action='store_true')
+    parser.add_argument('--no-tree-index',
+                      help='List each Dropbox account folder individually instead of indexing the whole tree once',
+                      action='store_true')
+    parser.add_argument('--bulk-dropbox-info',
+                      help='Match all account folders against the holiday file in one pass before the account loop (with --dropbox-account-info)',
+                      action='store_true')
     
     return parser.parse_args()
 
@@ -334,6 +393,19 @@ def initialize_dropbox_client(args):
         logger.info("Initializing Dropbox client...")
         dbx = DropboxClient(token, debug_mode=True)
         dbx.args = args  # Pass args to the client
+        dbx.use_tree_index = not getattr(args, 'no_tree_index', False)
+        if getattr(args, 'dl_debug', False):
+            dbx.ocr_debug = True
+        dl_workers = getattr(args, 'dl_workers', None)
+        if dl_workers is None:
+            dl_workers = DL_OCR_WORKERS
+        if getattr(args, 'dl', False) and dl_workers > 0:
+            # Created here, on the main thread, before prefetch submits from worker threads
+            dbx.ocr_service = DlOcrService(max_workers=dl_workers, ocr_debug=dbx.ocr_debug)
+        if getattr(args, 'dropbox_workers', None):
+            dbx.request_executor.max_workers = args.dropbox_workers
+        if getattr(args, 'refresh_dropbox_cache', False) and dbx.metadata_cache:
+            dbx.metadata_cache.clear(dbx.root_folder)
         
         # Test connection
         try:
@@ -357,6 +429,46 @@ def initialize_dropbox_client(args):
     
       
 
+def filter_changed_account_folders(args, account_folders):
+    """
+    Restrict account folders to the ones changed since the last incremental run.
+    
+    Args:
+        args: Command line arguments
+        account_folders: Candidate account folder names
+        
+    Returns:
+        tuple: (folders to process, cursor to save after the run). Without a usable
+        saved cursor all folders are returned together with a fresh cursor.
+    """
+    dropbox_client = initialize_dropbox_client(args)
+    if not dropbox_client:
+        logger.error("Failed to initialize Dropbox client, processing all folders")
+        return account_folders, None
+
+    state = load_sync_state(dropbox_client.root_folder)
+    saved_cursor = state.get('cursor')
+    if not saved_cursor:
+        logger.info("No saved Dropbox cursor found, processing all folders")
+        report_logger.info("\nIncremental mode: no saved cursor, processing all folders")
+        return account_folders, dropbox_client.get_root_cursor()
+
+    changed, new_cursor = get_changed_account_names(
+        dropbox_client.dbx, dropbox_client.root_folder, saved_cursor, request=dropbox_client._make_request
+    )
+    if changed is None:
+        report_logger.info("\nIncremental mode: saved cursor is no longer valid, processing all folders")
+        return account_folders, dropbox_client.get_root_cursor()
+
+    pending = state.get('pending_folders', [])
+    wanted = {name.lower() for name in changed} | {name.lower() for name in pending}
+    changed_folders = [folder for folder in account_folders if folder.lower() in wanted]
+    logger.info(f"Incremental mode: {len(changed_folders)} of {len(account_folders)} folders changed since {state.get('updated_at')}")
+    report_logger.info(f"\nIncremental mode: {len(changed_folders)} of {len(account_folders)} folders changed since {state.get('updated_at')}")
+    for folder in changed_folders:
+        report_logger.info(f"   + {folder}")
+    return changed_folders, new_cursor
+
 def run_command(args):
     """
     Run the command based on the provided arguments.
@@ -481,6 +593,14 @@ def run_command(args):
             report_logger.info(f"\nUnexpected error: {str(e)}")
             return
 
+    # Restrict to folders changed since the last incremental run
+    incremental_cursor = None
+    incremental_folders = []
+    if args.incremental:
+        logger.info("step: Get Changed Dropbox Account Folders")
+        ACCOUNT_FOLDERS, incremental_cursor = filter_changed_account_folders(args, ACCOUNT_FOLDERS)
+        incremental_folders = list(ACCOUNT_FOLDERS)
+
     # Apply batch size and start-from if specified
     if args.account_batch_size:
         start_idx = args.start_from
@@ -528,6 +648,7 @@ def run_command(args):
 
     # List to store results for summary
     summary_results = []
+    processed_folders = set()
 
     logger.info('step: Process Dropbox Account folders')
     
@@ -538,6 +659,7 @@ def run_command(args):
         report_logger.info("Failed to initialize Dropbox client. Exiting...")
         return
 
+    flatfile_writer = None
     with sync_playwright() as p:
         try:
             # Only initialize Salesforce components if Salesforce flags are set
@@ -548,12 +670,30 @@ def run_command(args):
             view_name="All Clients"
             
             if args.salesforce_accounts or args.salesforce_account_files:
-                browser, page = get_salesforce_page(p)
+                browser, page = get_salesforce_page(p, block_assets=args.block_assets or SALESFORCE_BLOCK_ASSETS)
                 # Initialize account manager and file manager
                 account_manager = AccountManager(page, debug_mode=True)
                 account_manager.logger.report_logger = report_logger  # Add report logger
+                if args.search_backend:
+                    account_manager.search_backend = args.search_backend
                 file_manager = SalesforceFileManager(page, debug_mode=True)
             
+            account_directory = None
+            if account_manager and (args.account_directory or args.refresh_account_directory):
+                logger.info('step: Load Salesforce Account Directory')
+                account_directory = load_account_directory(page, view_name, refresh=args.refresh_account_directory)
+                account_manager.account_directory = account_directory
+            
+            # Folders sharing a last name reuse one search (also across runs, within the TTL)
+            search_cache = None
+            if account_manager and not args.no_search_cache:
+                search_cache = LastNameSearchCache()
+                if args.refresh_search_cache:
+                    search_cache.clear()
+                account_manager.search_cache = search_cache
+                last_names = {extract_name_parts(name).get('last_name', '').lower() for name in ACCOUNT_FOLDERS}
+                logger.info(f"Search cache: {len(ACCOUNT_FOLDERS)} folders share {len(last_names)} distinct last names")
+            
             command_runner = None
             
             # Initialize command runner if commands are specified
@@ -576,13 +716,14 @@ def run_command(args):
             if total_folders == 0:
                 logger.warning("No Dropbox accounts to process")
                 report_logger.info("\nNo Dropbox accounts to process")
+                if args.incremental and incremental_cursor:
+                    save_sync_state(dropbox_client.root_folder, incremental_cursor)
                 return
             
             logger.info(f"Starting to process {total_folders} folders...")
             report_logger.info(f"\nStarting to process {total_folders} folders...")
 
             excel_file = None
-            flatfile_excel = None
             if args.dropbox_account_info:
                 # Process holiday file
                 holiday_file, temp_path, excel_file, sheets = dropbox_client._process_holiday_file()
@@ -593,10 +734,35 @@ def run_command(args):
 
                 # Process FlatFile template
                 template_path = os.path.join('docs', 'FlatFile Template 5.2025.xlsx')
-                flatfile_excel = prepare_flatfile_from_template(template_path, logger, report_logger)
-                if flatfile_excel is None:
+                flatfile_writer = prepare_flatfile_from_template(template_path, logger, report_logger)
+                if flatfile_writer is None:
                     return
 
+            # List folders and download driver's licenses concurrently before the account loop
+            if args.dropbox_account_files or (args.dropbox_account_info and args.dl):
+                logger.info('step: Prefetch Dropbox account folders')
+                dropbox_client.prefetch_account_folders(ACCOUNT_FOLDERS, download_drivers_licenses=args.dropbox_account_info and args.dl)
+
+            # Match every account against the holiday file up front, one worker process per sheet
+            bulk_dropbox_account_info = {}
+            if args.dropbox_account_info and args.bulk_dropbox_info:
+                logger.info('step: Bulk search for Dropbox Account Info')
+                bulk_dropbox_account_info = dropbox_client.dropbox_search_accounts(
+                    [(name, extract_name_parts(name, log=True)) for name in ACCOUNT_FOLDERS], excel_file
+                )
+
+            # Search Salesforce for every account up front on a pool of browser tabs
+            salesforce_prefetch = {}
+            salesforce_pages = args.salesforce_pages if args.salesforce_pages is not None else SALESFORCE_PAGE_POOL_SIZE
+            if args.salesforce_accounts and account_manager and salesforce_pages > 1:
+                logger.info(f'step: Salesforce Search Accounts on {salesforce_pages} pages')
+                salesforce_prefetch = prefetch_salesforce_accounts(ACCOUNT_FOLDERS, view_name, args, salesforce_pages, report_logger, account_directory, search_cache)
+
+            # List the files of every matched account with a few queries instead of a Files page per account
+            if args.salesforce_account_files and args.bulk_salesforce_files and account_manager:
+                logger.info('step: Bulk Salesforce Account Files')
+                salesforce_prefetch = bulk_fetch_salesforce_files(ACCOUNT_FOLDERS, view_name, account_manager, file_manager, salesforce_prefetch)
+
             # Process each folder name
             for index, dropbox_account_folder_name in enumerate(ACCOUNT_FOLDERS, 1):
                 logger.info(f"[{index}/{total_folders}] Processing Dropbox account folder: {dropbox_account_folder_name}")
@@ -608,6 +774,7 @@ def run_command(args):
                 file_comparison = None
                 dropbox_account_search_result = {}
                 salesforce_account_search_result = {}
+                salesforce_prefetched = salesforce_prefetch.get(dropbox_account_folder_name)
                 
                 # Add retry mechanism with 3 attempts
                 max_attempts = 3
@@ -626,22 +793,33 @@ def run_command(args):
                         # Always extract name parts
                         dropbox_account_name_parts = extract_name_parts(dropbox_account_folder_name, log=True)
                         
-                        # Navigate to Salesforce base URL
-                        if args.salesforce_accounts and account_manager:    
+                        # Navigate to Salesforce base URL (not needed when a pool page did the Salesforce work)
+                        needs_primary_page = not salesforce_prefetched or args.salesforce_account_info or command_runner
+                        if args.salesforce_accounts and account_manager and needs_primary_page:
                             logger.info(f"Navigating to Salesforce")
-                            if not account_manager.navigate_to_salesforce():
-                                logger.error("Failed to navigate to Salesforce base URL")
-                                report_logger.info("Failed to navigate to Salesforce base URL")
-                                raise Exception("Failed to navigate to Salesforce base URL")
-                            logger.info("Refreshing page")
-                            account_manager.refresh_page()
+                            if account_manager.navigator.soft_navigation:
+                                # Reuse the running Lightning app; it is reloaded only when stale
+                                if not account_manager.navigator.ensure_home():
+                                    logger.error("Failed to navigate to Salesforce base URL")
+                                    report_logger.info("Failed to navigate to Salesforce base URL")
+                                    raise Exception("Failed to navigate to Salesforce base URL")
+                            else:
+                                if not account_manager.navigate_to_salesforce():
+                                    logger.error("Failed to navigate to Salesforce base URL")
+                                    report_logger.info("Failed to navigate to Salesforce base URL")
+                                    raise Exception("Failed to navigate to Salesforce base URL")
+                                logger.info("Refreshing page")
+                                account_manager.refresh_page()
 
                         # Get Dropbox account info
                         if args.dropbox_account_info:
                             # DROPBOX ACCOUNT INFO
                             logger.info('step: Search for Dropbox Account Info')
                             logger.info(f"Getting info for Dropbox account: {dropbox_account_folder_name}")
-                            dropbox_account_search_result = dropbox_client.dropbox_search_account(dropbox_account_folder_name, dropbox_account_name_parts, excel_file)
+                            if dropbox_account_folder_name in bulk_dropbox_account_info:
+                                dropbox_account_search_result = bulk_dropbox_account_info[dropbox_account_folder_name]
+                            else:
+                                dropbox_account_search_result = dropbox_client.dropbox_search_account(dropbox_account_folder_name, dropbox_account_name_parts, excel_file)
                             logger.info(f'dropbox_account_search_result: {dropbox_account_search_result}')
                             logger.info(f"Successfully retrieved info for Dropbox account: {dropbox_account_folder_name}")
 
@@ -657,12 +835,9 @@ def run_command(args):
                             # Update FlatFile with account info if found
                             if dropbox_account_search_result.get('account_data'):
                                 logger.info("Updating FlatFile with account info...")
-                                output_xlsx = os.path.join('data', 'FlatFile.5.2025.xlsx')
                                 if dropbox_client.update_flatfile_with_account_info(
                                     dropbox_account_search_result,
-                                    flatfile_excel=flatfile_excel,
-                                    template_path=template_path,
-                                    output_path=output_xlsx
+                                    flatfile_writer=flatfile_writer
                                 ):
                                     logger.info("Successfully updated FlatFile with account info")
                                 else:
@@ -690,7 +865,10 @@ def run_command(args):
                         if args.salesforce_accounts and account_manager:
                             logger.info('step: Salesforce Search Account')
                             # Perform salesforce account search
-                            salesforce_account_search_result = account_manager.salesforce_search_account(dropbox_account_folder_name, view_name, dropbox_account_name_parts=dropbox_account_name_parts)
+                            if salesforce_prefetched:
+                                salesforce_account_search_result = salesforce_prefetched['salesforce_account_search_result']
+                            else:
+                                salesforce_account_search_result = account_manager.salesforce_search_account(dropbox_account_folder_name, view_name, dropbox_account_name_parts=dropbox_account_name_parts)
                             results[dropbox_account_folder_name] = {
                                 'salesforce_account_search_result': salesforce_account_search_result,
                                 'dropbox_account_search_result': dropbox_account_search_result
@@ -859,11 +1037,15 @@ def run_command(args):
                                         logger.info("for multiple matches, we'll check files for the first match")
                                         account_to_check = salesforce_matches[0] if isinstance(salesforce_matches, list) else salesforce_matches 
                                         logger.info(f"accounts_to_check: {account_to_check}")
-                                        # Navigate to the account and get its ID
+                                        # Use the files listed by a pool page, or navigate to the account and get its ID
+                                        prefetched_file_names = salesforce_prefetched.get('salesforce_account_file_names') if salesforce_prefetched else None
                                         logger.info(f"click_account_name: {account_to_check}")
-                                        if account_manager.click_account_name(account_to_check):
+                                        if prefetched_file_names is not None or account_manager.click_account_name(account_to_check):
                                             logger.info("verify_account_page_url")
-                                            is_valid, salesforce_account_id = account_manager.verify_account_page_url()
+                                            if prefetched_file_names is not None:
+                                                is_valid, salesforce_account_id = True, salesforce_prefetched['salesforce_account_id']
+                                            else:
+                                                is_valid, salesforce_account_id = account_manager.verify_account_page_url()
                                             if is_valid and salesforce_account_id:
                                                 logger.info(f"salesforce_account_id: {salesforce_account_id}")
                                                 if command_runner:  
@@ -871,7 +1053,10 @@ def run_command(args):
                                                 logger.info(f"salesforce_account_id: {salesforce_account_id}")
 
                                                 logger.info(f"get salesforce account file names")
-                                                salesforce_account_file_names = account_manager.get_salesforce_account_file_names(salesforce_account_id)
+                                                if prefetched_file_names is not None:
+                                                    salesforce_account_file_names = prefetched_file_names
+                                                else:
+                                                    salesforce_account_file_names = account_manager.get_salesforce_account_file_names(salesforce_account_id)
                                                 logger.info(f"Found {len(salesforce_account_file_names)} files in Salesforce")
 
                                                 # Update summary results with Salesforce files
@@ -935,6 +1120,15 @@ def run_command(args):
                     logger.error(f"Skipping folder {dropbox_account_folder_name} after all attempts failed")
                     report_logger.info(f"Skipping folder {dropbox_account_folder_name} after all attempts failed")
                     continue
+                processed_folders.add(dropbox_account_folder_name)
+
+            # Save the cursor, keeping changed folders that were not processed for the next run
+            if args.incremental and incremental_cursor:
+                pending_folders = [folder for folder in incremental_folders if folder not in processed_folders]
+                if pending_folders:
+                    logger.info(f"{len(pending_folders)} changed folders were not processed and will be retried next run")
+                    report_logger.info(f"\n{len(pending_folders)} changed folders will be retried on the next incremental run")
+                save_sync_state(dropbox_client.root_folder, incremental_cursor, pending_folders)
 
             # Print results summary
             if args.salesforce_accounts and account_manager:
@@ -1073,6 +1267,14 @@ def run_command(args):
                             total_salesforce_no_matches += 1
                 report_logger.info(f"Total Salesforce Matches Found: {total_salesforce_matches}")
                 report_logger.info(f"Total Salesforce No Matches: {total_salesforce_no_matches}")
+                if search_cache is not None:
+                    report_logger.info(f"Salesforce Last Name Searches Run: {search_cache.misses}")
+                    report_logger.info(f"Salesforce Last Name Searches Reused: {search_cache.hits}")
+                if account_manager is not None:
+                    report_logger.info(f"Salesforce Page Navigation: {account_manager.navigator.summary()}")
+                    report_logger.info(f"Salesforce Page Waits: {account_manager.waits.summary()}")
+                if AssetBlocker.installed() is not None:
+                    report_logger.info(f"Salesforce Assets Blocked: {AssetBlocker.installed().summary()}")
             report_logger.info(f"Total Accounts Processed: {len(summary_results)}")
 
              
@@ -1087,6 +1289,12 @@ def run_command(args):
             report_logger.info("\nStack trace:")
             report_logger.info(traceback.format_exc())
         finally:
+            if flatfile_writer is not None:
+                # Write the rows buffered since the last flush
+                flatfile_writer.close()
+            if dropbox_client.ocr_service is not None:
+                dropbox_client.ocr_service.shutdown()
+            dropbox_client.request_executor.shutdown()
             report_logger.info(f"\n=== ANALYSIS COMPLETE ===")
 
     # Calculate and log total duration
@@ -1208,13 +1416,174 @@ def format_summary_line(dropbox_folder_name: str, salesforce_info: dict, dropbox
     
     return summary
 
+def prefetch_salesforce_accounts(account_folders, view_name, args, pages, report_logger, account_directory=None, search_cache=None):
+    """
+    Search Salesforce for each account folder on a pool of browser tabs.
+    
+    Each tab has its own AccountManager and SalesforceFileManager. With
+    --salesforce-account-files, the first match's files are listed too.
+    
+    Args:
+        account_folders: Dropbox account folder names
+        view_name: Salesforce list view to search
+        args: Parsed command line arguments
+        pages: Number of browser tabs
+        report_logger: Report logger attached to each tab's AccountManager
+        account_directory: AccountDirectory searched before each tab's browser search (optional)
+        search_cache: LastNameSearchCache shared by the tabs (optional)
+        
+    Returns:
+        dict: Per folder that succeeded: 'salesforce_account_search_result',
+        'salesforce_account_id' and 'salesforce_account_file_names' (None when files
+        were not listed, so the account loop lists them on the main page)
+    """
+    def setup(page):
+        account_manager = AccountManager(page, debug_mode=True)
+        account_manager.logger.report_logger = report_logger
+        if args.search_backend:
+            account_manager.search_backend = args.search_backend
+        account_manager.account_directory = account_directory
+        account_manager.search_cache = search_cache
+        return account_manager
+
+    def search(account_manager, dropbox_account_folder_name):
+        dropbox_account_name_parts = extract_name_parts(dropbox_account_folder_name)
+        if not account_manager.navigate_to_salesforce():
+            raise Exception("Failed to navigate to Salesforce base URL")
+        search_result = account_manager.salesforce_search_account(dropbox_account_folder_name, view_name, dropbox_account_name_parts=dropbox_account_name_parts)
+        prefetched = {
+            'salesforce_account_search_result': search_result,
+            'salesforce_account_id': None,
+            'salesforce_account_file_names': None
+        }
+        matches = search_result.get('matches', [])
+        if args.salesforce_account_files and matches and not args.bulk_salesforce_files:
+            if account_manager.click_account_name(matches[0]):
+                is_valid, salesforce_account_id = account_manager.verify_account_page_url()
+                if is_valid and salesforce_account_id:
+                    prefetched['salesforce_account_id'] = salesforce_account_id
+                    prefetched['salesforce_account_file_names'] = account_manager.get_salesforce_account_file_names(salesforce_account_id)
+        return prefetched
+
+    pool = SalesforcePagePool(pages, setup, search)
+    return {
+        folder: result
+        for folder, (result, error) in pool.run(account_folders).items()
+        if error is None
+    }
+
+
+def load_account_directory(page, view_name, refresh=False):
+    """
+    Open the local account directory, taking a new snapshot of the list view if needed.
+    
+    Args:
+        page: Logged-in Salesforce page whose session reads the list view
+        view_name: Salesforce list view to snapshot
+        refresh: Take a new snapshot even if the saved one is within the TTL
+        
+    Returns:
+        AccountDirectory: The directory; if no current snapshot could be taken, account
+        searches skip it and use the browser
+    """
+    account_directory = AccountDirectory()
+    if refresh or not account_directory.is_fresh(view_name):
+        try:
+            count = account_directory.refresh(SalesforceRestClient(page), view_name)
+            logger.info(f"Account directory: saved {count} accounts of {view_name}")
+        except Exception as e:
+            logger.error(f"Could not snapshot {view_name} into the account directory: {str(e)}")
+    age = account_directory.snapshot_age(view_name)
+    if account_directory.is_fresh(view_name):
+        logger.info(f"Account directory: using snapshot of {view_name} taken {format_duration(age)} ago")
+    else:
+        logger.warning(f"Account directory: no current snapshot of {view_name}, searching accounts in the browser")
+    return account_directory
+
+
+def bulk_fetch_salesforce_files(account_folders, view_name, account_manager, file_manager, salesforce_prefetch):
+    """
+    Search every account folder and list the files of the matched accounts in bulk.
+    
+    Folders already searched by the page pool keep their search result. The first match of
+    each folder is resolved to an account ID and the files of all accounts are fetched with
+    batched ContentDocumentLink queries.
+    
+    Args:
+        account_folders: Dropbox account folder names
+        view_name: Salesforce list view to search
+        account_manager: AccountManager of the main page
+        file_manager: SalesforceFileManager of the main page
+        salesforce_prefetch: Results of prefetch_salesforce_accounts (may be empty)
+        
+    Returns:
+        dict: salesforce_prefetch extended with every folder searched; 'salesforce_account_id'
+        and 'salesforce_account_file_names' are set for matched accounts whose files were
+        listed (the account loop lists the others on the main page)
+    """
+    start_time = time.time()
+    prefetch = dict(salesforce_prefetch)
+    for dropbox_account_folder_name in account_folders:
+        if dropbox_account_folder_name in prefetch:
+            continue
+        try:
+            if account_manager.search_backend != 'soql' and not account_manager.navigate_to_salesforce():
+                raise Exception("Failed to navigate to Salesforce base URL")
+            dropbox_account_name_parts = extract_name_parts(dropbox_account_folder_name)
+            search_result = account_manager.salesforce_search_account(dropbox_account_folder_name, view_name, dropbox_account_name_parts=dropbox_account_name_parts)
+        except Exception as e:
+            logger.error(f"Salesforce search failed for {dropbox_account_folder_name}: {str(e)}")
+            continue
+        prefetch[dropbox_account_folder_name] = {
+            'salesforce_account_search_result': search_result,
+            'salesforce_account_id': None,
+            'salesforce_account_file_names': None
+        }
+
+    # The account loop checks the files of the first match
+    first_matches = {}
+    for dropbox_account_folder_name, prefetched in prefetch.items():
+        matches = prefetched['salesforce_account_search_result'].get('matches', [])
+        if matches and prefetched['salesforce_account_file_names'] is None:
+            first_matches[dropbox_account_folder_name] = matches[0]
+    if not first_matches:
+        return prefetch
+
+    account_ids = account_manager.resolve_account_ids(list(first_matches.values()))
+    files = file_manager.get_bulk_files(list(account_ids.values())) if account_ids else None
+    if files is None:
+        logger.warning("Bulk Salesforce file listing failed; files will be listed per account")
+        return prefetch
+
+    for dropbox_account_folder_name, account_name in first_matches.items():
+        account_id = account_ids.get(account_name)
+        if not account_id:
+            logger.warning(f"No account ID found for {account_name}; its files will be listed per account")
+            continue
+        prefetch[dropbox_account_folder_name]['salesforce_account_id'] = account_id
+        prefetch[dropbox_account_folder_name]['salesforce_account_file_names'] = [
+            file_info['full_name'] for file_info in files.get(account_id, [])
+        ]
+    logger.info(f"Listed Salesforce files of {len(account_ids)} accounts in {time.time() - start_time:.2f} seconds")
+    return prefetch
+
+
 def prepare_flatfile_from_template(template_path, logger, report_logger):
     """
-    Prepare the FlatFile Excel template: delete the output CSV and XLSX in accounts/ if they exist, then load and return the pd.ExcelFile object, or None if loading fails.
+    Prepare the FlatFile Excel template and return a FlatFileWriter for it, or None if loading fails.
+
+    If a previous run stopped before closing its writer (its journal is still there), the writer resumes from that
+    run's output and journal. Otherwise the output CSV and XLSX in data/ are deleted and the writer starts from the
+    template.
     """
     output_xlsx = os.path.join('data', 'FlatFile.5.2025.xlsx')
     output_csv = output_xlsx.replace('.xlsx', '.csv')
-    for out_path in [output_csv, output_xlsx]:
+    output_journal = f"{output_xlsx}.journal"
+    resume = os.path.exists(output_journal)
+    if resume:
+        logger.info(f"Resuming FlatFile from unfinished run: {output_journal}")
+        report_logger.info(f"Resuming FlatFile from unfinished run: {output_journal}")
+    for out_path in ([] if resume else [output_csv, output_xlsx]):
         if os.path.exists(out_path):
             try:
                 os.remove(out_path)
@@ -1224,9 +1593,9 @@ def prepare_flatfile_from_template(template_path, logger, report_logger):
                 report_logger.info(f"Error deleting output file {out_path}: {str(e)}")
     if os.path.exists(template_path):
         try:
-            flatfile_excel = pd.ExcelFile(template_path)
+            flatfile_writer = FlatFileWriter(template_path, output_xlsx, resume=resume)
             logger.info("Successfully loaded FlatFile template")
-            return flatfile_excel
+            return flatfile_writer
         except Exception as e:
             logger.error(f"Error loading FlatFile template: {str(e)}")
             report_logger.info(f"Error loading FlatFile template: {str(e)}")
@@ -284,20 +284,15 @@ class CommandRunner:
             self.report_logger.info(f"\nCopying folder from {source_path} to {dest_path}")
             
             # Use the Dropbox API to copy the folder
-            dropbox_client.dbx.files_copy_v2(source_path, dest_path)
+            copy_result = dropbox_client._make_request(dropbox_client.dbx.files_copy_v2, source_path, dest_path)
+            dropbox_client.record_changes([copy_result.metadata], stale_folder=dest_path)
 
-            # List all files in the source folder to get original modified dates
-            source_files = list_dropbox_folder_contents(dropbox_client.dbx, source_path)
-            source_file_dates = {}
+            # List all files in the source folder to get original modified dates.
+            # The copy has the same file names, so the renames can be computed from it
+            # without listing the destination folder.
+            source_files = dropbox_client.list_folder(source_path)
+            relocations = []
             for file in source_files:
-                if isinstance(file, dropbox.files.FileMetadata):
-                    source_file_dates[file.name] = file.server_modified
-
-            # List all files in the copied folder
-            dest_files = list_dropbox_folder_contents(dropbox_client.dbx, dest_path)
-            
-            # Process each file
-            for file in dest_files:
                 if isinstance(file, dropbox.files.FileMetadata):
                     # Check if file already has a date prefix (with or without space)
                     if len(file.name) >= 6 and file.name[:6].isdigit():
@@ -311,7 +306,7 @@ class CommandRunner:
                         try:
                             # Convert YY to YYYY (assuming 20xx for years < 50, 19xx for years >= 50)
                             full_year = 2000 + year if year < 50 else 1900 + year
-                            datetime.datetime(full_year, month, day)
+                            datetime(full_year, month, day)
                             # If we get here, it's a valid date
                             self.logger.info(f"Skipping already prefixed file: {file.name}")
                             self.report_logger.info(f"\nSkipping already prefixed file: {file.name}")
@@ -320,27 +315,32 @@ class CommandRunner:
                             # Not a valid date, continue with renaming
                             pass
 
-                    # Get the original file's modified date
-                    original_date = source_file_dates.get(file.name)
-                    if original_date:
-                        # Create date prefix from original file's modified date
-                        date_prefix = original_date.strftime('%y%m%d')
-                        
-                        # Create new name with date prefix
-                        new_name = f"{date_prefix} {file.name}"
-                        
-                        if new_name != file.name:
-                            # Construct new path
-                            new_path = f"{os.path.dirname(file.path_display)}/{new_name}"
-                            new_path = new_path.replace('//', '/')
-                            
-                            # Move/rename the file
-                            self.logger.info(f"Renaming file: {file.path_display} -> {new_path}")
-                            self.report_logger.info(f"\nRenaming file: {file.path_display} -> {new_path}")
-                            dropbox_client.dbx.files_move_v2(file.path_display, new_path)
-                            
-                            # Log the renamed file to the report logger
-                            self.report_logger.info(f"Renamed file: {file.path_display} -> {new_path}")
+                    # Create date prefix from original file's modified date
+                    date_prefix = file.server_modified.strftime('%y%m%d')
+                    new_name = f"{date_prefix} {file.name}"
+                    relocations.append((f"{dest_path}/{file.name}", f"{dest_path}/{new_name}"))
+
+            # Submit all renames as one batch job instead of one files_move_v2 call per file
+            if relocations:
+                self.logger.info(f"Renaming {len(relocations)} files in one batch")
+                self.report_logger.info(f"\nRenaming {len(relocations)} files in one batch")
+                move_results = dropbox_client.move_files_batch(relocations)
+                failed_moves = []
+                for move in move_results:
+                    if move['status'] == 'success':
+                        # Log the renamed file to the report logger
+                        self.report_logger.info(f"Renamed file: {move['from_path']} -> {move['to_path']}")
+                    else:
+                        failed_moves.append(move)
+                        self.logger.error(f"Failed to rename file: {move['from_path']} -> {move['to_path']}: {move['error']}")
+                        self.report_logger.error(f"Failed to rename file: {move['from_path']} -> {move['to_path']}: {move['error']}")
+                if failed_moves:
+                    self.report_logger.info(f"\n{len(failed_moves)} of {len(relocations)} renames failed")
+            else:
+                self.logger.info("No files need a date prefix")
+
+            # Keep the saved tree snapshot in step with the copy and renames
+            dropbox_client.save_tree_index()
 
             self.logger.info("Successfully completed prefix-dropbox-account-files operation")
             self.report_logger.info("\nSuccessfully completed prefix-dropbox-account-files operation")
@@ -445,7 +445,7 @@ class CommandRunner:
                         logging.info(f"Downloading file: {file.name}")
                         local_path = os.path.join(temp_dir, file.name)
                         self.logger.info(f"Downloading to: {local_path}")
-                        dropbox_client.dbx.files_download_to_file(local_path, file.path_display)
+                        dropbox_client.download_cache.copy_to(dropbox_client.dbx, file, local_path, request=dropbox_client._make_request)
                         
                         account_manager.navigate_back_to_account_page()
 
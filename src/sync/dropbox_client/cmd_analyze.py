@@ -26,6 +26,11 @@ from src.sync.dropbox_client.utils.file_utils import (
     read_account_folders,
     read_ignored_folders
 )
+from src.sync.dropbox_client.utils.sync_state import (
+    load_sync_state,
+    save_sync_state,
+    get_changed_account_names
+)
 
 # Configure logging
 logging.basicConfig(
@@ -258,6 +263,8 @@ def main():
                       help='Debug: Search for a specific folder recursively')
     parser.add_argument('--debug', action='store_true',
                       help='Show detailed folder processing information')
+    parser.add_argument('--incremental', action='store_true',
+                      help='Only analyze account folders changed since the last --incremental run')
     args = parser.parse_args()
     
     # Get absolute path of .env file
@@ -317,6 +324,31 @@ def main():
     # Read account folders based on options
     account_folders = None if args.show_all else read_account_folders(args.accounts_file)
     
+    # In incremental mode, restrict the analysis to folders changed since the saved cursor
+    incremental_cursor = None
+    clean_root = clean_dropbox_folder_name(root_folder)
+    if args.incremental and not args.analyze_path:
+        state = load_sync_state(clean_root, scope='cmd_analyze')
+        changed = None
+        if state.get('cursor'):
+            changed, incremental_cursor = get_changed_account_names(dbx, clean_root, state['cursor'])
+        if changed is None:
+            logger.info("No usable saved cursor, analyzing all folders")
+            try:
+                incremental_cursor = dbx.files_list_folder_get_latest_cursor(clean_root, recursive=True).cursor
+            except ApiError as e:
+                logger.error(f"Could not get latest cursor for {clean_root}: {str(e)}")
+        else:
+            changed_lower = {name.lower() for name in changed}
+            if account_folders is None:
+                account_folders = sorted(changed)
+            else:
+                account_folders = [folder for folder in account_folders if folder.lower() in changed_lower]
+            print(f"\nAccount folders changed since {state.get('updated_at')}: {len(account_folders)}")
+            if not account_folders:
+                save_sync_state(clean_root, incremental_cursor, scope='cmd_analyze')
+                return
+
     # Display account folders list when not using --show-all
     if account_folders and not args.show_all:
         print("\nDropbox Account folders:")
@@ -342,5 +374,8 @@ def main():
     # Display summary
     display_summary(counts, args.folders_only, ignored_folders, account_folders, args.show_all, args.debug, args.analyze_path, args.accounts_file)
 
+    if incremental_cursor:
+        save_sync_state(clean_root, incremental_cursor, scope='cmd_analyze')
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+
+"""
+Driver's License OCR Benchmark
+
+This script generates synthetic Florida-style driver's license images with known field
+values, runs the driver's license OCR pipeline over them and reports throughput, latency,
+Tesseract calls per image and field-level accuracy. Use it to check that OCR speed-ups
+do not cost accuracy.
+
+Example:
+    python -m src.sync.dropbox_client.cmd_dl_benchmark --count 50 --json-output data/dl_benchmark.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+import numpy as np
+import pytesseract
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from src.sync.dropbox_client.utils.dl_ocr import DOB_REGION, LICENSE_NUMBER_REGION, DriversLicenseOcr
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ('license_number', 'date_of_birth', 'sex', 'expiration_date')
+GROUND_TRUTH_FILE = 'ground_truth.json'
+CARD_SIZE = (1012, 638)
+FIRST_NAMES = ['MARIA', 'JOHN', 'LINDA', 'ROBERT', 'PATRICIA', 'JAMES', 'BARBARA', 'MICHAEL']
+LAST_NAMES = ['GARCIA', 'SMITH', 'JOHNSON', 'RODRIGUEZ', 'WILLIAMS', 'BROWN', 'MARTINEZ', 'DAVIS']
+
+
+def _load_font(size: int) -> ImageFont.ImageFont:
+    """Load a TrueType font, falling back to Pillow's built-in font."""
+    for name in ('DejaVuSans-Bold.ttf', 'DejaVuSans.ttf', 'Arial.ttf'):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def _random_date(rng: random.Random, start_year: int, end_year: int) -> str:
+    return f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/{rng.randint(start_year, end_year)}"
+
+
+def generate_license_fields(rng: random.Random) -> Dict[str, str]:
+    """
+    Generate the field values printed on one synthetic license.
+
+    Args:
+        rng: Random generator (seeded for a reproducible corpus)
+
+    Returns:
+        Dict[str, str]: Ground truth in the format returned by the OCR pipeline
+    """
+    last_name = rng.choice(LAST_NAMES)
+    digits = ''.join(str(rng.randint(0, 9)) for _ in range(12))
+    return {
+        'first_name': rng.choice(FIRST_NAMES),
+        'last_name': last_name,
+        'license_number': f"{last_name[0]}{digits[0:3]}-{digits[3:6]}-{digits[6:8]}-{digits[8:11]}-{digits[11]}",
+        'date_of_birth': _random_date(rng, 1935, 2004),
+        'sex': rng.choice(['M', 'F']),
+        'expiration_date': _random_date(rng, 2026, 2034),
+    }
+
+
+def render_license(fields: Dict[str, str], rng: random.Random, noise: float = 12.0,
+                   max_rotation: float = 2.0, max_blur: float = 1.2) -> Image.Image:
+    """
+    Render a Florida-style license card with the given fields.
+
+    The license number and DOB are placed inside LICENSE_NUMBER_REGION and DOB_REGION,
+    where the OCR pipeline crops them. Gaussian noise, a small rotation and blur are
+    applied so the images look like phone photos and scans.
+
+    Args:
+        fields: Field values from generate_license_fields
+        rng: Random generator
+        noise: Standard deviation of the pixel noise
+        max_rotation: Maximum rotation in degrees (either direction)
+        max_blur: Maximum Gaussian blur radius
+
+    Returns:
+        Image.Image: Grayscale license image
+    """
+    width, height = CARD_SIZE
+    card = Image.new('RGB', CARD_SIZE, (232, 240, 236))
+    draw = ImageDraw.Draw(card)
+    header_font, label_font, value_font, number_font = _load_font(44), _load_font(18), _load_font(26), _load_font(34)
+
+    # Header band and photo placeholder
+    draw.rectangle((0, 0, width, int(height * 0.09)), fill=(24, 84, 140))
+    draw.text((int(width * 0.04), int(height * 0.01)), 'FLORIDA', font=header_font, fill=(255, 255, 255))
+    draw.text((int(width * 0.55), int(height * 0.025)), 'DRIVER LICENSE', font=value_font, fill=(255, 255, 255))
+    draw.rectangle((int(width * 0.04), int(height * 0.22), int(width * 0.36), int(height * 0.82)), fill=(170, 175, 180))
+
+    # License number and DOB inside the regions the pipeline crops
+    left, top, _, _ = LICENSE_NUMBER_REGION
+    draw.text((int(width * (left - 0.07)), int(height * (top + 0.04))), 'DL', font=label_font, fill=(150, 20, 20))
+    draw.text((int(width * (left + 0.01)), int(height * (top + 0.02))), fields['license_number'], font=number_font, fill=(20, 20, 20))
+    left, top, _, _ = DOB_REGION
+    draw.text((int(width * (left + 0.01)), int(height * (top + 0.01))), f"DOB {fields['date_of_birth']}", font=value_font, fill=(20, 20, 20))
+
+    # Remaining fields below
+    column = int(width * 0.46)
+    draw.text((column, int(height * 0.44)), fields['last_name'], font=value_font, fill=(20, 20, 20))
+    draw.text((column, int(height * 0.50)), fields['first_name'], font=value_font, fill=(20, 20, 20))
+    draw.text((column, int(height * 0.58)), '123 MAIN ST', font=label_font, fill=(20, 20, 20))
+    draw.text((column, int(height * 0.62)), 'MIAMI, FL 33101', font=label_font, fill=(20, 20, 20))
+    draw.text((column, int(height * 0.70)), f"SEX {fields['sex']}", font=value_font, fill=(20, 20, 20))
+    draw.text((int(width * 0.66), int(height * 0.70)), f"EXP {fields['expiration_date']}", font=value_font, fill=(20, 20, 20))
+
+    image = card.convert('L')
+    angle = rng.uniform(-max_rotation, max_rotation)
+    image = image.rotate(angle, resample=Image.BICUBIC, fillcolor=235)
+    blur = rng.uniform(0, max_blur)
+    if blur > 0.1:
+        image = image.filter(ImageFilter.GaussianBlur(blur))
+    pixels = np.asarray(image, dtype=np.float32)
+    pixels += np.random.default_rng(rng.randint(0, 2 ** 31)).normal(0, noise, pixels.shape)
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+
+def build_corpus(corpus_dir: str, count: int, seed: int, regenerate: bool = False) -> List[Dict[str, Any]]:
+    """
+    Generate the benchmark images and ground truth, or reuse a corpus already on disk.
+
+    A saved corpus is reused only if it was generated with the same seed and has at least
+    ``count`` images (the first images of a larger corpus are the ones a smaller run would
+    generate).
+
+    Args:
+        corpus_dir: Directory holding the images and ground_truth.json
+        count: Number of images to generate
+        seed: Random seed
+        regenerate: Generate the images even if the corpus exists
+
+    Returns:
+        List[Dict[str, Any]]: One entry per image with 'file' and the expected fields
+    """
+    ground_truth_path = os.path.join(corpus_dir, GROUND_TRUTH_FILE)
+    if not regenerate and os.path.exists(ground_truth_path):
+        with open(ground_truth_path, 'r') as f:
+            saved = json.load(f)
+        # Corpora saved before the seed was recorded are a bare list of images
+        saved_seed = saved.get('seed') if isinstance(saved, dict) else None
+        corpus = saved.get('images', []) if isinstance(saved, dict) else saved
+        if saved_seed != seed:
+            logger.info(f"Existing corpus in {corpus_dir} was generated with seed {saved_seed}, regenerating with seed {seed}")
+        elif len(corpus) >= count:
+            logger.info(f"Using existing corpus of {len(corpus)} images in {corpus_dir}")
+            return corpus[:count]
+
+    os.makedirs(corpus_dir, exist_ok=True)
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        fields = generate_license_fields(rng)
+        file_name = f"license_{i:04d}.png"
+        render_license(fields, rng).save(os.path.join(corpus_dir, file_name))
+        corpus.append({'file': file_name, **fields})
+    with open(ground_truth_path, 'w') as f:
+        json.dump({'seed': seed, 'images': corpus}, f, indent=2)
+    logger.info(f"Generated {count} synthetic licenses in {corpus_dir}")
+    return corpus
+
+
+@contextmanager
+def count_tesseract_calls():
+    """Count pytesseract.image_to_string calls made inside the block."""
+    counter = {'calls': 0}
+    image_to_string = pytesseract.image_to_string
+
+    def counting_image_to_string(*args, **kwargs):
+        counter['calls'] += 1
+        return image_to_string(*args, **kwargs)
+
+    pytesseract.image_to_string = counting_image_to_string
+    try:
+        yield counter
+    finally:
+        pytesseract.image_to_string = image_to_string
+
+
+def run_benchmark(corpus_dir: str, corpus: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run the OCR pipeline over the corpus and collect timings and accuracy.
+
+    The uncached pipeline (``_ocr_dl_file``) is measured, so repeated runs are comparable.
+
+    Args:
+        corpus_dir: Directory holding the images
+        corpus: Entries from build_corpus
+
+    Returns:
+        Dict[str, Any]: Throughput, latency percentiles, Tesseract calls and per-field accuracy
+    """
+    ocr = DriversLicenseOcr()
+    latencies = []
+    tesseract_calls = []
+    correct = {field: 0 for field in FIELDS}
+    all_correct = 0
+    failures = []
+
+    for entry in corpus:
+        image_path = os.path.join(corpus_dir, entry['file'])
+        with count_tesseract_calls() as counter:
+            start_time = time.perf_counter()
+            try:
+                result = ocr._ocr_dl_file(image_path)
+            except Exception as e:
+                logger.error(f"OCR failed for {entry['file']}: {str(e)}")
+                result = {}
+            latencies.append(time.perf_counter() - start_time)
+        tesseract_calls.append(counter['calls'])
+
+        wrong = [field for field in FIELDS if result.get(field) != entry[field]]
+        for field in FIELDS:
+            if field not in wrong:
+                correct[field] += 1
+        if not wrong:
+            all_correct += 1
+        else:
+            failures.append({'file': entry['file'], 'fields': {field: [entry[field], result.get(field)] for field in wrong}})
+
+    total = len(corpus)
+    total_time = sum(latencies)
+    return {
+        'images': total,
+        'total_seconds': round(total_time, 3),
+        'images_per_second': round(total / total_time, 3) if total_time else 0.0,
+        'latency_p50_seconds': round(float(np.percentile(latencies, 50)), 3) if latencies else 0.0,
+        'latency_p95_seconds': round(float(np.percentile(latencies, 95)), 3) if latencies else 0.0,
+        'tesseract_calls_per_image': round(sum(tesseract_calls) / total, 2) if total else 0.0,
+        'tesseract_calls_max': max(tesseract_calls) if tesseract_calls else 0,
+        'field_accuracy': {field: round(correct[field] / total, 3) if total else 0.0 for field in FIELDS},
+        'all_fields_accuracy': round(all_correct / total, 3) if total else 0.0,
+        'failures': failures,
+    }
+
+
+def display_results(results: Dict[str, Any]) -> None:
+    """Print the benchmark summary."""
+    print("\n=== Driver's License OCR Benchmark ===")
+    print(f"Images:                 {results['images']}")
+    print(f"Throughput:             {results['images_per_second']} images/sec")
+    print(f"Latency p50 / p95:      {results['latency_p50_seconds']}s / {results['latency_p95_seconds']}s")
+    print(f"Tesseract calls/image:  {results['tesseract_calls_per_image']} (max {results['tesseract_calls_max']})")
+    print("Field accuracy:")
+    for field, accuracy in results['field_accuracy'].items():
+        print(f"  {field:<18} {accuracy:.1%}")
+    print(f"All fields correct:     {results['all_fields_accuracy']:.1%}")
+
+
+def main():
+    """Main function to benchmark driver's license OCR."""
+    parser = argparse.ArgumentParser(description='Benchmark driver\'s license OCR on synthetic licenses')
+    parser.add_argument('--corpus-dir', default=os.path.join(tempfile.gettempdir(), 'dl_benchmark_corpus'),
+                      help='Directory for the synthetic images and ground truth (default: <tmp>/dl_benchmark_corpus)')
+    parser.add_argument('--count', type=int, default=25,
+                      help='Number of synthetic licenses (default: 25)')
+    parser.add_argument('--seed', type=int, default=42,
+                      help='Random seed for the corpus (default: 42)')
+    parser.add_argument('--regenerate', action='store_true',
+                      help='Generate the corpus again even if it exists')
+    parser.add_argument('--json-output',
+                      help='Write the results, including per-image failures, to this JSON file')
+    parser.add_argument('--debug', action='store_true',
+                      help='Show the OCR pipeline\'s own logging')
+    args = parser.parse_args()
+
+    if not args.debug:
+        logging.getLogger('src.sync.dropbox_client.utils.dl_ocr').setLevel(logging.WARNING)
+
+    corpus = build_corpus(args.corpus_dir, args.count, args.seed, regenerate=args.regenerate)
+    results = run_benchmark(args.corpus_dir, corpus)
+    display_results(results)
+
+    if args.json_output:
+        output_dir = os.path.dirname(args.json_output)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(args.json_output, 'w') as f:
+            json.dump(results, f, indent=2)
+        logger.info(f"Saved benchmark results to {args.json_output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -39,6 +39,7 @@ from .utils.dropbox_utils import (
 )
 from .utils.path_utils import clean_dropbox_folder_name
 from .utils.date_utils import format_duration
+from .utils.request_executor import DropboxRequestExecutor
 
 def get_DATA_DIRECTORY(env_file):
     """Get the data directory from environment or prompt user."""
@@ -144,6 +145,40 @@ def display_summary(stats, total_time):
     for file in sorted(stats['renamed_files']):
         print(f"- {file}")
 
+def process_folder(dbx, entry, download_dir, executor):
+    """List one account folder and download its files with date-prefixed names."""
+    local_folder = os.path.join(download_dir, entry.name)
+    ensure_directory_exists(local_folder)
+    
+    # Log processed folder
+    log_processed_folder(entry.path_display, download_dir)
+    
+    # Process folder contents
+    folder_entries = list_dropbox_folder_contents(dbx, entry.path_display, request=executor.call)
+    for file_entry in folder_entries:
+        if isinstance(file_entry, dropbox.files.FileMetadata):
+            download_and_rename_file(dbx, file_entry.path_display, local_folder,
+                                     metadata=file_entry, request=executor.call)
+
+def select_folders(folders, allowed_folders, ignored_folders, process_all):
+    """Drop ignored and (unless --all) non-allowed folders, printing why each was skipped."""
+    selected = []
+    for entry in folders:
+        folder_name = entry.name
+        
+        # Skip ignored folders
+        if ignored_folders and folder_name in ignored_folders:
+            print(f"Skipping ignored folder: {folder_name}")
+            continue
+        
+        # Check if folder is allowed (only if not using --all)
+        if not process_all and allowed_folders and folder_name not in allowed_folders:
+            print(f"Skipping non-allowed folder: {folder_name}")
+            continue
+        
+        selected.append(entry)
+    return selected
+
 def main():
     """Main function to run the script."""
     parser = argparse.ArgumentParser(description='Download and rename files from Dropbox with date prefixes.')
@@ -155,6 +190,8 @@ def main():
                       help='Process folders in batches of specified size (0 for all at once)')
     parser.add_argument('--start-from', type=int, default=0,
                       help='Start processing from this folder index (0-based)')
+    parser.add_argument('--workers', type=int, default=None,
+                      help='Number of folders to list and download in parallel (default: DROPBOX_MAX_WORKERS)')
     
     args = parser.parse_args()
     
@@ -167,6 +204,7 @@ def main():
         
         # Initialize Dropbox client
         dbx = dropbox.Dropbox(access_token, timeout=30)
+        executor = DropboxRequestExecutor(max_workers=args.workers) if args.workers else DropboxRequestExecutor()
         
         # Get Dropbox folder
         dropbox_path = get_DROPBOX_FOLDER(args.env_file)
@@ -208,7 +246,7 @@ def main():
         
         # Process each folder
         start_time = datetime.datetime.now()
-        entries = list_dropbox_folder_contents(dbx, clean_path)
+        entries = list_dropbox_folder_contents(dbx, clean_path, request=executor.call)
         
         # Filter and sort folders
         folders = [entry for entry in entries if isinstance(entry, dropbox.files.FolderMetadata)]
@@ -229,31 +267,8 @@ def main():
                 batch = folders[i:i + args.batch_size]
                 print(f"\nProcessing batch {batch_num}/{total_batches} ({len(batch)} folders)")
                 
-                for entry in batch:
-                    folder_name = entry.name
-                    
-                    # Skip ignored folders
-                    if ignored_folders and folder_name in ignored_folders:
-                        print(f"Skipping ignored folder: {folder_name}")
-                        continue
-                    
-                    # Check if folder is allowed (only if not using --all)
-                    if not args.all and allowed_folders and folder_name not in allowed_folders:
-                        print(f"Skipping non-allowed folder: {folder_name}")
-                        continue
-                    
-                    # Create local folder
-                    local_folder = os.path.join(download_dir, folder_name)
-                    ensure_directory_exists(local_folder)
-                    
-                    # Log processed folder
-                    log_processed_folder(entry.path_display, download_dir)
-                    
-                    # Process folder contents
-                    folder_entries = list_dropbox_folder_contents(dbx, entry.path_display)
-                    for file_entry in folder_entries:
-                        if isinstance(file_entry, dropbox.files.FileMetadata):
-                            download_and_rename_file(dbx, file_entry.path_display, local_folder)
+                selected = select_folders(batch, allowed_folders, ignored_folders, args.all)
+                executor.run_all(lambda entry: process_folder(dbx, entry, download_dir, executor), selected)
                 
                 # Display intermediate summary
                 if batch_num < total_batches:
@@ -273,31 +288,9 @@ def main():
                             break
         else:
             # Process all folders at once
-            for entry in folders:
-                folder_name = entry.name
-                
-                # Skip ignored folders
-                if ignored_folders and folder_name in ignored_folders:
-                    print(f"Skipping ignored folder: {folder_name}")
-                    continue
-                
-                # Check if folder is allowed (only if not using --all)
-                if not args.all and allowed_folders and folder_name not in allowed_folders:
-                    print(f"Skipping non-allowed folder: {folder_name}")
-                    continue
-                
-                # Create local folder
-                local_folder = os.path.join(download_dir, folder_name)
-                ensure_directory_exists(local_folder)
-                
-                # Log processed folder
-                log_processed_folder(entry.path_display, download_dir)
-                
-                # Process folder contents
-                folder_entries = list_dropbox_folder_contents(dbx, entry.path_display)
-                for file_entry in folder_entries:
-                    if isinstance(file_entry, dropbox.files.FileMetadata):
-                        download_and_rename_file(dbx, file_entry.path_display, local_folder)
+            selected = select_folders(folders, allowed_folders, ignored_folders, args.all)
+            executor.run_all(lambda entry: process_folder(dbx, entry, download_dir, executor), selected)
+        executor.shutdown()
         
         # Calculate total time
         end_time = datetime.datetime.now()
@@ -0,0 +1,219 @@
+"""On-disk download cache keyed by Dropbox content_hash, with LRU size bound."""
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import uuid
+from typing import Callable, List, Optional, Tuple
+
+from dropbox.files import FileMetadata
+
+from src.config import DROPBOX_DOWNLOAD_CACHE_DIR, DROPBOX_DOWNLOAD_CACHE_MAX_MB
+
+logger = logging.getLogger(__name__)
+
+# Dropbox content_hash block size (see the Dropbox content hash reference)
+CONTENT_HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def compute_content_hash(file_path: str) -> str:
+    """
+    Compute the Dropbox content_hash of a local file.
+
+    The file is split into 4 MB blocks, each block is hashed with SHA-256, and the
+    concatenated block digests are hashed again.
+
+    Args:
+        file_path: Path to the local file
+
+    Returns:
+        str: Hex-encoded content hash
+    """
+    overall = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(CONTENT_HASH_BLOCK_SIZE)
+            if not block:
+                break
+            overall.update(hashlib.sha256(block).digest())
+    return overall.hexdigest()
+
+
+class DownloadCache:
+    """
+    Store downloaded Dropbox files once per content_hash.
+
+    Identical bytes are fetched from Dropbox only once across commands and runs. Each
+    hit refreshes the file's modification time. When the cache grows past ``max_bytes``,
+    the least recently used files are removed first. The cache size is kept as a running
+    total, so the cache directory is only scanned once and when eviction is needed.
+    """
+
+    def __init__(self, cache_dir: str = DROPBOX_DOWNLOAD_CACHE_DIR, max_bytes: int = DROPBOX_DOWNLOAD_CACHE_MAX_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path_for(self, content_hash: str, suffix: str = '') -> str:
+        """Return the cache path for a content hash (sharded by the first two characters)."""
+        return os.path.join(self.cache_dir, content_hash[:2], f"{content_hash}{suffix}")
+
+    def get(self, content_hash: str, suffix: str = '', size: Optional[int] = None) -> Optional[str]:
+        """
+        Look up a cached file and mark it as recently used.
+
+        Args:
+            content_hash: Dropbox content_hash of the file
+            suffix: File extension the cached copy was stored with
+            size: Expected size in bytes; a cached copy of another size was modified after
+                it was stored, so it is evicted and the lookup misses
+
+        Returns:
+            Optional[str]: Path to the cached file, or None on a miss
+        """
+        path = self.path_for(content_hash, suffix)
+        try:
+            cached_size = os.path.getsize(path)
+        except OSError:
+            return None
+        if size is not None and cached_size != size:
+            logger.warning(f"Cached file {path} is {cached_size} bytes instead of {size}, evicting it")
+            try:
+                os.unlink(path)
+                with self._lock:
+                    if self._total_bytes is not None:
+                        self._total_bytes -= cached_size
+            except OSError:
+                pass
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return path
+
+    def fetch(self, dbx, metadata: FileMetadata, request: Callable = None) -> str:
+        """
+        Return a local path holding the file's bytes, downloading only on a cache miss.
+
+        The returned file belongs to the cache. Callers must not delete or modify it;
+        use ``copy_to`` when a private copy is needed.
+
+        Args:
+            dbx: Dropbox client instance
+            metadata: FileMetadata of the file (must carry content_hash)
+            request: Optional wrapper used to issue API calls (e.g. DropboxClient._make_request)
+
+        Returns:
+            str: Path to the cached file
+        """
+        request = request or (lambda func, *args, **kwargs: func(*args, **kwargs))
+        suffix = os.path.splitext(metadata.name)[1].lower()
+        content_hash = metadata.content_hash
+        cached_path = self.get(content_hash, suffix, size=metadata.size) if content_hash else None
+        if cached_path:
+            self.hits += 1
+            logger.info(f"Download cache hit for {metadata.path_display}")
+            return cached_path
+
+        self.misses += 1
+        if not content_hash:
+            # Nothing to key on: download to a unique path that is never hit again; it
+            # counts against the LRU budget and is evicted like any other file
+            content_hash = f"nohash-{uuid.uuid4().hex}"
+        target_path = self.path_for(content_hash, suffix)
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        partial_path = f"{target_path}.{uuid.uuid4().hex}.part"
+        try:
+            request(dbx.files_download_to_file, partial_path, metadata.path_display)
+            if metadata.content_hash and compute_content_hash(partial_path) != metadata.content_hash:
+                raise ValueError(f"Content hash mismatch for downloaded file {metadata.path_display}")
+            os.replace(partial_path, target_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.unlink(partial_path)
+        logger.info(f"Downloaded {metadata.path_display} into cache ({metadata.size} bytes)")
+        self.evict(added_bytes=os.path.getsize(target_path))
+        return target_path
+
+    def copy_to(self, dbx, metadata: FileMetadata, local_path: str, request: Callable = None) -> str:
+        """
+        Place the file's bytes at ``local_path``, downloading only on a cache miss.
+
+        ``local_path`` is a separate copy, not a link to the cached file, so the caller or
+        the user may edit, delete or rename it without changing the cache.
+
+        Args:
+            dbx: Dropbox client instance
+            metadata: FileMetadata of the file
+            local_path: Destination path
+            request: Optional wrapper used to issue API calls
+
+        Returns:
+            str: ``local_path``
+        """
+        cached_path = self.fetch(dbx, metadata, request=request)
+        if os.path.exists(local_path):
+            os.unlink(local_path)
+        shutil.copyfile(cached_path, local_path)
+        return local_path
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """Return (mtime, size, path) for every cached file."""
+        files = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith('.part'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def evict(self, added_bytes: int = 0) -> None:
+        """
+        Remove least recently used files until the cache fits within max_bytes.
+
+        Args:
+            added_bytes: Size of the file just added to the cache
+        """
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._total_bytes += added_bytes
+            if self._total_bytes <= self.max_bytes:
+                return
+            # Rescan before evicting: the running total may have drifted (e.g. another run)
+            files = sorted(self._scan())
+            total = sum(size for _, size, _ in files)
+            for _, size, path in files:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                    total -= size
+                    logger.debug(f"Evicted {path} from download cache")
+                except OSError:
+                    continue
+            self._total_bytes = total
+
+
+_download_cache: Optional[DownloadCache] = None
+
+
+def get_download_cache() -> DownloadCache:
+    """Return the process-wide download cache, creating it on first use."""
+    global _download_cache
+    if _download_cache is None:
+        _download_cache = DownloadCache()
+    return _download_cache
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import multiprocessing
 import dropbox
 from dropbox.exceptions import ApiError
 from dropbox.files import FileMetadata
@@ -12,6 +13,7 @@ import pdf2image
 import pytesseract
 from PIL import Image
 import tempfile
+import time
 import PyPDF2
 import logging
 import urllib.parse
@@ -23,11 +25,22 @@ from PIL import ImageEnhance
 import numpy as np
 import cv2
 import difflib
+from concurrent.futures import ProcessPoolExecutor
 
 from .date_utils import has_date_prefix, get_folder_creation_date
 from .path_utils import clean_dropbox_folder_name
 from .file_utils import log_renamed_file
-from src.config import DROPBOX_FOLDER, ACCOUNT_INFO_PATTERN, DRIVERS_LICENSE_PATTERN, DROPBOX_HOLIDAY_FOLDER, DROPBOX_SALESFORCE_FOLDER, DROPBOX_HOLIDAY_FILE
+from .tree_index import DropboxTreeIndex, normalize_index_path
+from .metadata_cache import DropboxMetadataCache
+from .request_executor import DropboxRequestExecutor
+from .download_cache import compute_content_hash, get_download_cache
+from .workbook_cache import ParsedWorkbook, get_workbook_cache
+from .holiday_search import HolidaySearchMixin, match_accounts_in_sheet
+from .dl_ocr import DriversLicenseOcrMixin
+from .flatfile_writer import FlatFileWriter
+from .ocr_cache import OcrResultCache
+from .ocr_service import DlOcrService
+from src.config import DROPBOX_FOLDER, ACCOUNT_INFO_PATTERN, DRIVERS_LICENSE_PATTERN, DROPBOX_HOLIDAY_FOLDER, DROPBOX_SALESFORCE_FOLDER, DROPBOX_HOLIDAY_FILE, DROPBOX_METADATA_CACHE_DB, DL_OCR_DEBUG, DL_OCR_TIMEOUT
 
 # Configure logging
 # Get the logger for this module
@@ -67,7 +80,7 @@ def construct_dropbox_path(account_folder: str, root_folder: str) -> Optional[st
         logging.error(f"Error constructing Dropbox folder: {str(e)}")
         return None
 
-class DropboxClient:
+class DropboxClient(HolidaySearchMixin, DriversLicenseOcrMixin):
     def __init__(self, token: str, debug_mode: bool = False):
         self.token = token
         self.debug_mode = debug_mode
@@ -124,6 +137,30 @@ class DropboxClient:
         if debug_mode:
             logging.info("Debug mode is enabled")
 
+        # Rate-limited executor shared by every API call made through _make_request
+        self.request_executor = DropboxRequestExecutor()
+        # Folder listings fetched ahead of the account loop
+        self.folder_listings: Dict[str, List[FileMetadata]] = {}
+        # Downloads are shared across commands and runs through the content-addressed cache
+        self.download_cache = get_download_cache()
+        self.workbook_cache = get_workbook_cache()
+        # Parsed driver's license fields keyed by file content hash
+        self.ocr_cache = OcrResultCache()
+        # Write OCR debug images and raw text to the temp dir
+        self.ocr_debug = DL_OCR_DEBUG
+        # Background OCR pool; when set, prefetch submits driver's licenses to it
+        self.ocr_service: Optional[DlOcrService] = None
+
+        # Snapshot of the whole account tree, built lazily on first lookup
+        self.use_tree_index = True
+        self.tree_index: Optional[DropboxTreeIndex] = None
+        self.metadata_cache: Optional[DropboxMetadataCache] = None
+        if DROPBOX_METADATA_CACHE_DB:
+            try:
+                self.metadata_cache = DropboxMetadataCache(DROPBOX_METADATA_CACHE_DB)
+            except Exception as e:
+                logger.warning(f"Dropbox metadata cache disabled: {str(e)}")
+
     def _handle_token_expiration(self):
         """Handle token expiration by refreshing the token."""
         try:
@@ -140,6 +177,9 @@ class DropboxClient:
         """
         Make a request to Dropbox API with automatic token refresh.
         
+        The call goes through the shared request executor, which throttles it and
+        retries rate-limit and transient network errors.
+        
         Args:
             func: The Dropbox API function to call
             *args: Arguments to pass to the function
@@ -149,9 +189,11 @@ class DropboxClient:
             The result of the API call
         """
         try:
-            return func(*args, **kwargs)
+            return self.request_executor.call(func, *args, **kwargs)
         except ApiError as e:
-            if e.error.is_expired_access_token():
+            # Only auth errors have is_expired_access_token (e.g. ListFolderContinueError does not)
+            is_expired = getattr(e.error, 'is_expired_access_token', None)
+            if is_expired is not None and is_expired():
                 logger.info("Access token expired, attempting to refresh...")
                 if self._handle_token_expiration():
                     # Retry the request with the new token
@@ -184,10 +226,218 @@ class DropboxClient:
         return files_to_process
             
 
+    def get_tree_index(self, refresh: bool = False) -> Optional[DropboxTreeIndex]:
+        """
+        Get the snapshot index of the root folder, building it on first use.
+        
+        A snapshot saved in the metadata cache is always brought up to date from its
+        cursor before use, so only the changes since it was saved are fetched. The
+        tree is only listed from scratch when there is no usable snapshot.
+        
+        Args:
+            refresh: If True, rebuild the index even if one already exists
+            
+        Returns:
+            Optional[DropboxTreeIndex]: The index, or None if disabled or the listing failed
+        """
+        if not self.use_tree_index:
+            return None
+        if self.tree_index is None or refresh:
+            index = None
+            if self.metadata_cache and not refresh:
+                index = self.metadata_cache.load_index(self.root_folder)
+                # Never serve a saved snapshot unchecked: another run or user may have changed the tree
+                if index and index.update(self.dbx, self._make_request) is None:
+                    index = None
+                elif index:
+                    self.metadata_cache.save_index(index)
+            if index is None:
+                index = DropboxTreeIndex(self.root_folder)
+                if not index.build(self.dbx, self._make_request):
+                    return None
+                if self.metadata_cache:
+                    self.metadata_cache.save_index(index)
+            self.tree_index = index
+        return self.tree_index
+
+    def record_changes(self, entries: List[Any] = (), stale_folder: Optional[str] = None) -> None:
+        """
+        Apply changes the run made in Dropbox to the tree index.
+        
+        Args:
+            entries: Metadata returned by the change (DeletedMetadata for removed paths)
+            stale_folder: Folder whose contents changed in ways the entries do not describe
+                (e.g. the destination of a folder copy); it is listed from the API until the
+                index is next updated from its cursor
+        """
+        if not self.tree_index or not self.tree_index.is_built():
+            return
+        self.tree_index.apply_entries(list(entries))
+        if stale_folder:
+            self.tree_index.mark_stale(stale_folder)
+
+    def save_tree_index(self) -> bool:
+        """
+        Save the tree index to the metadata cache after the run changed Dropbox.
+        
+        Returns:
+            bool: True if the snapshot was saved, False otherwise
+        """
+        if not self.metadata_cache or not self.tree_index or not self.tree_index.is_built():
+            return False
+        return self.metadata_cache.save_index(self.tree_index)
+
+    def get_root_cursor(self) -> Optional[str]:
+        """
+        Get a recursive list_folder cursor for the root folder.
+        
+        Reuses the cursor of the tree index when one has been built, so the
+        snapshot and the saved cursor describe the same state.
+        
+        Returns:
+            Optional[str]: The cursor, or None if it could not be retrieved
+        """
+        if self.tree_index and self.tree_index.is_built():
+            return self.tree_index.cursor
+        try:
+            result = self._make_request(self.dbx.files_list_folder_get_latest_cursor, self.root_folder, recursive=True)
+            return result.cursor
+        except Exception as e:
+            logger.error(f"Error getting latest cursor for {self.root_folder}: {str(e)}")
+            return None
+
+    def list_folder(self, path: str) -> List[FileMetadata]:
+        """
+        List a folder, answering from the tree index when it covers the path.
+        
+        Args:
+            path: Dropbox folder path
+            
+        Returns:
+            List[FileMetadata]: Folder contents
+        """
+        index = self.get_tree_index()
+        if index:
+            entries = index.list_folder(path)
+            if entries is not None:
+                return entries
+        listing = self.folder_listings.get(normalize_index_path(path))
+        if listing is not None:
+            return listing
+        return list_dropbox_folder_contents(self.dbx, path, request=self._make_request)
+
+    def prefetch_account_folders(self, account_folders: List[str], download_drivers_licenses: bool = False) -> None:
+        """
+        List account folders and download driver's license files concurrently.
+        
+        Runs ahead of the per-account loop on the request executor's thread pool, so
+        the loop reads listings and local files instead of waiting on Dropbox.
+        Folders already covered by the tree index are not listed again.
+        
+        Args:
+            account_folders: Account folder names to prefetch
+            download_drivers_licenses: If True, also download each account's driver's license
+                (and submit it to the background OCR service, if one is set)
+        """
+        start_time = datetime.now()
+
+        def prefetch(account_folder):
+            dropbox_path = construct_dropbox_path(account_folder, self.root_folder)
+            if not dropbox_path:
+                return None
+            index = self.get_tree_index()
+            if not index or index.list_folder(dropbox_path) is None:
+                self.folder_listings[normalize_index_path(dropbox_path)] = list_dropbox_folder_contents(
+                    self.dbx, dropbox_path, request=self._make_request)
+            if download_drivers_licenses:
+                dl_file = self.get_drivers_license_file(account_folder)
+                # A file whose content was OCRed before is neither downloaded nor OCRed again
+                if dl_file and self.ocr_cache.get(dl_file.content_hash) is None:
+                    # Warm the download cache; the account loop then reads the local copy
+                    dl_path = self.download_cache.fetch(self.dbx, dl_file, request=self._make_request)
+                    # Start OCR now so it runs while the loop works on earlier accounts
+                    if self.ocr_service:
+                        self.ocr_service.submit(account_folder, dl_path, dl_file.content_hash)
+            return dropbox_path
+
+        # Build the tree index once up front so workers don't race to build it
+        self.get_tree_index()
+        results = self.request_executor.run_all(prefetch, account_folders)
+        failed = [item for item, _, error in results if error]
+        logger.info(f"Prefetched {len(account_folders) - len(failed)} of {len(account_folders)} account folders "
+                    f"with {self.request_executor.max_workers} workers in {datetime.now() - start_time}")
+        if failed:
+            logger.warning(f"Prefetch failed for: {failed}")
+
+    def move_files_batch(self, relocations: List[Tuple[str, str]], poll_interval: float = 0.5,
+                         max_poll_interval: float = 5.0, timeout: float = 300.0) -> List[Dict[str, Any]]:
+        """
+        Move or rename many files with files_move_batch_v2 and wait for the job to finish.
+        
+        Args:
+            relocations: (from_path, to_path) pairs
+            poll_interval: Initial delay between files_move_batch_check_v2 polls, in seconds
+            max_poll_interval: Upper bound for the polling delay, in seconds
+            timeout: Maximum time to wait for one batch job, in seconds
+            
+        Returns:
+            List[Dict[str, Any]]: One entry per relocation, in input order, with keys
+            'from_path', 'to_path', 'status' ('success' or 'failed') and 'error'
+        """
+        results = []
+        # files_move_batch_v2 accepts up to 1,000 entries per call
+        chunk_size = 1000
+        for start in range(0, len(relocations), chunk_size):
+            chunk = relocations[start:start + chunk_size]
+            entries = [dropbox.files.RelocationPath(from_path=from_path, to_path=to_path) for from_path, to_path in chunk]
+            batch_result = None
+            error = None
+            try:
+                launch = self._make_request(self.dbx.files_move_batch_v2, entries, autorename=False)
+                if launch.is_complete():
+                    batch_result = launch.get_complete()
+                else:
+                    job_id = launch.get_async_job_id()
+                    logger.info(f"Submitted move batch job {job_id} with {len(chunk)} entries")
+                    waited = 0.0
+                    delay = poll_interval
+                    while waited < timeout:
+                        time.sleep(delay)
+                        waited += delay
+                        status = self._make_request(self.dbx.files_move_batch_check_v2, job_id)
+                        if status.is_complete():
+                            batch_result = status.get_complete()
+                            break
+                        delay = min(delay * 2, max_poll_interval)
+                    else:
+                        error = f"Batch job {job_id} did not finish within {timeout:.0f} seconds"
+            except Exception as e:
+                error = str(e)
+
+            for index, (from_path, to_path) in enumerate(chunk):
+                entry = {'from_path': from_path, 'to_path': to_path, 'status': 'failed', 'error': error}
+                if batch_result is not None and index < len(batch_result.entries):
+                    entry_result = batch_result.entries[index]
+                    if entry_result.is_success():
+                        entry['status'] = 'success'
+                        entry['error'] = None
+                        moved = entry_result.get_success()
+                        self.record_changes([
+                            dropbox.files.DeletedMetadata(name=from_path.rsplit('/', 1)[-1], path_lower=from_path.lower()),
+                            moved,
+                        ])
+                    else:
+                        entry['error'] = str(entry_result.get_failure())
+                results.append(entry)
+
+        failed = sum(1 for entry in results if entry['status'] != 'success')
+        logger.info(f"Moved {len(results) - failed} of {len(results)} files in batch ({failed} failed)")
+        return results
+
     def get_dropbox_account_names(self) -> List[str]:
         """Get all account folders under the root folder."""
         try:
-            entries = list_dropbox_folder_contents(self.dbx, self.root_folder)
+            entries = self.list_folder(self.root_folder)
             result = [entry.name for entry in entries if isinstance(entry, dropbox.files.FolderMetadata)]            
             return result
         except Exception as e:
@@ -198,7 +448,7 @@ class DropboxClient:
         """Get all files under the account folder."""
         try:
             dropbox_path = construct_dropbox_path(account_folder, self.root_folder)
-            return list_dropbox_folder_contents(self.dbx, dropbox_path)
+            return self.list_folder(dropbox_path)
         except Exception as e:
             print(f"Error getting account files: {e}")
             return []
@@ -239,271 +489,165 @@ class DropboxClient:
             return None
         
     
-
-    def _clean_cell_value(self, value: str) -> str:
-        """Clean cell value by removing parenthetical content and extra whitespace."""
-        if pd.isna(value):
-            return ''
-        # Convert to string and remove anything after and including '('
-        cleaned = str(value).split('(')[0].strip()
-        # if cleaned != value: 
-        #     logging.info(f"Cleaned cell value: {cleaned} original: {value}")
-        return cleaned
-    
-    def _check_row_for_sequential_words(self, row_values: List[str], expected_words: List[str]) -> bool:
-        """
-        Check if a sequence of words appears in order across row values.
-            
-        Args:
-            row_values: List of cell values from a row
-            expected_words: List of words to find in sequence
-                
-        Returns:
-            bool: True if all words are found in sequence, False otherwise
-        """
-        word_index = 0
-        for cell_value in row_values:
-            if word_index < len(expected_words):
-                if expected_words[word_index] in cell_value:
-                    word_index += 1
-                    if word_index == len(expected_words):
-                        return True
-        return False
-
-    def search_rows_for_sequential_word_matches(self, df: pd.DataFrame, expected_words: List[str]) -> pd.DataFrame:
-        """
-        Search through DataFrame rows for a sequence of words appearing in order.
-        
-        Args:
-            df: DataFrame to search in
-            expected_words: List of words to find in sequence
-            
-        Returns:
-            pd.DataFrame: DataFrame containing the first matching row, or empty DataFrame if no match found
-        """
-        for _, row in df.iterrows():
-            # Convert row to list of lowercase strings
-            row_values = [str(val).lower() for val in row.values]
-            # logger.info(f"  row_values: {row_values}")
-            
-            if self._check_row_for_sequential_words(row_values, expected_words):
-                logger.info(f"  Found sequence match in row: {row_values}")
-                return pd.DataFrame([row])
-        
-        return pd.DataFrame()
-
-    def _update_match_status(self, dropbox_account_info: Dict[str, Any], match_type: str, match_name: str, expected_matches: List[str], account_name: str) -> None:
+    def _attach_drivers_license_info(self, dropbox_account_info: Dict[str, Any], account_name: str) -> None:
         """
-        Update the match status in the account info dictionary.
+        Extract driver's license information for an account when the --dl flag is set.
         
         Args:
             dropbox_account_info: Dictionary containing account info and search results
-            match_type: Type of match found ('expected', 'normalized', or 'swapped')
-            match_name: The name that was matched
-            expected_matches: List of expected matches to validate against
-            account_name: Name of the account being searched
+            account_name: Name of the account folder
         """
-        if match_type == 'expected':
-            logger.info(f"Found expected Dropbox matches for {account_name}")
-            dropbox_account_info['search_info']['status'] = 'found'
-            dropbox_account_info['search_info']['match_info']['match_status'] = "Match found in expected matches"
-        else:
-            if len(expected_matches) > 0:
-                logger.warning(f"Found {match_type} name match {match_name} but not in expected matches [{expected_matches}] for {account_name}")
-                dropbox_account_info['search_info']['status'] = 'unexpected_matches'
-                dropbox_account_info['search_info']['match_info']['match_status'] = f"Match found in {match_type} names but not in expected matches"
+        if hasattr(self, 'args') and getattr(self.args, 'dl', False):
+            logger.info(f"\n=== Getting driver's license information for {account_name} ===")
+            dl_file = self.get_drivers_license_file(account_name)
+            if dl_file:
+                logger.info(f"Found driver's license file: {dl_file.name}")
+                dropbox_account_info['drivers_license_info']['status'] = 'found'
+                dropbox_account_info['drivers_license_info']['file_path'] = dl_file.path_display
+                try:
+                    # A file with the same content was OCRed before: skip the download and OCR
+                    dl_info = self.ocr_cache.get(dl_file.content_hash)
+                    if dl_info is not None:
+                        logger.info(f"Using cached OCR result for {dl_file.path_display}")
+                    elif self.ocr_service and self.ocr_service.is_pending(account_name):
+                        # OCR was started during prefetch: wait for the worker's result
+                        logger.info(f"Waiting for background OCR of {dl_file.path_display}")
+                        content_hash, dl_info = self.ocr_service.result(account_name, timeout=DL_OCR_TIMEOUT)
+                        if dl_info is None:
+                            dl_info = {}
+                        else:
+                            self.ocr_cache.put(content_hash, dl_info)
+                    else:
+                        # Get the driver's license from the download cache (downloads on a miss)
+                        dl_path = self.download_cache.fetch(self.dbx, dl_file, request=self._make_request)
+                        logger.info(f"Driver's license available at: {dl_path}")
+                        # Always use _extract_dl_info for both PDF and image files
+                        dl_info = self._extract_dl_info(dl_path)
+                    if dl_info:
+                        dropbox_account_info['drivers_license'] = dl_info
+                        logger.info(f"Successfully extracted driver's license information: {dl_info}")
+                    else:
+                        logger.warning("No information could be extracted from driver's license")
+                        dropbox_account_info['drivers_license_info']['status'] = 'extraction_failed'
+                        dropbox_account_info['drivers_license_info']['reason'] = 'No information could be extracted from the file'
+                except Exception as e:
+                    logger.error(f"Error processing driver's license: {str(e)}")
+                    dropbox_account_info['drivers_license_info']['status'] = 'processing_error'
+                    dropbox_account_info['drivers_license_info']['reason'] = f'Error processing file: {str(e)}'
+                    dropbox_account_info['drivers_license_info']['extraction_errors'].append(str(e))
             else:
-                dropbox_account_info['search_info']['status'] = 'found'
-                dropbox_account_info['search_info']['match_info']['match_status'] = f"Match found in {match_type} names"
+                logger.info("No driver's license file found")
+                dropbox_account_info['drivers_license_info']['status'] = 'not_found'
+                dropbox_account_info['drivers_license_info']['reason'] = 'No driver\'s license file found in the account folder'
+        else:
+            logger.info("Skipping driver's license processing (--dl flag not set)")
 
-    def _store_matching_rows(self, dropbox_account_info: Dict[str, Any], matching_rows: pd.DataFrame, sheet_name: str, last_name: str) -> None:
+    def _finalize_dropbox_account_info(self, dropbox_account_info: Dict[str, Any]) -> None:
         """
-        Store matching rows in the account info dictionary and handle multiple matches.
+        Merge driver's license information into account_data and log it to report.log.
         
         Args:
             dropbox_account_info: Dictionary containing account info and search results
-            matching_rows: DataFrame containing matching rows
-            sheet_name: Name of the sheet being searched
-            last_name: Last name being searched for
         """
-        # Store all matching rows for reference
-        dropbox_account_info['search_info']['matches'] = [
-            {f"Column {i}": self._clean_cell_value(str(val)) for i, val in enumerate(row) 
-             if str(val).lower() != 'nan' and not pd.isna(val)}
-            for _, row in matching_rows.iterrows()
-        ]
-        
-        # If we have multiple matches but none in expected matches, log warning
-        if len(matching_rows) > 1 and dropbox_account_info['search_info']['status'] == 'unexpected_matches':
-            logger.warning(f"Found multiple {len(matching_rows)} matches in {sheet_name} for last name: {last_name}")
-            dropbox_account_info['search_info']['status'] = 'multiple_matches'
-
-    def _split_words(self, text: str) -> List[str]:
-        """
-        Split text into words while removing commas and parentheses.
-        
-        Args:
-            text (str): The text to split
-            
-        Returns:
-            List[str]: List of cleaned words
-        """
-        # Remove parentheses and their contents
-        text = re.sub(r'\([^)]*\)', '', text)
-        # Replace comma with space to handle cases with no space after comma
-        text = text.replace(',', ' ')
-        # Split on whitespace and filter out empty strings
-        return [word.strip() for word in text.split() if word.strip()]
-
-    def _is_family_pattern_match(self, row_values: List[str], last_name: str) -> bool:
-        """
-        Check if a row matches the pattern of 'last_name Family' or 'Family last_name'.
-        
-        Args:
-            row_values: List of cell values from a row
-            last_name: The last name to check for
-            
-        Returns:
-            bool: True if the row matches the family pattern, False otherwise
-        """
-        # Convert all values to lowercase strings and clean them
-        cleaned_values = [self._clean_cell_value(str(val)).lower() for val in row_values]
-        
-        # Look for the pattern in consecutive cells
-        for i in range(len(cleaned_values) - 1):
-            # Check for "last_name Family" pattern
-            if cleaned_values[i] == last_name.lower() and cleaned_values[i + 1] == 'family':
-                return True
-            # Check for "Family last_name" pattern
-            if cleaned_values[i] == 'family' and cleaned_values[i + 1] == last_name.lower():
-                return True
-        return False
-
-    def _search_for_matches(self, df: pd.DataFrame, names_to_search: List[str], match_type: str, 
-                          dropbox_account_info: Dict[str, Any], expected_matches: List[str], 
-                          account_name: str, sheet_name: str) -> Tuple[pd.DataFrame, bool, str, pd.Series]:
-        """
-        Search for matches of a specific type in the DataFrame.
-        
-        Args:
-            df: DataFrame to search in
-            names_to_search: List of names to search for
-            match_type: Type of match ('expected', 'normalized', or 'swapped')
-            dropbox_account_info: Dictionary containing account info and search results
-            expected_matches: List of expected matches to validate against
-            account_name: Name of the account being searched
-            sheet_name: Name of the sheet being searched
-            
-        Returns:
-            Tuple containing:
-            - DataFrame with matching rows (empty if no match)
-            - Whether a match was found
-            - Name of the sheet where match was found
-            - The matching row (None if no match)
-        """
-        logger.info(f"\n=== Starting {match_type} name search in sheet: {sheet_name} ===")
-        logger.info(f"Searching for {len(names_to_search)} {match_type} names")
-        
-        # Get the last name from the account info
-        last_name = dropbox_account_info['name_parts'].get('last_name', '').lower()
-        logger.info(f"Using last name: {last_name}")
-        
-        # Initialize match_found to False
-        match_found = False
-        
-        # First check for family pattern matches
-        logger.info("Checking for family pattern matches...")
-        for _, row in df.iterrows():
-            row_values = [str(val) for val in row.values]
-            if self._is_family_pattern_match(row_values, last_name):
-                logger.info(f"  ✓ Found family pattern match in row: {row_values}")
-                match_found = True
-                self._update_match_status(dropbox_account_info, 'family_pattern', f"{last_name} Family", expected_matches, account_name)
-                logger.info(f"  ✓ Updated match status for family pattern match")
-                return pd.DataFrame([row]), match_found, sheet_name, row
-        
-        logger.info("No family pattern matches found, proceeding with name search...")
-        
-        # If no family pattern match, continue with normal search
-        for name in names_to_search:
-            logger.info(f"\n  Checking {match_type} name: {name}")
-            expected_words = self._split_words(name.lower())
-            logger.info(f"  Split into words: {expected_words}")
-            
-            match_found = False
-            matching_rows = self.search_rows_for_sequential_word_matches(df, expected_words)
-            if not matching_rows.empty:
-                logger.info(f"  ✓ Found {len(matching_rows)} matching rows for name: {name}")
-                account_row = matching_rows.iloc[0]
-                match_found = True
-                self._update_match_status(dropbox_account_info, match_type, name, expected_matches, account_name)
-                logger.info(f"  ✓ Updated match status for {match_type} match")
-                return matching_rows, match_found, sheet_name, account_row
-            else:
-                logger.info(f"  ✗ No matches found for name: {name}")
-
-        
-        logger.info(f"=== No {match_type} matches found in sheet: {sheet_name} ===\n")
-        return pd.DataFrame(), False, "", None
+        # Merge driver's license info into account_data if present
+        if dropbox_account_info['drivers_license']:
+            dropbox_account_info['account_data']['drivers_license'] = dropbox_account_info['drivers_license']
+            logger.info(f"DEBUG: driver's_license info: {dropbox_account_info['drivers_license']}")
+        else:
+            logger.info("DEBUG: No driver's_license info extracted.")
 
-    def _search_for_matches_in_matching_rows(self, matching_rows: pd.DataFrame, names_to_search: List[str], match_type: str, 
-                                           dropbox_account_info: Dict[str, Any], expected_matches: List[str], 
-                                           account_name: str, sheet_name: str) -> Tuple[pd.DataFrame, bool, str, pd.Series]:
-        """
-        Search for matches of a specific type in pre-filtered matching rows.
+        # Log driver's license information to report.log
+        report_logger = logging.getLogger('report')
+        if hasattr(self, 'args') and getattr(self.args, 'dl', False):
+            if dropbox_account_info['drivers_license_info']['status'] == 'found':
+                if dropbox_account_info['drivers_license']:
+                    report_logger.info("\n📄 **Driver's License Information**")
+                    report_logger.info(f"   + Status: Found and extracted")
+                    report_logger.info(f"   + File: {dropbox_account_info['drivers_license_info']['file_path']}")
+                    for key, value in dropbox_account_info['drivers_license'].items():
+                        report_logger.info(f"   + {key}: {value}")
+                else:
+                    report_logger.info("\n📄 **Driver's License Information**")
+                    report_logger.info(f"   + Status: Found but no information extracted")
+                    report_logger.info(f"   + File: {dropbox_account_info['drivers_license_info']['file_path']}")
+            else:
+                report_logger.info("\n📄 **Driver's License Information**")
+                report_logger.info(f"   + Status: {dropbox_account_info['drivers_license_info']['status']}")
+                if dropbox_account_info['drivers_license_info']['reason']:
+                    report_logger.info(f"   + Reason: {dropbox_account_info['drivers_license_info']['reason']}")
+                if dropbox_account_info['drivers_license_info']['extraction_errors']:
+                    report_logger.info("   + Errors:")
+                    for error in dropbox_account_info['drivers_license_info']['extraction_errors']:
+                        report_logger.info(f"     - {error}")
+
+    def dropbox_search_accounts(self, accounts: List[Tuple[str, Dict[str, Any]]], excel_file: ParsedWorkbook,
+                                max_workers: int = None) -> Dict[str, Dict[str, Any]]:
+        """Get account information from the holiday Excel file for many accounts at once.
+        
+        Every sheet is searched for all accounts in one pass, one sheet per worker process,
+        and the first sheet (in workbook order) that matched each account is used, exactly as
+        dropbox_search_account does. Driver's license extraction and reporting then run per
+        account. Because the spreadsheet work no longer depends on the Salesforce session, it
+        can be done before the account loop starts.
         
         Args:
-            matching_rows: DataFrame containing pre-filtered matching rows
-            names_to_search: List of names to search for
-            match_type: Type of match ('expected', 'normalized', or 'swapped')
-            dropbox_account_info: Dictionary containing account info and search results
-            expected_matches: List of expected matches to validate against
-            account_name: Name of the account being searched
-            sheet_name: Name of the sheet being searched
-            
+            accounts (List[Tuple[str, Dict[str, Any]]]): (account_name, name_parts) pairs as
+                produced by extract_name_parts
+            excel_file (ParsedWorkbook): The parsed workbook to search in
+            max_workers (int, optional): Maximum number of worker processes (default: one per
+                sheet, capped by the CPU count); 1 searches in this process
+                
         Returns:
-            Tuple containing:
-            - DataFrame with matching rows (empty if no match)
-            - Whether a match was found
-            - Name of the sheet where match was found
-            - The matching row (None if no match)
+            Dict[str, Dict[str, Any]]: dropbox_search_account results keyed by account name
         """
-        logger.info(f"\n=== Searching for {match_type} names in matching rows: {names_to_search} ===")
-        
-        # Get the last name from the account info
-        last_name = dropbox_account_info['name_parts'].get('last_name', '').lower()
-        
-        # First check for family pattern matches
-        for _, row in matching_rows.iterrows():
-            row_values = [str(val) for val in row.values]
-            if self._is_family_pattern_match(row_values, last_name):
-                logger.info(f"  Found family pattern match in row: {row_values}")
-                match_found = True
-                self._update_match_status(dropbox_account_info, 'family_pattern', f"{last_name} Family", expected_matches, account_name)
-                return pd.DataFrame([row]), match_found, sheet_name, row
-        
-        # If no family pattern match, continue with normal search
-        for name in names_to_search:
-            logger.info(f"  {match_type}_name: {name}")
-            expected_words = self._split_words(name.lower())
-            logger.info(f"*expected_words {expected_words}")
-            
-            # Search through each matching row
-            for _, row in matching_rows.iterrows():
-                # Convert row to list of lowercase strings
-                row_values = [str(val).lower() for val in row.values]
-                
-                # Check if this row contains the expected words in sequence
-                if self._check_row_for_sequential_words(row_values, expected_words):
-                    logger.info(f"  ***Found matching row with {match_type} name: {name}")
-                    account_row = row
-                    match_found = True
-                    self._update_match_status(dropbox_account_info, match_type, name, expected_matches, account_name)
-                    return pd.DataFrame([row]), match_found, sheet_name, account_row
-        
-        return pd.DataFrame(), False, "", None
+        if not isinstance(excel_file, ParsedWorkbook):
+            return {account_name: self.dropbox_search_account(account_name, name_parts, excel_file)
+                    for account_name, name_parts in accounts}
+
+        start_time = time.time()
+        sheets = excel_file.sheet_names
+        sheet_results = {}
+        workers = min(len(sheets), max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            try:
+                # Spawn rather than fork: request executor and Playwright threads are running by now,
+                # and a forked child could inherit a lock one of them holds
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+                    futures = {
+                        sheet_name: pool.submit(match_accounts_in_sheet, sheet_name, excel_file.parse(sheet_name), accounts)
+                        for sheet_name in sheets
+                    }
+                    sheet_results = {sheet_name: future.result() for sheet_name, future in futures.items()}
+            except Exception as e:
+                logger.warning(f"Parallel holiday workbook search failed, searching sheets in this process: {str(e)}")
+                sheet_results = {}
+        for sheet_name in sheets:
+            if sheet_name not in sheet_results:
+                sheet_results[sheet_name] = match_accounts_in_sheet(sheet_name, excel_file.parse(sheet_name), accounts)
+        logger.info(f"Searched {len(sheets)} sheets for {len(accounts)} accounts in {time.time() - start_time:.2f} seconds")
+
+        results = {}
+        for position, (account_name, dropbox_account_name_parts) in enumerate(accounts):
+            logger.info(f"\n=== Starting Dropbox account info search for: {account_name} ===")
+            dropbox_account_info = self._new_dropbox_account_info(dropbox_account_name_parts)
+            try:
+                self._attach_drivers_license_info(dropbox_account_info, account_name)
+                for sheet_name in sheets:
+                    match_found, search_info, account_row = sheet_results[sheet_name][position]
+                    if match_found:
+                        dropbox_account_info['search_info'] = search_info
+                        self._extract_holiday_account_data(dropbox_account_info, sheet_name, account_row)
+                        break
+                if not dropbox_account_info['account_data']:
+                    self._log_holiday_no_match(dropbox_account_info, account_name, excel_file)
+                self._finalize_dropbox_account_info(dropbox_account_info)
+            except Exception as e:
+                logger.error(f"Error getting account info for {account_name}: {str(e)}")
+                logger.error("Stack trace:", exc_info=True)
+            results[account_name] = dropbox_account_info
+        return results
 
-    def dropbox_search_account(self, account_name: str, dropbox_account_name_parts: Dict[str, Any], excel_file: pd.ExcelFile = None) -> Dict[str, Any]:
+    def dropbox_search_account(self, account_name: str, dropbox_account_name_parts: Dict[str, Any], excel_file: ParsedWorkbook = None) -> Dict[str, Any]:
         """Get account information from the holiday Excel file.
         
         This method:
@@ -526,7 +670,7 @@ class DropboxClient:
                 - normalized_names (List[str]): List of normalized name variations
                 - swapped_names (List[str]): List of name variations with swapped first/last
                 - expected_dropbox_matches (List[str]): List of expected matches for validation
-            excel_file (pd.ExcelFile, optional): The Excel file object to search in. If not provided, will return empty results.
+            excel_file (ParsedWorkbook, optional): The parsed workbook (or pd.ExcelFile) to search in. If not provided, will return empty results.
                 
         Returns:
             Dict[str, Any]: Dictionary containing:
@@ -542,69 +686,11 @@ class DropboxClient:
         folder_name = account_name
         
         # Initialize result structure
-        dropbox_account_info = {
-            'name_parts': dropbox_account_name_parts,
-            'search_info': {
-                'status': 'not_found',
-                'matches': [],
-                'search_attempts': [],
-                'timing': {},
-                'match_info': {
-                    'match_status': "No match found",
-                    'total_matches': 0,
-                    'total_partial_matches': 0,
-                    'total_no_matches': 1
-                }
-            },
-            'account_data': {},
-            'drivers_license': {},
-            'drivers_license_info': {
-                'status': 'not_found',
-                'reason': None,
-                'file_path': None,
-                'extraction_errors': []
-            }
-        }
+        dropbox_account_info = self._new_dropbox_account_info(dropbox_account_name_parts)
 
         try:
             # First, try to get driver's license information only if --dl flag is set
-            if hasattr(self, 'args') and getattr(self.args, 'dl', False):
-                logger.info(f"\n=== Getting driver's license information for {account_name} ===")
-                dl_file = self.get_drivers_license_file(account_name)
-                if dl_file:
-                    logger.info(f"Found driver's license file: {dl_file.name}")
-                    dropbox_account_info['drivers_license_info']['status'] = 'found'
-                    dropbox_account_info['drivers_license_info']['file_path'] = dl_file.path_display
-                    try:
-                        # Create a temporary file with the correct extension
-                        file_ext = os.path.splitext(dl_file.name)[1].lower()
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-                            temp_path = temp_file.name
-                            # Download the driver's license file
-                            self.dbx.files_download_to_file(temp_path, dl_file.path_display)
-                            logger.info(f"Downloaded driver's license to: {temp_path}")
-                            # Always use _extract_dl_info for both PDF and image files
-                            dl_info = self._extract_dl_info(temp_path)
-                            if dl_info:
-                                dropbox_account_info['drivers_license'] = dl_info
-                                logger.info(f"Successfully extracted driver's license information: {dl_info}")
-                            else:
-                                logger.warning("No information could be extracted from driver's license")
-                                dropbox_account_info['drivers_license_info']['status'] = 'extraction_failed'
-                                dropbox_account_info['drivers_license_info']['reason'] = 'No information could be extracted from the file'
-                            # Clean up the temporary file
-                            os.unlink(temp_path)
-                    except Exception as e:
-                        logger.error(f"Error processing driver's license: {str(e)}")
-                        dropbox_account_info['drivers_license_info']['status'] = 'processing_error'
-                        dropbox_account_info['drivers_license_info']['reason'] = f'Error processing file: {str(e)}'
-                        dropbox_account_info['drivers_license_info']['extraction_errors'].append(str(e))
-                else:
-                    logger.info("No driver's license file found")
-                    dropbox_account_info['drivers_license_info']['status'] = 'not_found'
-                    dropbox_account_info['drivers_license_info']['reason'] = 'No driver\'s license file found in the account folder'
-            else:
-                logger.info("Skipping driver's license processing (--dl flag not set)")
+            self._attach_drivers_license_info(dropbox_account_info, account_name)
 
             # Log search parameters
             logger.info("Search parameters:")
@@ -626,279 +712,43 @@ class DropboxClient:
                 account_row = None
                 match_found = False
                 match_sheet = None
-                sheet_search_info = []  # Store search info for each sheet
 
                 # Use the last_name directly from dropbox_account_name_parts
                 last_name = dropbox_account_name_parts.get('last_name', '').lower()
-                expected_matches = dropbox_account_name_parts.get('expected_dropbox_matches', [])
                 
                 logger.info(f"Using last name from dropbox_account_name_parts: {last_name}")
                 
                 # Search through each sheet
                 for sheet_name in sheets:
                     logger.info(f"\nSearching in sheet: {sheet_name}")
-                    df = pd.read_excel(excel_file, sheet_name=sheet_name)
+                    df = excel_file.parse(sheet_name)
                     logger.info(f"Sheet dimensions: {df.shape[0]} rows x {df.shape[1]} columns")
+                    # Row index built once per workbook (only available for a ParsedWorkbook)
+                    sheet_index = excel_file.get_sheet_index(sheet_name) if isinstance(excel_file, ParsedWorkbook) else None
 
-                    # Search for the last name in any column
-                    logger.info(f"Searching for last name: {last_name} in any column of sheet: {sheet_name}")
-                    # Convert all columns to string, clean values, and handle NaN values
-                    df_str = df.astype(str).apply(lambda x: x.apply(self._clean_cell_value).str.lower())
-                    # Create a mask for rows containing the last name
-                    mask = df_str.apply(lambda row: any(last_name in str(cell) for cell in row), axis=1)
-                    # Get all matching rows
-                    original_matching_rows = df[mask]
-                    matching_rows = original_matching_rows
-                    logger.info(f"Found last name in rows... {last_name} in {len(matching_rows)} rows")
-                    logger.info(f"Found {len(matching_rows)} matching rows for last name {last_name} in sheet: {sheet_name}")
-                    if not matching_rows.empty:
-                        logger.info("Matching rows found:")
-                        for _, row in matching_rows.iterrows():
-                            row_values = [str(val) for val in row.values if not pd.isna(val)]
-                            logger.info(f"  - {row_values}")
-                    
-                    if not matching_rows.empty:
-                        # If we have exactly one matching row for the last name, consider it a valid match
-                        if len(matching_rows) == 1 and not match_found:
-                            logger.info(f"Found exactly one matching row for last name {last_name} in sheet: {sheet_name}")
-                            account_row = matching_rows.iloc[0]
-                            match_found = True
-                            match_sheet = sheet_name
-                            self._update_match_status(dropbox_account_info, 'exact_last_name', last_name, expected_matches, account_name)
-                            logger.info(f"  ✓ Updated match status for exact last name match")
-                            break
-
-                        # Search for expected matches
-                        matching_rows, match_found, match_sheet, account_row = self._search_for_matches_in_matching_rows(
-                            matching_rows, expected_matches, 'expected',
-                            dropbox_account_info, expected_matches, account_name, sheet_name
-                        )
-                        if match_found:
-                            break
-                        # Search for normalized names
-                        matching_rows, match_found, match_sheet, account_row = self._search_for_matches_in_matching_rows(
-                            matching_rows, dropbox_account_name_parts.get('normalized_names', []), 'normalized',
-                            dropbox_account_info, expected_matches, account_name, sheet_name
-                        )
-                        if match_found:
-                            break
-
-                        # Search for swapped names
-                        matching_rows, match_found, match_sheet, account_row = self._search_for_matches_in_matching_rows(
-                            matching_rows, dropbox_account_name_parts.get('swapped_names', []), 'swapped',
-                            dropbox_account_info, expected_matches, account_name, sheet_name
-                        )
-                        if match_found:
-                            break
-
-                        # If we found rows with last name but no match in expected_dropbox_matches, log warning
-                        if expected_matches and not match_found:
-                            logger.warning(f"\n=== WARNING: Found rows with last name '{last_name}' but expected_dropbox_matches not working ===")
-                            logger.warning(f"Account: {account_name}")
-                            logger.warning(f"Sheet: {sheet_name}")
-                            logger.warning(f"*Expected matches: {expected_matches}")
-                            logger.warning("Matching rows found:")
-                            row_values_list = []
-                            for _, row in original_matching_rows.iterrows():
-                                row_values = [str(val) for val in row.values if not pd.isna(val)]
-                                logger.warning(f"  - {row_values}")
-                                row_values_list.append(row_values)
-                            if len(row_values_list) > 0:
-                                logger.warning(f"\n=== WARNING: Found rows with last name '{last_name}' expected_dropbox_matches: {expected_matches} row_values_list: {row_values_list} ===")
-
-                            logger.warning("=== END WARNING ===\n")
-
-                    if matching_rows.empty:
-                        logger.info(f"No matching rows found for last name: {last_name} in sheet: {sheet_name}, doing more sophisticated search...")
-
-                        # Search for expected matches
-                        logger.info(f"Searching for expected matches: {expected_matches}")
-                        matching_rows, match_found, match_sheet, account_row = self._search_for_matches(
-                            df, expected_matches, 'expected',
-                            dropbox_account_info, expected_matches, account_name, sheet_name
-                        )
-                        if match_found:
-                            break
-                            
-                        logger.info(f"Searching for reversed expected matches: {expected_matches}")
-                        reversed_expected_matches = []
-                        for name in expected_matches:
-                            logger.info(f"name: {name}")
-                            reversed_name_list = self._split_words(name)[::-1]
-                            reversed_name = ' '.join(reversed_name_list)
-                            logger.info(f"reversed_name: {reversed_name}")
-                            reversed_expected_matches.append(reversed_name)
-                        logger.info(f"reversed_expected_matches: {reversed_expected_matches}")
-
-                        matching_rows, match_found, match_sheet, account_row = self._search_for_matches(
-                            df, reversed_expected_matches, 'expected',
-                            dropbox_account_info, expected_matches, account_name, sheet_name
-                        )
-                        if match_found:
-                            break
-
-                        # Search for swapped names
-                        logger.info(f"Searching for swapped names: {dropbox_account_name_parts.get('swapped_names', [])}")
-                        matching_rows, match_found, match_sheet, account_row = self._search_for_matches(
-                            df, dropbox_account_name_parts.get('swapped_names', []), 'swapped',
-                            dropbox_account_info, expected_matches, account_name, sheet_name
-                        )
-                        if match_found:
-                            break
-
-                        # Search for normalized names
-                        logger.info(f"Searching for normalized names: {dropbox_account_name_parts.get('normalized_names', [])}")
-                        matching_rows, match_found, match_sheet, account_row = self._search_for_matches(
-                            df, dropbox_account_name_parts.get('normalized_names', []), 'normalized',
-                            dropbox_account_info, expected_matches, account_name, sheet_name
-                        )
-                        if match_found:
-                            break
+                    matching_rows, match_found, match_sheet, account_row = self._search_holiday_sheet(
+                        df, sheet_name, dropbox_account_info, account_name, sheet_index
+                    )
+                    if match_found:
+                        break
 
-                        
                     # Store matching rows and handle multiple matches
                     if not matching_rows.empty:
                         self._store_matching_rows(dropbox_account_info, matching_rows, sheet_name, last_name)
 
                 # Extract data if match found
                 if match_found and account_row is not None:
-                    logger.info(f"\nExtracting data from {match_sheet} sheet")
-                    if match_sheet == "Client full info":
-                        # Extract data from specific columns in "Client full info" sheet
-                        dropbox_account_info['account_data'] = {
-                            'name': f"{account_row.iloc[0]} {account_row.iloc[1]}",  # First name + Last name
-                            'first_name': str(account_row.iloc[0]),
-                            'last_name': str(account_row.iloc[1]),
-                            'address': str(account_row.iloc[3]),  # Column D
-                            'city': str(account_row.iloc[6]),     # Column G
-                            'state': str(account_row.iloc[7]),    # Column H
-                            'zip': str(account_row.iloc[8])       # Column I
-                        }
-                        if dropbox_account_info['drivers_license']:
-                            dropbox_account_info['account_data']['drivers_license'] = dropbox_account_info['drivers_license']
-                        # Update match status
-                        dropbox_account_info['search_info']['status'] = 'found'
-                        dropbox_account_info['search_info']['match_info']['match_status'] = "Match found"
-                        dropbox_account_info['search_info']['match_info']['total_matches'] = 1
-                        dropbox_account_info['search_info']['match_info']['total_no_matches'] = 0
-                    elif match_sheet == "Client Mailing List":
-                        # Extract data from Client Mailing List sheet using row values directly
-                        row_values = [str(val) if not pd.isna(val) else '' for val in account_row.values]
-                        logger.info(f"row_values: {row_values}")
-                        dropbox_account_info['account_data'] = {
-                            'name': f"{row_values[2]} {row_values[1]}".strip(),  # First name + Last name
-                            'first_name': row_values[2],
-                            'last_name': row_values[1],
-                            'address': row_values[3],
-                            'city': row_values[5],
-                            'state': row_values[6],
-                            'zip': row_values[7],
-                            'email': row_values[11],
-                            'phone': row_values[10]
-                        }
-
-                        if dropbox_account_info['drivers_license']:
-                            dropbox_account_info['account_data']['drivers_license'] = dropbox_account_info['drivers_license']
-                        # Update match status
-                        dropbox_account_info['search_info']['status'] = 'found'
-                        dropbox_account_info['search_info']['match_info']['match_status'] = "Match found"
-                        dropbox_account_info['search_info']['match_info']['total_matches'] = 1
-                        dropbox_account_info['search_info']['match_info']['total_no_matches'] = 0
-                    else:
-                        # Extract data from standard sheet format
-                        dropbox_account_info['account_data'] = {
-                            'name': str(account_row.get('Name', '')),
-                            'first_name': str(account_row.get('First Name', '')),
-                            'last_name': str(account_row.get('Last Name', '')),
-                            'address': str(account_row.get('Address', '')),
-                            'city': str(account_row.get('City', '')),
-                            'state': str(account_row.get('State', '')),
-                            'zip': str(account_row.get('Zip', '')),
-                            'email': str(account_row.get('Email', '')),
-                            'phone': str(account_row.get('Phone', '')) if 'Phone' in account_row else ''
-                        }
-                        if dropbox_account_info['drivers_license']:
-                            dropbox_account_info['account_data']['drivers_license'] = dropbox_account_info['drivers_license']
-                        # Update match status
-                        dropbox_account_info['search_info']['status'] = 'found'
-                        dropbox_account_info['search_info']['match_info']['match_status'] = "Match found"
-                        dropbox_account_info['search_info']['match_info']['total_matches'] = 1
-                        dropbox_account_info['search_info']['match_info']['total_no_matches'] = 0
+                    self._extract_holiday_account_data(dropbox_account_info, match_sheet, account_row)
 
                 # If no match found, log detailed explanation
                 if not dropbox_account_info['account_data']:
-                    # Log to analyzer.log
-                    logger.info("\n*=== DROPBOX SEARCH - NO MATCH EXPLANATION ===")
-                    logger.info(f"Account: {account_name}")
-                    logger.info(f"Last name searched: {dropbox_account_name_parts.get('last_name', '')}")
-                    logger.info(f"Normalized names: {dropbox_account_name_parts.get('normalized_names', [])}")
-                    logger.info(f"**Expected matches: {dropbox_account_name_parts.get('expected_dropbox_matches', [])}")
-                    logger.info(f"Found matches: {dropbox_account_info['search_info']['matches']}")
-                    logger.info("\nSearch process:")
-                    for sheet_name in sheets:
-                        df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                        logger.info(f"\nSheet: {sheet_name}")
-                        logger.info(f"  - Dimensions: {df.shape[0]} rows x {df.shape[1]} columns")
-                        # logger.info(f"  - Columns: {list(df.columns)}")
-                        # logger.info(f"  - First row values: {[str(val) for val in df.iloc[0].values]}")
-                        logger.info(f"  - Search method: Searched for last name '{last_name}' in all columns")
-                        # Search for the last name in this sheet
-                        df_str = df.astype(str).apply(lambda x: x.apply(self._clean_cell_value).str.lower())
-                        mask = df_str.apply(lambda row: any(last_name in str(cell) for cell in row), axis=1)
-                        matching_rows = df[mask]
-                        if not matching_rows.empty:
-                            logger.info(f"  - Found {len(matching_rows)} matching rows:")
-                            for _, row in matching_rows.iterrows():
-                                row_values = [str(val) for val in row.values if not pd.isna(val)]
-                                logger.info(f"    * {row_values}")
-                        else:
-                            logger.info(f"  - Result: No matches found")
-                    logger.info("=== END NO MATCH EXPLANATION ===\n")
-
-                    # Log to report.log (without the detailed search process)
-                    report_logger = logging.getLogger('report')
-                    report_logger.info("\n=== DROPBOX SEARCH - NO MATCH EXPLANATION ===")
-                    report_logger.info(f"Account: {account_name}")
-                    report_logger.info(f"Last name searched: {dropbox_account_name_parts.get('last_name', '')}")
-                    report_logger.info(f"Normalized names: {dropbox_account_name_parts.get('normalized_names', [])}")
-                    report_logger.info(f"***Expected matches: {dropbox_account_name_parts.get('expected_dropbox_matches', [])}")
-                    report_logger.info(f"Found matches: {dropbox_account_info['search_info']['matches']}")
-                    report_logger.info("=== END NO MATCH EXPLANATION ===\n")
+                    self._log_holiday_no_match(dropbox_account_info, account_name, excel_file)
 
             finally:
                 # No need to clean up temporary file since we're using the excel_file object directly
                 pass
             
-            # Merge driver's license info into account_data if present
-            if dropbox_account_info['drivers_license']:
-                dropbox_account_info['account_data']['drivers_license'] = dropbox_account_info['drivers_license']
-                logger.info(f"DEBUG: driver's_license info: {dropbox_account_info['drivers_license']}")
-            else:
-                logger.info("DEBUG: No driver's_license info extracted.")
-            
-            # Log driver's license information to report.log
-            report_logger = logging.getLogger('report')
-            if hasattr(self, 'args') and getattr(self.args, 'dl', False):
-                if dropbox_account_info['drivers_license_info']['status'] == 'found':
-                    if dropbox_account_info['drivers_license']:
-                        report_logger.info("\n📄 **Driver's License Information**")
-                        report_logger.info(f"   + Status: Found and extracted")
-                        report_logger.info(f"   + File: {dropbox_account_info['drivers_license_info']['file_path']}")
-                        for key, value in dropbox_account_info['drivers_license'].items():
-                            report_logger.info(f"   + {key}: {value}")
-                    else:
-                        report_logger.info("\n📄 **Driver's License Information**")
-                        report_logger.info(f"   + Status: Found but no information extracted")
-                        report_logger.info(f"   + File: {dropbox_account_info['drivers_license_info']['file_path']}")
-                else:
-                    report_logger.info("\n📄 **Driver's License Information**")
-                    report_logger.info(f"   + Status: {dropbox_account_info['drivers_license_info']['status']}")
-                    if dropbox_account_info['drivers_license_info']['reason']:
-                        report_logger.info(f"   + Reason: {dropbox_account_info['drivers_license_info']['reason']}")
-                    if dropbox_account_info['drivers_license_info']['extraction_errors']:
-                        report_logger.info("   + Errors:")
-                        for error in dropbox_account_info['drivers_license_info']['extraction_errors']:
-                            report_logger.info(f"     - {error}")
+            self._finalize_dropbox_account_info(dropbox_account_info)
             
             return dropbox_account_info
             
@@ -1014,7 +864,10 @@ class DropboxClient:
 
     def get_account_info_file(self, account_folder: str) -> Optional[FileMetadata]:
         """Get the account info file (*App.pdf) for an account."""
-        files = self.list_folder_contents(account_folder)
+        dropbox_path = construct_dropbox_path(account_folder, self.root_folder)
+        if not dropbox_path:
+            return None
+        files = self.list_folder(dropbox_path)
         pattern = ACCOUNT_INFO_PATTERN.replace('*', '.*')
         for file in files:
             if re.match(pattern, file.name):
@@ -1029,7 +882,7 @@ class DropboxClient:
                 logger.error(f"Invalid path constructed for account folder: {account_folder}")
                 return None
                 
-            files = list_dropbox_folder_contents(self.dbx, dropbox_path)
+            files = self.list_folder(dropbox_path)
             logger.info(f"Files found in {dropbox_path}:")
             for file in files:
                 if isinstance(file, FileMetadata):
@@ -1062,365 +915,30 @@ class DropboxClient:
             logger.error(f"Error getting driver's license file: {str(e)}")
             return None
 
-    def _extract_text_from_pdf(self, pdf_path: str) -> str:
+    def _extract_dl_info(self, image_path: str) -> Dict[str, str]:
         """
-        Try to extract text directly from PDF first, fall back to OCR if needed.
+        Extract driver's license fields from an image or PDF.
+        
+        Results are cached by file content hash and OCR pipeline version, so a file that
+        was processed before is not OCRed again.
+        
+        Args:
+            image_path (str): Path to the driver's license file
+            
+        Returns:
+            Dict[str, str]: Extracted fields (license_number, date_of_birth, sex, expiration_date)
         """
-        try:
-            logging.info(f"Attempting to extract text from PDF: {pdf_path}")
-            # First try direct text extraction
-            with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text()
-                
-                # If we got meaningful text, return it
-                if text.strip():
-                    logging.info("Successfully extracted text directly from PDF")
-                    return text
-
-            logging.info("Direct text extraction failed, attempting OCR")
-            # If direct extraction didn't work, try OCR
-            images = pdf2image.convert_from_path(pdf_path)
-            text = ""
-            for image in images:
-                text += pytesseract.image_to_string(image)
-            logging.info("Completed OCR text extraction")
-            return text
-
-        except Exception as e:
-            logging.error(f"Error extracting text from PDF: {e}")
-            return ""
-
-    def _extract_dl_info(self, image_path: str) -> Dict[str, str]:
         try:
             if not os.path.exists(image_path):
                 logger.error(f"Driver's license file not found: {image_path}")
                 return {}
-            _, ext = os.path.splitext(image_path)
-            ext = ext.lower()
-            text = ''
-            debug_image_saved = False
-
-            def binarize(image, threshold=160):
-                # Convert to grayscale if not already
-                if image.mode != 'L':
-                    image = image.convert('L')
-                # Apply adaptive thresholding
-                return image.point(lambda p: 255 if p > threshold else 0)
-
-            def preprocess_image(image, save_debug=True, crop_band=None, use_opencv=True):
-                # Convert to grayscale if not already
-                if image.mode != 'L':
-                    image = image.convert('L')
-                
-                # Optionally crop to a horizontal band
-                if crop_band is not None:
-                    width, height = image.size
-                    band_height = height // 3
-                    top = band_height * crop_band
-                    bottom = top + band_height
-                    image = image.crop((0, top, width, bottom))
-                    logger.info(f"Cropped image to band {crop_band}: (0, {top}, {width}, {bottom})")
-                
-                # Convert to OpenCV image for advanced processing
-                if use_opencv:
-                    img_np = np.array(image)
-                    # Denoise
-                    img_np = cv2.fastNlMeansDenoising(img_np, None, 30, 7, 21)
-                    # Adaptive thresholding
-                    img_np = cv2.adaptiveThreshold(img_np, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 11)
-                    # Deskew (optional, only if needed)
-                    def deskew(img):
-                        coords = np.column_stack(np.where(img > 0))
-                        angle = 0.0
-                        if coords.shape[0] > 0:
-                            rect = cv2.minAreaRect(coords)
-                            angle = rect[-1]
-                            if angle < -45:
-                                angle = -(90 + angle)
-                            else:
-                                angle = -angle
-                        (h, w) = img.shape[:2]
-                        center = (w // 2, h // 2)
-                        M = cv2.getRotationMatrix2D(center, angle, 1.0)
-                        img = cv2.warpAffine(img, M, (w, h), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE)
-                        return img
-                    img_np = deskew(img_np)
-                    image = Image.fromarray(img_np)
-                else:
-                    # Enhance contrast
-                    image = ImageEnhance.Contrast(image).enhance(2.0)
-                    # Enhance sharpness
-                    image = ImageEnhance.Sharpness(image).enhance(2.0)
-                    # Apply binarization
-                    image = binarize(image)
-                
-                # Save debug image
-                if save_debug:
-                    debug_path = os.path.join(tempfile.gettempdir(), f'debug_dl_preprocessed_band{crop_band if crop_band is not None else "full"}.png')
-                    image.save(debug_path, 'PNG')
-                    logger.info(f"Saved preprocessed debug image: {debug_path}")
-                
-                return image
-
-            def try_psm_modes(image, image_path=None):
-                import io
-                logger.info("Entered try_psm_modes")
-                best_text = ''
-                best_mode = ''
-                psm_modes = [6, 3, 11, 7, 12]
-                
-                # Enhanced OCR configurations (removed config with single quote)
-                configs = [
-                    lambda psm: f'--psm {psm} --oem 3',
-                    lambda psm: f'--psm {psm} --oem 3 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789- ',
-                    lambda psm: f'--psm {psm} --oem 3 -c tessedit_char_whitelist=0123456789- '
-                ]
-
-                logger.info(f"Running OCR on image: {image_path if image_path else '<in-memory>'}, mode={image.mode}, size={image.size}")
-                
-                # Save image for debugging
-                debug_path = os.path.join(tempfile.gettempdir(), 'debug_dl_ocr_input.png')
-                image.save(debug_path, 'PNG')
-                logger.info(f"Saved OCR input image: {debug_path}")
-
-                all_ocr_outputs = []
-                for psm in psm_modes:
-                    for config_fn in configs:
-                        config = config_fn(psm)
-                        try:
-                            logger.info(f"Calling pytesseract with config: {config}")
-                            ocr_text = pytesseract.image_to_string(image, config=config)
-                            logger.info(f"OCR output for PSM {psm} ({config}): {repr(ocr_text)}")
-                            all_ocr_outputs.append((config, ocr_text))
-                            # Validate license number format
-                            if re.search(r'[A-Z]\d{3}-\d{3}-\d{2}-\d{3}-\d', ocr_text):
-                                logger.info(f"Found valid license number format in PSM {psm}")
-                                # Save raw OCR output for manual inspection
-                                raw_ocr_path = os.path.join(tempfile.gettempdir(), 'debug_dl_raw_ocr.txt')
-                                with open(raw_ocr_path, 'w') as f:
-                                    f.write(ocr_text)
-                                logger.info(f"Saved raw OCR output: {raw_ocr_path}")
-                                return ocr_text
-                            if len(ocr_text.strip()) > len(best_text.strip()):
-                                best_text = ocr_text
-                                best_mode = f'psm {psm} {config}'
-                        except Exception as ocr_exc:
-                            logger.error(f"Tesseract error for config {config}: {ocr_exc}")
-                # Save the best raw OCR output for manual inspection
-                raw_ocr_path = os.path.join(tempfile.gettempdir(), 'debug_dl_raw_ocr.txt')
-                with open(raw_ocr_path, 'w') as f:
-                    for config, ocr_text in all_ocr_outputs:
-                        f.write(f'Config: {config}\n{ocr_text}\n---\n')
-                logger.info(f"Saved all raw OCR outputs: {raw_ocr_path}")
-                logger.info(f"Best OCR mode: {best_mode}")
-                logger.info("Exiting try_psm_modes")
-                return best_text
-
-            def crop_license_number_region(image):
-                width, height = image.size
-                # These values are tuned for typical Florida DL images
-                left = int(width * 0.45)
-                top = int(height * 0.10)
-                right = int(width * 0.95)
-                bottom = int(height * 0.25)
-                cropped = image.crop((left, top, right, bottom))
-                logger.info(f"Cropped license number region: ({left}, {top}, {right}, {bottom})")
-                # Save debug crop
-                debug_path = os.path.join(tempfile.gettempdir(), 'debug_dl_license_number_crop.png')
-                cropped.save(debug_path, 'PNG')
-                logger.info(f"Saved cropped license number region: {debug_path}")
-                return cropped
-
-            def crop_dob_region(image):
-                width, height = image.size
-                # These values are tuned for typical Florida DL images (DOB is mid-right)
-                left = int(width * 0.45)
-                top = int(height * 0.32)
-                right = int(width * 0.80)
-                bottom = int(height * 0.40)
-                cropped = image.crop((left, top, right, bottom))
-                logger.info(f"Cropped DOB region: ({left}, {top}, {right}, {bottom})")
-                # Save debug crop
-                debug_path = os.path.join(tempfile.gettempdir(), 'debug_dl_dob_crop.png')
-                cropped.save(debug_path, 'PNG')
-                logger.info(f"Saved cropped DOB region: {debug_path}")
-                return cropped
-
-            if ext == '.pdf':
-                try:
-                    text = self._extract_text_from_pdf(image_path)
-                    if not text.strip():
-                        logger.info("Direct text extraction failed, attempting OCR")
-                        images = pdf2image.convert_from_path(
-                            image_path,
-                            dpi=600,  # Higher DPI for better quality
-                            grayscale=True,
-                            thread_count=4
-                        )
-                        logger.info(f"Extracted {len(images)} image(s) from PDF for OCR.")
-                        if not images:
-                            logger.error("Failed to convert PDF to images")
-                            return {}
-                        
-                        all_text = []
-                        found_license = False
-                        for i, image in enumerate(images):
-                            logger.debug(f"Processing page {i+1} of {len(images)}; mode={image.mode}, size={image.size}")
-                            # Try all three horizontal bands
-                            for band in [0, 1, 2]:
-                                band_image = preprocess_image(image, save_debug=(i == 0 and band == 1), crop_band=band)
-                                ocr_text = try_psm_modes(band_image, image_path=image_path)
-                                if ocr_text.strip():
-                                    all_text.append(ocr_text)
-                                    logger.debug(f"Extracted text from page {i+1}, band {band}: {ocr_text}")
-                                    # If a valid license number is found, use this band
-                                    if re.search(r'[A-Z]\d{3}-\d{3}-\d{2}-\d{3}-\d', ocr_text):
-                                        text = ocr_text
-                                        found_license = True
-                                        break
-                            if found_license:
-                                break
-                        if not found_license:
-                            # Fallback: try the full image
-                            full_image = preprocess_image(image, save_debug=(i == 0), crop_band=None)
-                            ocr_text = try_psm_modes(full_image, image_path=image_path)
-                            if ocr_text.strip():
-                                all_text.append(ocr_text)
-                            text = ' '.join(all_text)
-                except Exception as e:
-                    logger.error(f"Error processing PDF: {str(e)}")
-                    return {}
-            else:
-                try:
-                    image = Image.open(image_path)
-                    logger.debug(f"Image mode: {image.mode}, size: {image.size}")
-                    found_license = False
-                    all_text = []
-                    # --- Try region crop for license number ---
-                    license_crop = crop_license_number_region(image)
-                    ocr_text = try_psm_modes(license_crop, image_path=image_path)
-                    if ocr_text.strip():
-                        all_text.append(ocr_text)
-                        if re.search(r'[A-Z]\d{3}-\d{3}-\d{2}-\d{3}-\d', ocr_text):
-                            text = ocr_text
-                            found_license = True
-                    # --- Try region crop for DOB ---
-                    dob_crop = crop_dob_region(image)
-                    dob_ocr_text = try_psm_modes(dob_crop, image_path=image_path)
-                    if dob_ocr_text.strip():
-                        all_text.append(dob_ocr_text)
-                    # If not found, try the usual band approach
-                    if not found_license:
-                        for band in [0, 1, 2]:
-                            band_image = preprocess_image(image, save_debug=(band == 1), crop_band=band)
-                            ocr_text = try_psm_modes(band_image, image_path=image_path)
-                            if ocr_text.strip():
-                                all_text.append(ocr_text)
-                                if re.search(r'[A-Z]\d{3}-\d{3}-\d{2}-\d{3}-\d', ocr_text):
-                                    text = ocr_text
-                                    found_license = True
-                                    break
-                    if not found_license:
-                        # Fallback: try the full image
-                        full_image = preprocess_image(image, save_debug=True, crop_band=None)
-                        ocr_text = try_psm_modes(full_image, image_path=image_path)
-                        if ocr_text.strip():
-                            all_text.append(ocr_text)
-                        text = ' '.join(all_text)
-                except Exception as e:
-                    logger.error(f"Error processing image: {str(e)}")
-                    return {}
-
-            # Clean and normalize text
-            text = text.replace('\n', ' ').replace('\r', ' ')
-            text = ' '.join(text.split())
-            
-            if not text.strip():
-                logger.warning("No text extracted from driver's license (after all PSM modes)")
-                return {}
-            
-            logger.debug(f"Extracted text: {text}")
-            
-            # Parse the text and validate the license number
-            result = self._parse_dl_text(text)
-            
-            # --- Improved license number extraction ---
-            import difflib
-            def normalize_license_candidate(s):
-                # Remove spaces and non-alphanum, replace common OCR errors
-                s = re.sub(r'[^A-Z0-9]', '', s.upper())
-                # Common OCR errors
-                replacements = {
-                    'S': '5', 'O': '0', 'I': '1', 'L': '1',
-                    'B': '8', 'G': '6', 'Z': '2', 'Q': '0',
-                    'D': '0', 'T': '7', 'A': '4'
-                }
-                for wrong, correct in replacements.items():
-                    s = s.replace(wrong, correct)
-                return s
-
-            # Relaxed pattern: allow any non-alphanum between groups, require 1 letter + 14 digits
-            candidates = re.findall(r'([A-Z5S][^A-Z0-9]?[0-9OIl]{3}[^A-Z0-9]?[0-9OIl]{3}[^A-Z0-9]?[0-9OIl]{2}[^A-Z0-9]?[0-9OIl]{3}[^A-Z0-9]?[0-9OIl])', text, re.IGNORECASE)
-            normalized_candidates = [normalize_license_candidate(c) for c in candidates]
-            logger.info(f"License number candidates: {normalized_candidates}")
-
-            # Score by similarity to expected format (M532558539650)
-            expected_format = 'M532558539650'
-            def score(candidate):
-                # Base score from sequence matcher
-                base_score = difflib.SequenceMatcher(None, candidate, expected_format).ratio()
-                
-                # Additional scoring factors
-                length_score = 1.0 if len(candidate) == 13 else 0.5  # Perfect length gets full points
-                format_score = 1.0 if re.match(r'^[A-Z]\d{12}$', candidate) else 0.5  # Perfect format gets full points
-                
-                # Weight the scores
-                final_score = (base_score * 0.4) + (length_score * 0.3) + (format_score * 0.3)
-                return final_score
-
-            if normalized_candidates:
-                best = max(normalized_candidates, key=score)
-                logger.info(f"Best license number candidate: {best}")
-                # Try to reformat to expected pattern
-                if len(best) == 13 or len(best) == 14 or len(best) == 15:
-                    # Try to insert dashes at the right places
-                    reformatted = f"{best[0]}{best[1:4]}-{best[4:7]}-{best[7:9]}-{best[9:12]}-{best[12]}"
-                    result['license_number'] = reformatted
-                    logger.info(f"Reformatted license number: {reformatted}")
-                else:
-                    result['license_number'] = best
-                    logger.info(f"Used best candidate as license number: {best}")
-            
-            # --- DOB extraction from cropped region ---
-            dob_text = ''
-            try:
-                if 'dob_ocr_text' in locals() and dob_ocr_text.strip():
-                    dob_text = dob_ocr_text.replace('\n', ' ').replace('\r', ' ')
-                    dob_text = ' '.join(dob_text.split())
-                    # Try to extract DOB from this region
-                    dob_match = re.search(r'(?:DOB|BIRTH|DATE OF BIRTH)?\s*([0-9]{2}/[0-9]{2}/[0-9]{4})', dob_text)
-                    if dob_match:
-                        result['date_of_birth'] = dob_match.group(1)
-                        logger.info(f"DOB extracted from cropped region: {result['date_of_birth']}")
-            except Exception as e:
-                logger.error(f"Error extracting DOB from cropped region: {str(e)}")
-            
-            # --- Expiration Date Extraction ---
-            exp_match = re.search(r'(?:EXP|EXPIRATION|EXPIRES|EXP DATE|EXPIRATION DATE)[^0-9]*([0-9]{2}/[0-9]{2}/[0-9]{4})', text)
-            if exp_match:
-                result['expiration_date'] = exp_match.group(1)
-            else:
-                # Fallback: any MM/DD/YYYY after 'EXP'
-                exp_idx = text.find('EXP')
-                if exp_idx != -1:
-                    after_exp = text[exp_idx:exp_idx+30]  # look ahead 30 chars
-                    m2 = re.search(r'([0-9]{2}/[0-9]{2}/[0-9]{4})', after_exp)
-                    if m2:
-                        result['expiration_date'] = m2.group(1)
-
+            content_hash = compute_content_hash(image_path)
+            cached_result = self.ocr_cache.get(content_hash)
+            if cached_result is not None:
+                logger.info(f"Using cached OCR result for {image_path}")
+                return cached_result
+            result = self._ocr_dl_file(image_path)
+            self.ocr_cache.put(content_hash, result)
             return result
         except Exception as e:
             logger.error(f"Error extracting driver's license info: {str(e)}")
@@ -1442,14 +960,8 @@ class DropboxClient:
         try:
             logger.info(f"Downloading holiday file: {holiday_file.name}")
             
-            # Create a temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx')
-            temp_path = temp_file.name
-            temp_file.close()
-            
-            # Download the file
-            with open(temp_path, 'wb') as f:
-                self.dbx.files_download_to_file(temp_path, holiday_file.path_display)
+            # Download the file (served from the download cache if this revision was fetched before)
+            temp_path = self.download_cache.fetch(self.dbx, holiday_file, request=self._make_request)
             
             logger.info(f"Successfully downloaded holiday file to: {temp_path}")
             return temp_path
@@ -1458,17 +970,20 @@ class DropboxClient:
             logger.error(f"Error downloading holiday file: {str(e)}")
             return None
 
-    def _process_holiday_file(self, holiday_file: str = 'HOLIDAY CLIENT LIST 2025.xlsx') -> Tuple[Optional[FileMetadata], Optional[str], Optional[pd.ExcelFile], Optional[List[str]]]:
+    def _process_holiday_file(self, holiday_file: str = 'HOLIDAY CLIENT LIST 2025.xlsx') -> Tuple[Optional[FileMetadata], Optional[str], Optional[ParsedWorkbook], Optional[List[str]]]:
         """Process the holiday file by locating, downloading, and reading it.
         
+        The parsed sheets are cached per Dropbox revision, so the workbook is downloaded
+        and parsed at most once for each ``rev``.
+        
         Args:
             holiday_file (str): Name of the holiday file to process
             
         Returns:
             Tuple containing:
             - FileMetadata: The holiday file metadata
-            - str: Path to the temporary file
-            - pd.ExcelFile: The Excel file object
+            - str: Path to the workbook file or its cached revision directory
+            - ParsedWorkbook: The parsed workbook
             - List[str]: List of sheet names
         """
         try:
@@ -1480,34 +995,34 @@ class DropboxClient:
                 logger.error(f"Holiday file '{holiday_file}' not found")
                 return None, None, None, None
             
-            # Download the file
-            temp_path = self._download_holiday_file(holiday_file_metadata)
-            if not temp_path:
-                logger.error("Failed to download holiday file")
+            # Read the workbook (downloaded and parsed only if this revision is not cached)
+            workbook = self.workbook_cache.load(holiday_file_metadata, self._download_holiday_file)
+            if workbook is None:
+                logger.error("Failed to read holiday file")
                 return None, None, None, None
             
-            # Read the Excel file
-            try:
-                excel_file = pd.ExcelFile(temp_path)
-                sheets = excel_file.sheet_names
-                logger.info(f"Successfully read Excel file with sheets: {sheets}")
-                return holiday_file_metadata, temp_path, excel_file, sheets
-            except Exception as e:
-                logger.error(f"Error reading Excel file: {str(e)}")
-                return None, None, None, None
+            sheets = workbook.sheet_names
+            logger.info(f"Successfully read Excel file with sheets: {sheets}")
+            return holiday_file_metadata, workbook.source_path, workbook, sheets
                 
         except Exception as e:
             logger.error(f"Error processing holiday file: {str(e)}")
             return None, None, None, None
 
-    def update_flatfile_with_account_info(self, account_info: Dict[str, Any], flatfile_excel: pd.ExcelFile = None, template_path: str = None, output_path: str = None) -> bool:
+    def update_flatfile_with_account_info(self, account_info: Dict[str, Any], flatfile_writer: FlatFileWriter = None, template_path: str = None, output_path: str = None) -> bool:
         """Update the FlatFile Excel with Dropbox account information.
         
+        The row is upserted into ``flatfile_writer``, which buffers the Clients rows and
+        writes the workbook and CSV in batches. Without a writer, one is created that
+        starts from the existing output at ``output_path`` (or from ``template_path`` when
+        there is none yet) and is closed right away, so earlier rows are kept and the files
+        are written immediately.
+        
         Args:
             account_info (Dict[str, Any]): Dictionary containing account information
-            flatfile_excel (pd.ExcelFile): The Excel file object for the template
-            template_path (str): Path to the template file
-            output_path (str): Path to the output file
+            flatfile_writer (FlatFileWriter): Writer shared by all accounts of the run
+            template_path (str): Path to the template file (used when no writer is given)
+            output_path (str): Path to the output file (used when no writer is given)
             
         Returns:
             bool: True if update was successful, False otherwise
@@ -1516,7 +1031,7 @@ class DropboxClient:
             account_name = account_info.get('name_parts', {}).get('folder_name', '')
             logger.info(f"\n=== Starting FlatFile update for account: {account_name} ===")
             
-            if not all([flatfile_excel, template_path, output_path]):
+            if flatfile_writer is None and not all([template_path, output_path]):
                 logger.error("Missing required parameters for FlatFile update")
                 return False
                 
@@ -1553,125 +1068,17 @@ class DropboxClient:
             for key, value in mapped_data.items():
                 logger.info(f"  {key}: {value}")
                 
-            # Create a dictionary to store the updated dataframes
-            updated_dfs = {}
-            
-            # Process only the Clients sheet
-            sheet_name = "Clients"
-            logger.info(f"\nProcessing sheet: {sheet_name}")
-            df = pd.read_excel(flatfile_excel, sheet_name=sheet_name)
-            
-            # Debug: Log current sheet data
-            logger.info(f"Current sheet data shape: {df.shape}")
-            logger.info("Columns in sheet:")
-            for col in df.columns:
-                logger.info(f"  - {col}")
-            
-            # Check if this is a new entry or update
-            last_name = mapped_data['Last Name'].lower()
-            first_name = mapped_data['First Name'].lower()
-            
-            logger.info(f"\nSearching for matches with first_name: {first_name}, last_name: {last_name}")
-            
-            # Create a mask for matching rows
-            mask = df.apply(lambda row: any(
-                str(val).lower() == last_name or str(val).lower() == first_name 
-                for val in row.values
-            ), axis=1)
-            
-            matching_rows = df[mask]
-            
-            if not matching_rows.empty:
-                # Update existing entry
-                logger.info(f"\n=== Updating existing entry ===")
-                logger.info(f"Found {len(matching_rows)} matching rows in sheet: {sheet_name}")
-                for idx in matching_rows.index:
-                    logger.info(f"\nUpdating row at index {idx}")
-                    logger.info("Current row data:")
-                    for col in df.columns:
-                        logger.info(f"  {col}: {df.at[idx, col]}")
-                    
-                    # Update the row with new data
-                    logger.info("\nUpdating with new data:")
-                    for col in df.columns:
-                        if col in mapped_data:
-                            old_value = df.at[idx, col]
-                            new_value = mapped_data[col]
-                            if str(old_value).lower() != str(new_value).lower():
-                                df.at[idx, col] = new_value
-                                logger.info(f"  {col}: {old_value} -> {new_value}")
-                            else:
-                                logger.info(f"  {col}: No change (already matches)")
-            else:
-                # Add new entry
-                logger.info(f"\n=== Adding new entry ===")
-                logger.info(f"No matching rows found, adding new entry to sheet: {sheet_name}")
-                # Create a new row with the same columns as the DataFrame
-                new_row = pd.DataFrame([{col: mapped_data.get(col, '') for col in df.columns}])
-                df = pd.concat([df, new_row], ignore_index=True)
-                logger.info("\nNew row data:")
-                for col in df.columns:
-                    if col in mapped_data:
-                        logger.info(f"  {col}: {mapped_data[col]}")
-                    else:
-                        logger.info(f"  {col}: <empty>")
-            
-            updated_dfs[sheet_name] = df
-            
-            # Read all other sheets without modification
-            for other_sheet in flatfile_excel.sheet_names:
-                if other_sheet != sheet_name:
-                    logger.info(f"Reading unchanged sheet: {other_sheet}")
-                    updated_dfs[other_sheet] = pd.read_excel(flatfile_excel, sheet_name=other_sheet)
-            
-            # Write the updated data to both Excel and CSV files
-            excel_output_path = output_path.replace('docs/', 'data/')
-            csv_output_path = output_path.replace('docs/', 'data/').replace('.xlsx', '.csv')
-            
-            # Write Excel file
-            logger.info(f"\nWriting Excel file to: {excel_output_path}")
-            
-            # Read existing Excel file if it exists
-            if os.path.exists(excel_output_path):
-                existing_excel = pd.ExcelFile(excel_output_path)
-                existing_dfs = {}
-                for sheet_name in existing_excel.sheet_names:
-                    existing_dfs[sheet_name] = pd.read_excel(existing_excel, sheet_name=sheet_name)
-                
-                # Combine existing data with new data
-                for sheet_name in updated_dfs:
-                    if sheet_name in existing_dfs:
-                        # Concatenate existing and new data
-                        combined_df = pd.concat([existing_dfs[sheet_name], updated_dfs[sheet_name]], ignore_index=True)
-                        # Remove any duplicates based on all columns
-                        combined_df = combined_df.drop_duplicates()
-                        updated_dfs[sheet_name] = combined_df
-            
-            # Write the combined data
-            with pd.ExcelWriter(excel_output_path, engine='openpyxl', mode='w') as writer:
-                for sheet_name, df in updated_dfs.items():
-                    logger.info(f"Writing sheet {sheet_name} with {len(df)} rows")
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-            
-            # Write CSV file with only Clients sheet data
-            logger.info(f"\nWriting CSV file to: {csv_output_path}")
-            
-            # Read existing CSV file if it exists
-            if os.path.exists(csv_output_path):
-                existing_df = pd.read_csv(csv_output_path)
-                # Combine with new data
-                combined_df = pd.concat([existing_df, updated_dfs["Clients"]], ignore_index=True)
-                # Remove any duplicates
-                combined_df = combined_df.drop_duplicates()
-                # Write the combined data
-                combined_df.to_csv(csv_output_path, index=False)
-            else:
-                # Write new data with header
-                updated_dfs["Clients"].to_csv(csv_output_path, index=False)
+            # Add or update the Clients row (files are written when the writer flushes)
+            close_writer = flatfile_writer is None
+            if close_writer:
+                flatfile_writer = FlatFileWriter(template_path, output_path, flush_every=0, resume=True)
+            flatfile_writer.upsert(mapped_data)
+            if close_writer and not flatfile_writer.close():
+                return False
             
             logger.info(f"\n=== Successfully completed FlatFile update ===")
-            logger.info(f"  Excel: {excel_output_path}")
-            logger.info(f"  CSV: {csv_output_path}")
+            logger.info(f"  Excel: {flatfile_writer.excel_output_path}")
+            logger.info(f"  CSV: {flatfile_writer.csv_output_path}")
             logger.info(f"  Account: {account_name}")
             logger.info("=== End FlatFile update ===\n")
             return True
@@ -1681,107 +1088,6 @@ class DropboxClient:
             logger.error("Stack trace:", exc_info=True)
             return False
 
-    def _parse_dl_text(self, text: str) -> Dict[str, str]:
-        """
-        Parse text extracted from driver's license to extract relevant information.
-        Enhanced for Florida licenses: robustly extract license number, DOB, and sex.
-        """
-        result = {}
-        text = text.replace('\n', ' ').replace('\r', ' ')
-        text = ' '.join(text.split())
-
-        # --- License Number Extraction ---
-        # Fix common OCR errors
-        ocr_replacements = {
-            '¢': '0', '|': '1', '§': '5', '©': '0', '®': '0', '“': '1', '”': '1', '‘': '1', '’': '1',
-            'S': '5', 'O': '0', 'I': '1', 'L': '1', 'B': '8', 'G': '6', 'Z': '2', 'Q': '0', 'D': '0', 'T': '7', 'A': '4',
-            '(': '0', ')': '0', '{': '0', '}': '0', '[': '0', ']': '0', 'o': '0', 's': '5', 'l': '1', 'i': '1', 'a': '4',
-            'b': '6', 'g': '9', 'z': '2', 'q': '0', 'd': '0', 't': '7', 'e': '6', 'E': '6', 'B': '8', 'G': '6', 'Z': '2', 'Q': '0', 'D': '0', 'T': '7', 'A': '4'
-        }
-        clean_text = text
-        for wrong, correct in ocr_replacements.items():
-            clean_text = clean_text.replace(wrong, correct)
-
-        # Remove all whitespace and newlines for aggressive search
-        clean_text_no_space = re.sub(r'\s+', '', clean_text)
-
-        # Try to find license number with or without dashes, possibly missing leading M
-        lic_patterns = [
-            r'([A-Z][0-9]{3}-[0-9]{3}-[0-9]{2}-[0-9]{3}-[0-9])',
-            r'([0-9]{3}-[0-9]{3}-[0-9]{2}-[0-9]{3}-[0-9])',
-            r'([A-Z][0-9]{12})',
-            r'([0-9]{12})',
-            r'([A-Z][0-9]{3}[0-9]{3}[0-9]{2}[0-9]{3}[0-9])',
-            r'([0-9]{3}[0-9]{3}[0-9]{2}[0-9]{3}[0-9])'
-        ]
-        license_number = None
-        for pat in lic_patterns:
-            m = re.search(pat, clean_text)
-            if m:
-                license_number = m.group(1)
-                break
-        # If not found, try on the whitespace-stripped version
-        if not license_number:
-            for pat in lic_patterns:
-                m = re.search(pat, clean_text_no_space)
-                if m:
-                    license_number = m.group(1)
-                    break
-        # If still not found, try to join split fragments
-        if not license_number:
-            # Find all fragments that look like part of the license number
-            frags = re.findall(r'[A-Z0-9]{2,}', clean_text_no_space)
-            joined = ''.join(frags)
-            for pat in lic_patterns:
-                m = re.search(pat, joined)
-                if m:
-                    license_number = m.group(1)
-                    break
-        # Post-process: if missing leading M, add it
-        if license_number:
-            if re.match(r'^[0-9]', license_number):
-                license_number = 'M' + license_number
-            # Remove dashes for normalization
-            lic_digits = re.sub(r'[^A-Z0-9]', '', license_number)
-            # Reformat to M###-###-##-###-#
-            if len(lic_digits) == 13:
-                license_number = f"{lic_digits[0]}{lic_digits[1:4]}-{lic_digits[4:7]}-{lic_digits[7:9]}-{lic_digits[9:12]}-{lic_digits[12]}"
-            result['license_number'] = license_number
-
-        # --- DOB Extraction ---
-        dob_match = re.search(r'(?:DOB|BIRTH|DATE OF BIRTH)?\s*([0-9]{2}/[0-9]{2}/[0-9]{4})', clean_text)
-        if dob_match:
-            result['date_of_birth'] = dob_match.group(1)
-        else:
-            # Fallback: any MM/DD/YYYY
-            dob_match = re.search(r'([0-9]{2}/[0-9]{2}/[0-9]{4})', clean_text)
-            if dob_match:
-                result['date_of_birth'] = dob_match.group(1)
-
-        # --- Sex Extraction ---
-        # Try to find 'SEX' label first
-        sex_match = re.search(r'SEX[:=\-~ ]*([MF])', clean_text)
-        if sex_match:
-            result['sex'] = sex_match.group(1)
-        else:
-            # Fallback: look for F or M after DOB
-            if 'date_of_birth' in result:
-                dob_idx = clean_text.find(result['date_of_birth'])
-                if dob_idx != -1:
-                    after_dob = clean_text[dob_idx+len(result['date_of_birth']):dob_idx+len(result['date_of_birth'])+10]
-                    m2 = re.search(r'([MF])', after_dob)
-                    if m2:
-                        result['sex'] = m2.group(1)
-
-        # Optionally: log the extracted information
-        if result:
-            logger.info("Extracted driver's license information (enhanced):")
-            for field, value in result.items():
-                logger.info(f"  {field}: {value}")
-        else:
-            logger.warning("No information could be extracted from driver's license (enhanced)")
-            logger.debug(f"Raw OCR text: {text}")
-        return result
 
 def update_env_file(env_file, token=None, root_folder=None, directory=None):
     """Update the .env file with new values."""
@@ -1855,11 +1161,21 @@ def get_renamed_path(metadata, path, is_folder=False, dbx=None):
         print(f"Error generating renamed path for {path}: {e}")
         return os.path.basename(path)
 
-def download_and_rename_file(dbx, dropbox_path, local_dir):
-    """Download a file from Dropbox and rename it with its modification date if it doesn't already have a date prefix."""
+def download_and_rename_file(dbx, dropbox_path, local_dir, metadata=None, request=None):
+    """Download a file from Dropbox and rename it with its modification date if it doesn't already have a date prefix.
+    
+    Args:
+        dbx: Dropbox client instance
+        dropbox_path: Path of the file in Dropbox
+        local_dir: Local directory to download into
+        metadata: Optional file metadata from a listing, saves a files_get_metadata call
+        request: Optional wrapper used to issue API calls (e.g. DropboxRequestExecutor.call)
+    """
+    request = request or (lambda func, *args, **kwargs: func(*args, **kwargs))
     try:
         # Get file metadata
-        metadata = dbx.files_get_metadata(dropbox_path)
+        if metadata is None:
+            metadata = request(dbx.files_get_metadata, dropbox_path)
         
         # Get the original name
         original_name = os.path.basename(dropbox_path)
@@ -1877,12 +1193,12 @@ def download_and_rename_file(dbx, dropbox_path, local_dir):
         
         # Download the file
         print(f"Downloading: {dropbox_path} -> {local_path}")
-        dbx.files_download_to_file(local_path, dropbox_path)
+        get_download_cache().copy_to(dbx, metadata, local_path, request=request)
         
     except Exception as e:
         print(f"Error processing file {dropbox_path}: {e}")
 
-def list_dropbox_folder_contents(dbx, path, sort_by_recency: bool = False) -> List[FileMetadata]:
+def list_dropbox_folder_contents(dbx, path, sort_by_recency: bool = False, request=None) -> List[FileMetadata]:
     """
     List the contents of a Dropbox folder, handling pagination.
     
@@ -1890,15 +1206,17 @@ def list_dropbox_folder_contents(dbx, path, sort_by_recency: bool = False) -> Li
         dbx: Dropbox client instance
         path: Path to list contents from
         sort_by_recency: If True, sorts folders by their recency (most recent first)
+        request: Optional wrapper used to issue API calls (e.g. DropboxRequestExecutor.call)
         
     Returns:
         List[FileMetadata]: List of folder contents, optionally sorted by recency
     """
+    request = request or (lambda func, *args, **kwargs: func(*args, **kwargs))
     try:
-        result = dbx.files_list_folder(path)
+        result = request(dbx.files_list_folder, path)
         entries = result.entries
         while result.has_more:
-            result = dbx.files_list_folder_continue(result.cursor)
+            result = request(dbx.files_list_folder_continue, result.cursor)
             entries.extend(result.entries)
             
         if sort_by_recency:
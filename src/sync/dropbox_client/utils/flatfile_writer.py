@@ -0,0 +1,212 @@
+"""Buffered writer for the FlatFile workbook and CSV built from Dropbox account info."""
+
+import json
+import logging
+import os
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from src.config import FLATFILE_FLUSH_EVERY
+
+logger = logging.getLogger(__name__)
+
+CLIENTS_SHEET = 'Clients'
+KEY_COLUMNS = ('First Name', 'Last Name')
+
+
+def _cell_value(value: Any) -> Any:
+    """Convert a DataFrame value into something openpyxl can write (NaN becomes an empty cell)."""
+    if value is None:
+        return None
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return None if pd.isna(value) else value.to_pydatetime()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _row_key(row: Dict[str, Any]) -> Tuple[str, ...]:
+    """Build the upsert key (lower-cased first and last name) for a Clients row."""
+    key = []
+    for column in KEY_COLUMNS:
+        value = row.get(column, '')
+        key.append('' if value is None or (isinstance(value, float) and np.isnan(value)) else str(value).strip().lower())
+    return tuple(key)
+
+
+class FlatFileWriter:
+    """
+    Keep the FlatFile Clients rows in memory and write the workbook and CSV in batches.
+
+    The template is read once. Accounts are upserted into the Clients rows by first and
+    last name, and the workbook (in openpyxl write-only mode) and the Clients CSV are
+    rewritten every ``flush_every`` accounts and on ``close``. Each upsert is also appended
+    to a journal next to the output, which ``close`` removes. A writer created with
+    ``resume`` starts from the existing output instead of the template and replays the
+    journal a run left behind when it stopped before ``close``, so buffered rows are not lost.
+    """
+
+    def __init__(self, template_path: str, output_path: str, flush_every: int = FLATFILE_FLUSH_EVERY,
+                 journal_path: str = None, resume: bool = False):
+        """
+        Args:
+            template_path: FlatFile template workbook
+            output_path: Output workbook (the Clients CSV is written next to it)
+            flush_every: Upserts between writes of the output files (0 writes only on ``close``)
+            journal_path: Upsert journal (default: the output path with a .journal suffix)
+            resume: Start from the existing output workbook, if there is one, instead of the
+                template, and replay the journal
+        """
+        self.template_path = template_path
+        self.excel_output_path = output_path.replace('docs/', 'data/')
+        self.csv_output_path = self.excel_output_path.replace('.xlsx', '.csv')
+        self.journal_path = journal_path or f"{self.excel_output_path}.journal"
+        self.flush_every = flush_every
+
+        source_path = self.excel_output_path if resume and os.path.exists(self.excel_output_path) else template_path
+        source = pd.ExcelFile(source_path)
+        self.sheets = {sheet_name: source.parse(sheet_name) for sheet_name in source.sheet_names}
+        if CLIENTS_SHEET not in self.sheets:
+            raise ValueError(f"FlatFile workbook {source_path} has no {CLIENTS_SHEET} sheet")
+        clients = self.sheets[CLIENTS_SHEET]
+        self.columns: List[str] = list(clients.columns)
+        self.rows: List[Dict[str, Any]] = clients.to_dict('records')
+        self.index: Dict[Tuple[str, ...], int] = {}
+        for position, row in enumerate(self.rows):
+            key = _row_key(row)
+            if any(key):
+                self.index.setdefault(key, position)
+        self.pending = 0
+        logger.info(f"Loaded FlatFile {'output' if source_path != template_path else 'template'} "
+                    f"{source_path} with {len(self.rows)} {CLIENTS_SHEET} rows")
+        if resume:
+            self._recover_journal()
+
+    def _apply(self, mapped_data: Dict[str, Any]) -> bool:
+        """Insert or update a Clients row; returns True if a new row was added."""
+        key = _row_key(mapped_data)
+        position = self.index.get(key)
+        if position is None:
+            self.rows.append({column: mapped_data.get(column, '') for column in self.columns})
+            self.index[key] = len(self.rows) - 1
+            return True
+        row = self.rows[position]
+        for column in self.columns:
+            if column in mapped_data:
+                row[column] = mapped_data[column]
+        return False
+
+    def _recover_journal(self) -> None:
+        """Replay rows journaled by a run that did not finish."""
+        if not os.path.exists(self.journal_path):
+            return
+        recovered = 0
+        with open(self.journal_path, 'r') as f:
+            for line in f:
+                try:
+                    mapped_data = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut short by the crash; everything before it is intact
+                    logger.warning(f"Skipping incomplete FlatFile journal entry in {self.journal_path}")
+                    continue
+                self._apply(mapped_data)
+                recovered += 1
+        if recovered:
+            logger.info(f"Recovered {recovered} FlatFile rows from journal {self.journal_path}")
+            self.pending += recovered
+
+    def _journal(self, mapped_data: Dict[str, Any]) -> None:
+        """Append an upsert to the journal and make sure it reached the disk."""
+        journal_dir = os.path.dirname(self.journal_path)
+        if journal_dir:
+            os.makedirs(journal_dir, exist_ok=True)
+        with open(self.journal_path, 'a') as f:
+            f.write(json.dumps(mapped_data, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def upsert(self, mapped_data: Dict[str, Any]) -> bool:
+        """
+        Add or update the Clients row for an account.
+
+        Args:
+            mapped_data: Values keyed by Clients column name (First Name, Last Name, ...)
+
+        Returns:
+            bool: True if a new row was added, False if an existing row was updated
+        """
+        self._journal(mapped_data)
+        created = self._apply(mapped_data)
+        self.pending += 1
+        logger.info(f"{'Added' if created else 'Updated'} FlatFile row for "
+                    f"{mapped_data.get('First Name', '')} {mapped_data.get('Last Name', '')} "
+                    f"({self.pending} pending)")
+        if self.flush_every and self.pending >= self.flush_every:
+            self.flush()
+        return created
+
+    def _write_excel(self, path: str) -> None:
+        """Write every sheet to an xlsx file using openpyxl's write-only mode."""
+        workbook = Workbook(write_only=True)
+        for sheet_name, df in self.sheets.items():
+            worksheet = workbook.create_sheet(title=sheet_name)
+            if sheet_name == CLIENTS_SHEET:
+                worksheet.append([str(column) for column in self.columns])
+                for row in self.rows:
+                    worksheet.append([_cell_value(row.get(column)) for column in self.columns])
+            else:
+                worksheet.append([str(column) for column in df.columns])
+                for values in df.itertuples(index=False, name=None):
+                    worksheet.append([_cell_value(value) for value in values])
+        workbook.save(path)
+
+    def flush(self) -> bool:
+        """
+        Write the workbook and Clients CSV (each replaced atomically).
+
+        Returns:
+            bool: True if both files were written, False otherwise
+        """
+        try:
+            output_dir = os.path.dirname(self.excel_output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            temp_excel = f"{self.excel_output_path}.tmp"
+            self._write_excel(temp_excel)
+            os.replace(temp_excel, self.excel_output_path)
+
+            temp_csv = f"{self.csv_output_path}.tmp"
+            pd.DataFrame(self.rows, columns=self.columns).to_csv(temp_csv, index=False)
+            os.replace(temp_csv, self.csv_output_path)
+
+            logger.info(f"Wrote FlatFile with {len(self.rows)} {CLIENTS_SHEET} rows to "
+                        f"{self.excel_output_path} and {self.csv_output_path}")
+            self.pending = 0
+            return True
+        except Exception as e:
+            logger.error(f"Error writing FlatFile: {str(e)}")
+            return False
+
+    def close(self) -> bool:
+        """
+        Write any buffered rows and remove the journal once they are safely on disk.
+
+        Returns:
+            bool: True if the final flush succeeded, False otherwise
+        """
+        if not self.flush():
+            return False
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
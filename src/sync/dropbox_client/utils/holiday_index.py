@@ -0,0 +1,158 @@
+"""Row index over a holiday workbook sheet for fast account lookups."""
+
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Length of the character n-grams used as index tokens
+GRAM_SIZE = 3
+# Separator placed between cells when searching a whole row for a substring
+CELL_SEPARATOR = '\x1f'
+
+
+def clean_cell_value(value) -> str:
+    """Clean cell value by removing parenthetical content and extra whitespace."""
+    if pd.isna(value):
+        return ''
+    # Convert to string and remove anything after and including '('
+    return str(value).split('(')[0].strip()
+
+
+def _grams(text: str) -> Set[str]:
+    """Return the character n-grams of a string."""
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class SheetIndex:
+    """
+    Precomputed lookups over the rows of one sheet, built once per workbook.
+
+    The matching code checks whether search words occur *inside* cells, so the index maps
+    character n-grams of the lower-cased cells to row positions. A word can only occur in
+    rows holding all of its n-grams; those few candidate rows are then checked exactly.
+    "X Family" / "Family X" cell pairs are precomputed per name, and the cleaned cell text
+    used for the last-name filter is kept per row.
+
+    Row ids are positions (``df.iloc``), and lookups return them in sheet order, so the
+    first match is the same row a full ``iterrows`` scan would find.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        start_time = time.time()
+        self.df = df
+        # Cell text exactly as the row scans see it (``str(val).lower()`` over row values)
+        self.row_values: List[List[str]] = [[str(val).lower() for val in row] for row in df.values]
+        # Cleaned cell text used by the last-name filter (``astype(str)``, cleaned, lower-cased)
+        cleaned = df.astype(str).apply(lambda column: column.apply(clean_cell_value).str.lower())
+        cleaned_cells = cleaned.values.tolist()
+        self.cleaned_rows: List[str] = [CELL_SEPARATOR.join(row) for row in cleaned_cells]
+
+        self.gram_rows: Dict[str, Set[int]] = {}
+        self.family_rows: Dict[str, List[int]] = {}
+        for position, values in enumerate(self.row_values):
+            for cell in values:
+                for gram in _grams(cell):
+                    self.gram_rows.setdefault(gram, set()).add(position)
+            # A cleaned cell is normally part of its raw cell, so its n-grams are indexed
+            # already; index the rare ones that are not (``astype(str)`` formats some
+            # values differently), so lookups in the cleaned text can use the index too
+            for raw, cell in zip(values, cleaned_cells[position]):
+                if cell not in raw:
+                    for gram in _grams(cell):
+                        self.gram_rows.setdefault(gram, set()).add(position)
+
+            family_values = [clean_cell_value(str(val)).lower() for val in values]
+            names = set()
+            for i in range(len(family_values) - 1):
+                if family_values[i + 1] == 'family':
+                    names.add(family_values[i])
+                if family_values[i] == 'family':
+                    names.add(family_values[i + 1])
+            for name in names:
+                self.family_rows.setdefault(name, []).append(position)
+
+        logger.info(f"Indexed {len(self.row_values)} rows ({len(self.gram_rows)} tokens, "
+                    f"{len(self.family_rows)} family names) in {time.time() - start_time:.2f} seconds")
+
+    def __len__(self) -> int:
+        return len(self.row_values)
+
+    def rows_containing(self, text: str) -> List[int]:
+        """
+        Return rows where any cleaned, lower-cased cell contains the text.
+
+        Args:
+            text: Lower-cased text to look for (e.g. a last name)
+
+        Returns:
+            List[int]: Matching row positions in sheet order
+        """
+        # The n-gram index narrows the rows down; the substring check confirms them
+        return [position for position in self.candidate_rows([text]) if text in self.cleaned_rows[position]]
+
+    def find_family_row(self, last_name: str, candidate_rows: Iterable[int] = None) -> Optional[int]:
+        """
+        Find the first row holding a "last_name Family" or "Family last_name" cell pair.
+
+        Args:
+            last_name: Last name to look for
+            candidate_rows: Optional row positions to restrict the lookup to
+
+        Returns:
+            Optional[int]: Position of the first matching row, or None
+        """
+        rows = self.family_rows.get(last_name.lower(), [])
+        if candidate_rows is not None:
+            allowed = set(candidate_rows)
+            rows = [position for position in rows if position in allowed]
+        return rows[0] if rows else None
+
+    def candidate_rows(self, words: List[str]) -> List[int]:
+        """
+        Return rows that may contain every word inside one of their cells.
+
+        Args:
+            words: Lower-cased search words
+
+        Returns:
+            List[int]: Candidate row positions in sheet order (a superset of the real matches)
+        """
+        candidates = None
+        for word in words:
+            for gram in _grams(word):
+                rows = self.gram_rows.get(gram, set())
+                candidates = set(rows) if candidates is None else candidates & rows
+                if not candidates:
+                    return []
+        if candidates is None:
+            # Only words shorter than an n-gram: nothing to prune on
+            return list(range(len(self.row_values)))
+        return sorted(candidates)
+
+    def find_sequential_row(self, words: List[str], candidate_rows: Iterable[int] = None) -> Optional[int]:
+        """
+        Find the first row where the words occur, in order, in successive cells.
+
+        Args:
+            words: Lower-cased search words
+            candidate_rows: Optional row positions to restrict the lookup to
+
+        Returns:
+            Optional[int]: Position of the first matching row, or None
+        """
+        rows = self.candidate_rows(words)
+        if candidate_rows is not None:
+            allowed = set(candidate_rows)
+            rows = [position for position in rows if position in allowed]
+        for position in rows:
+            word_index = 0
+            for cell in self.row_values[position]:
+                if word_index < len(words) and words[word_index] in cell:
+                    word_index += 1
+                    if word_index == len(words):
+                        return position
+        return None
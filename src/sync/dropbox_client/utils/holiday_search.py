@@ -0,0 +1,652 @@
+"""Holiday workbook matching shared by per-account and bulk Dropbox account info searches."""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .holiday_index import SheetIndex, clean_cell_value
+from .workbook_cache import ParsedWorkbook
+
+logger = logging.getLogger(__name__)
+
+
+class HolidaySearchMixin:
+    """
+    Search holiday workbook sheets for account names.
+
+    The methods keep no state of their own, so worker processes can use them without a
+    Dropbox client (see ``match_accounts_in_sheet``).
+    """
+
+    def _clean_cell_value(self, value: str) -> str:
+        """Clean cell value by removing parenthetical content and extra whitespace."""
+        return clean_cell_value(value)
+    
+    def _check_row_for_sequential_words(self, row_values: List[str], expected_words: List[str]) -> bool:
+        """
+        Check if a sequence of words appears in order across row values.
+            
+        Args:
+            row_values: List of cell values from a row
+            expected_words: List of words to find in sequence
+                
+        Returns:
+            bool: True if all words are found in sequence, False otherwise
+        """
+        word_index = 0
+        for cell_value in row_values:
+            if word_index < len(expected_words):
+                if expected_words[word_index] in cell_value:
+                    word_index += 1
+                    if word_index == len(expected_words):
+                        return True
+        return False
+
+    def search_rows_for_sequential_word_matches(self, df: pd.DataFrame, expected_words: List[str], sheet_index: SheetIndex = None) -> pd.DataFrame:
+        """
+        Search through DataFrame rows for a sequence of words appearing in order.
+        
+        Args:
+            df: DataFrame to search in
+            expected_words: List of words to find in sequence
+            sheet_index: Optional row index of ``df``; only its candidate rows are checked
+            
+        Returns:
+            pd.DataFrame: DataFrame containing the first matching row, or empty DataFrame if no match found
+        """
+        if sheet_index is not None:
+            position = sheet_index.find_sequential_row(expected_words)
+            if position is None:
+                return pd.DataFrame()
+            logger.info(f"  Found sequence match in row: {sheet_index.row_values[position]}")
+            return pd.DataFrame([df.iloc[position]])
+
+        for _, row in df.iterrows():
+            # Convert row to list of lowercase strings
+            row_values = [str(val).lower() for val in row.values]
+            # logger.info(f"  row_values: {row_values}")
+            
+            if self._check_row_for_sequential_words(row_values, expected_words):
+                logger.info(f"  Found sequence match in row: {row_values}")
+                return pd.DataFrame([row])
+        
+        return pd.DataFrame()
+
+    def _update_match_status(self, dropbox_account_info: Dict[str, Any], match_type: str, match_name: str, expected_matches: List[str], account_name: str) -> None:
+        """
+        Update the match status in the account info dictionary.
+        
+        Args:
+            dropbox_account_info: Dictionary containing account info and search results
+            match_type: Type of match found ('expected', 'normalized', or 'swapped')
+            match_name: The name that was matched
+            expected_matches: List of expected matches to validate against
+            account_name: Name of the account being searched
+        """
+        if match_type == 'expected':
+            logger.info(f"Found expected Dropbox matches for {account_name}")
+            dropbox_account_info['search_info']['status'] = 'found'
+            dropbox_account_info['search_info']['match_info']['match_status'] = "Match found in expected matches"
+        else:
+            if len(expected_matches) > 0:
+                logger.warning(f"Found {match_type} name match {match_name} but not in expected matches [{expected_matches}] for {account_name}")
+                dropbox_account_info['search_info']['status'] = 'unexpected_matches'
+                dropbox_account_info['search_info']['match_info']['match_status'] = f"Match found in {match_type} names but not in expected matches"
+            else:
+                dropbox_account_info['search_info']['status'] = 'found'
+                dropbox_account_info['search_info']['match_info']['match_status'] = f"Match found in {match_type} names"
+
+    def _store_matching_rows(self, dropbox_account_info: Dict[str, Any], matching_rows: pd.DataFrame, sheet_name: str, last_name: str) -> None:
+        """
+        Store matching rows in the account info dictionary and handle multiple matches.
+        
+        Args:
+            dropbox_account_info: Dictionary containing account info and search results
+            matching_rows: DataFrame containing matching rows
+            sheet_name: Name of the sheet being searched
+            last_name: Last name being searched for
+        """
+        # Store all matching rows for reference
+        dropbox_account_info['search_info']['matches'] = [
+            {f"Column {i}": self._clean_cell_value(str(val)) for i, val in enumerate(row) 
+             if str(val).lower() != 'nan' and not pd.isna(val)}
+            for _, row in matching_rows.iterrows()
+        ]
+        
+        # If we have multiple matches but none in expected matches, log warning
+        if len(matching_rows) > 1 and dropbox_account_info['search_info']['status'] == 'unexpected_matches':
+            logger.warning(f"Found multiple {len(matching_rows)} matches in {sheet_name} for last name: {last_name}")
+            dropbox_account_info['search_info']['status'] = 'multiple_matches'
+
+    def _split_words(self, text: str) -> List[str]:
+        """
+        Split text into words while removing commas and parentheses.
+        
+        Args:
+            text (str): The text to split
+            
+        Returns:
+            List[str]: List of cleaned words
+        """
+        # Remove parentheses and their contents
+        text = re.sub(r'\([^)]*\)', '', text)
+        # Replace comma with space to handle cases with no space after comma
+        text = text.replace(',', ' ')
+        # Split on whitespace and filter out empty strings
+        return [word.strip() for word in text.split() if word.strip()]
+
+    def _is_family_pattern_match(self, row_values: List[str], last_name: str) -> bool:
+        """
+        Check if a row matches the pattern of 'last_name Family' or 'Family last_name'.
+        
+        Args:
+            row_values: List of cell values from a row
+            last_name: The last name to check for
+            
+        Returns:
+            bool: True if the row matches the family pattern, False otherwise
+        """
+        # Convert all values to lowercase strings and clean them
+        cleaned_values = [self._clean_cell_value(str(val)).lower() for val in row_values]
+        
+        # Look for the pattern in consecutive cells
+        for i in range(len(cleaned_values) - 1):
+            # Check for "last_name Family" pattern
+            if cleaned_values[i] == last_name.lower() and cleaned_values[i + 1] == 'family':
+                return True
+            # Check for "Family last_name" pattern
+            if cleaned_values[i] == 'family' and cleaned_values[i + 1] == last_name.lower():
+                return True
+        return False
+
+    def _search_for_matches(self, df: pd.DataFrame, names_to_search: List[str], match_type: str, 
+                          dropbox_account_info: Dict[str, Any], expected_matches: List[str], 
+                          account_name: str, sheet_name: str, sheet_index: SheetIndex = None) -> Tuple[pd.DataFrame, bool, str, pd.Series]:
+        """
+        Search for matches of a specific type in the DataFrame.
+        
+        Args:
+            df: DataFrame to search in
+            names_to_search: List of names to search for
+            match_type: Type of match ('expected', 'normalized', or 'swapped')
+            dropbox_account_info: Dictionary containing account info and search results
+            expected_matches: List of expected matches to validate against
+            account_name: Name of the account being searched
+            sheet_name: Name of the sheet being searched
+            sheet_index: Optional row index of ``df`` used instead of scanning every row
+            
+        Returns:
+            Tuple containing:
+            - DataFrame with matching rows (empty if no match)
+            - Whether a match was found
+            - Name of the sheet where match was found
+            - The matching row (None if no match)
+        """
+        logger.info(f"\n=== Starting {match_type} name search in sheet: {sheet_name} ===")
+        logger.info(f"Searching for {len(names_to_search)} {match_type} names")
+        
+        # Get the last name from the account info
+        last_name = dropbox_account_info['name_parts'].get('last_name', '').lower()
+        logger.info(f"Using last name: {last_name}")
+        
+        # Initialize match_found to False
+        match_found = False
+        
+        # First check for family pattern matches
+        logger.info("Checking for family pattern matches...")
+        if sheet_index is not None:
+            # Only the row the index found holding a "last_name Family" pair needs checking
+            position = sheet_index.find_family_row(last_name)
+            family_candidates = [] if position is None else [(position, df.iloc[position])]
+        else:
+            family_candidates = df.iterrows()
+        for _, row in family_candidates:
+            row_values = [str(val) for val in row.values]
+            if self._is_family_pattern_match(row_values, last_name):
+                logger.info(f"  ✓ Found family pattern match in row: {row_values}")
+                match_found = True
+                self._update_match_status(dropbox_account_info, 'family_pattern', f"{last_name} Family", expected_matches, account_name)
+                logger.info(f"  ✓ Updated match status for family pattern match")
+                return pd.DataFrame([row]), match_found, sheet_name, row
+        
+        logger.info("No family pattern matches found, proceeding with name search...")
+        
+        # If no family pattern match, continue with normal search
+        for name in names_to_search:
+            logger.info(f"\n  Checking {match_type} name: {name}")
+            expected_words = self._split_words(name.lower())
+            logger.info(f"  Split into words: {expected_words}")
+            
+            match_found = False
+            matching_rows = self.search_rows_for_sequential_word_matches(df, expected_words, sheet_index)
+            if not matching_rows.empty:
+                logger.info(f"  ✓ Found {len(matching_rows)} matching rows for name: {name}")
+                account_row = matching_rows.iloc[0]
+                match_found = True
+                self._update_match_status(dropbox_account_info, match_type, name, expected_matches, account_name)
+                logger.info(f"  ✓ Updated match status for {match_type} match")
+                return matching_rows, match_found, sheet_name, account_row
+            else:
+                logger.info(f"  ✗ No matches found for name: {name}")
+
+        
+        logger.info(f"=== No {match_type} matches found in sheet: {sheet_name} ===\n")
+        return pd.DataFrame(), False, "", None
+
+    def _search_for_matches_in_matching_rows(self, matching_rows: pd.DataFrame, names_to_search: List[str], match_type: str, 
+                                           dropbox_account_info: Dict[str, Any], expected_matches: List[str], 
+                                           account_name: str, sheet_name: str, sheet_index: SheetIndex = None,
+                                           row_positions: List[int] = None) -> Tuple[pd.DataFrame, bool, str, pd.Series]:
+        """
+        Search for matches of a specific type in pre-filtered matching rows.
+        
+        Args:
+            matching_rows: DataFrame containing pre-filtered matching rows
+            names_to_search: List of names to search for
+            match_type: Type of match ('expected', 'normalized', or 'swapped')
+            dropbox_account_info: Dictionary containing account info and search results
+            expected_matches: List of expected matches to validate against
+            account_name: Name of the account being searched
+            sheet_name: Name of the sheet being searched
+            sheet_index: Optional row index of the sheet ``matching_rows`` was taken from
+            row_positions: Sheet row positions of ``matching_rows`` (required with ``sheet_index``)
+            
+        Returns:
+            Tuple containing:
+            - DataFrame with matching rows (empty if no match)
+            - Whether a match was found
+            - Name of the sheet where match was found
+            - The matching row (None if no match)
+        """
+        logger.info(f"\n=== Searching for {match_type} names in matching rows: {names_to_search} ===")
+        
+        # Get the last name from the account info
+        last_name = dropbox_account_info['name_parts'].get('last_name', '').lower()
+        
+        # Rows left over from an earlier failed search come back empty; nothing to look up then
+        if sheet_index is not None and row_positions is not None and not matching_rows.empty:
+            position = sheet_index.find_family_row(last_name, row_positions)
+            if position is not None:
+                row = sheet_index.df.iloc[position]
+                logger.info(f"  Found family pattern match in row: {[str(val) for val in row.values]}")
+                self._update_match_status(dropbox_account_info, 'family_pattern', f"{last_name} Family", expected_matches, account_name)
+                return pd.DataFrame([row]), True, sheet_name, row
+            for name in names_to_search:
+                logger.info(f"  {match_type}_name: {name}")
+                expected_words = self._split_words(name.lower())
+                logger.info(f"*expected_words {expected_words}")
+                position = sheet_index.find_sequential_row(expected_words, row_positions)
+                if position is not None:
+                    logger.info(f"  ***Found matching row with {match_type} name: {name}")
+                    row = sheet_index.df.iloc[position]
+                    self._update_match_status(dropbox_account_info, match_type, name, expected_matches, account_name)
+                    return pd.DataFrame([row]), True, sheet_name, row
+            return pd.DataFrame(), False, "", None
+
+        # First check for family pattern matches
+        for _, row in matching_rows.iterrows():
+            row_values = [str(val) for val in row.values]
+            if self._is_family_pattern_match(row_values, last_name):
+                logger.info(f"  Found family pattern match in row: {row_values}")
+                match_found = True
+                self._update_match_status(dropbox_account_info, 'family_pattern', f"{last_name} Family", expected_matches, account_name)
+                return pd.DataFrame([row]), match_found, sheet_name, row
+        
+        # If no family pattern match, continue with normal search
+        for name in names_to_search:
+            logger.info(f"  {match_type}_name: {name}")
+            expected_words = self._split_words(name.lower())
+            logger.info(f"*expected_words {expected_words}")
+            
+            # Search through each matching row
+            for _, row in matching_rows.iterrows():
+                # Convert row to list of lowercase strings
+                row_values = [str(val).lower() for val in row.values]
+                
+                # Check if this row contains the expected words in sequence
+                if self._check_row_for_sequential_words(row_values, expected_words):
+                    logger.info(f"  ***Found matching row with {match_type} name: {name}")
+                    account_row = row
+                    match_found = True
+                    self._update_match_status(dropbox_account_info, match_type, name, expected_matches, account_name)
+                    return pd.DataFrame([row]), match_found, sheet_name, account_row
+        
+        return pd.DataFrame(), False, "", None
+
+    def _new_dropbox_account_info(self, dropbox_account_name_parts: Dict[str, Any]) -> Dict[str, Any]:
+        """Create the empty result structure returned by dropbox_search_account."""
+        return {
+            'name_parts': dropbox_account_name_parts,
+            'search_info': {
+                'status': 'not_found',
+                'matches': [],
+                'search_attempts': [],
+                'timing': {},
+                'match_info': {
+                    'match_status': "No match found",
+                    'total_matches': 0,
+                    'total_partial_matches': 0,
+                    'total_no_matches': 1
+                }
+            },
+            'account_data': {},
+            'drivers_license': {},
+            'drivers_license_info': {
+                'status': 'not_found',
+                'reason': None,
+                'file_path': None,
+                'extraction_errors': []
+            }
+        }
+
+    def _search_holiday_sheet(self, df: pd.DataFrame, sheet_name: str, dropbox_account_info: Dict[str, Any],
+                              account_name: str, sheet_index: SheetIndex = None) -> Tuple[pd.DataFrame, bool, str, pd.Series]:
+        """
+        Search one holiday workbook sheet for an account.
+        
+        Args:
+            df: DataFrame of the sheet
+            sheet_name: Name of the sheet being searched
+            dropbox_account_info: Dictionary containing account info and search results
+            account_name: Name of the account being searched
+            sheet_index: Optional row index of ``df`` used instead of scanning every row
+            
+        Returns:
+            Tuple containing:
+            - DataFrame with matching rows (empty if no match)
+            - Whether a match was found
+            - Name of the sheet where match was found
+            - The matching row (None if no match)
+        """
+        dropbox_account_name_parts = dropbox_account_info['name_parts']
+        last_name = dropbox_account_name_parts.get('last_name', '').lower()
+        expected_matches = dropbox_account_name_parts.get('expected_dropbox_matches', [])
+        account_row = None
+        match_found = False
+        match_sheet = None
+
+        # Search for the last name in any column
+        logger.info(f"Searching for last name: {last_name} in any column of sheet: {sheet_name}")
+        row_positions = None
+        if sheet_index is not None:
+            row_positions = sheet_index.rows_containing(last_name)
+            original_matching_rows = df.iloc[row_positions]
+        else:
+            # Convert all columns to string, clean values, and handle NaN values
+            df_str = df.astype(str).apply(lambda x: x.apply(self._clean_cell_value).str.lower())
+            # Create a mask for rows containing the last name
+            mask = df_str.apply(lambda row: any(last_name in str(cell) for cell in row), axis=1)
+            # Get all matching rows
+            original_matching_rows = df[mask]
+        matching_rows = original_matching_rows
+        logger.info(f"Found last name in rows... {last_name} in {len(matching_rows)} rows")
+        logger.info(f"Found {len(matching_rows)} matching rows for last name {last_name} in sheet: {sheet_name}")
+        if not matching_rows.empty:
+            logger.info("Matching rows found:")
+            for _, row in matching_rows.iterrows():
+                row_values = [str(val) for val in row.values if not pd.isna(val)]
+                logger.info(f"  - {row_values}")
+
+        if not matching_rows.empty:
+            # If we have exactly one matching row for the last name, consider it a valid match
+            if len(matching_rows) == 1 and not match_found:
+                logger.info(f"Found exactly one matching row for last name {last_name} in sheet: {sheet_name}")
+                account_row = matching_rows.iloc[0]
+                match_found = True
+                match_sheet = sheet_name
+                self._update_match_status(dropbox_account_info, 'exact_last_name', last_name, expected_matches, account_name)
+                logger.info(f"  ✓ Updated match status for exact last name match")
+                return matching_rows, match_found, match_sheet, account_row
+
+            # Search for expected matches
+            matching_rows, match_found, match_sheet, account_row = self._search_for_matches_in_matching_rows(
+                matching_rows, expected_matches, 'expected',
+                dropbox_account_info, expected_matches, account_name, sheet_name,
+                sheet_index=sheet_index, row_positions=row_positions
+            )
+            if match_found:
+                return matching_rows, match_found, match_sheet, account_row
+            # Search for normalized names
+            matching_rows, match_found, match_sheet, account_row = self._search_for_matches_in_matching_rows(
+                matching_rows, dropbox_account_name_parts.get('normalized_names', []), 'normalized',
+                dropbox_account_info, expected_matches, account_name, sheet_name,
+                sheet_index=sheet_index, row_positions=row_positions
+            )
+            if match_found:
+                return matching_rows, match_found, match_sheet, account_row
+
+            # Search for swapped names
+            matching_rows, match_found, match_sheet, account_row = self._search_for_matches_in_matching_rows(
+                matching_rows, dropbox_account_name_parts.get('swapped_names', []), 'swapped',
+                dropbox_account_info, expected_matches, account_name, sheet_name,
+                sheet_index=sheet_index, row_positions=row_positions
+            )
+            if match_found:
+                return matching_rows, match_found, match_sheet, account_row
+
+            # If we found rows with last name but no match in expected_dropbox_matches, log warning
+            if expected_matches and not match_found:
+                logger.warning(f"\n=== WARNING: Found rows with last name '{last_name}' but expected_dropbox_matches not working ===")
+                logger.warning(f"Account: {account_name}")
+                logger.warning(f"Sheet: {sheet_name}")
+                logger.warning(f"*Expected matches: {expected_matches}")
+                logger.warning("Matching rows found:")
+                row_values_list = []
+                for _, row in original_matching_rows.iterrows():
+                    row_values = [str(val) for val in row.values if not pd.isna(val)]
+                    logger.warning(f"  - {row_values}")
+                    row_values_list.append(row_values)
+                if len(row_values_list) > 0:
+                    logger.warning(f"\n=== WARNING: Found rows with last name '{last_name}' expected_dropbox_matches: {expected_matches} row_values_list: {row_values_list} ===")
+
+                logger.warning("=== END WARNING ===\n")
+
+        if matching_rows.empty:
+            logger.info(f"No matching rows found for last name: {last_name} in sheet: {sheet_name}, doing more sophisticated search...")
+
+            # Search for expected matches
+            logger.info(f"Searching for expected matches: {expected_matches}")
+            matching_rows, match_found, match_sheet, account_row = self._search_for_matches(
+                df, expected_matches, 'expected',
+                dropbox_account_info, expected_matches, account_name, sheet_name,
+                sheet_index=sheet_index
+            )
+            if match_found:
+                return matching_rows, match_found, match_sheet, account_row
+
+            logger.info(f"Searching for reversed expected matches: {expected_matches}")
+            reversed_expected_matches = []
+            for name in expected_matches:
+                logger.info(f"name: {name}")
+                reversed_name_list = self._split_words(name)[::-1]
+                reversed_name = ' '.join(reversed_name_list)
+                logger.info(f"reversed_name: {reversed_name}")
+                reversed_expected_matches.append(reversed_name)
+            logger.info(f"reversed_expected_matches: {reversed_expected_matches}")
+
+            matching_rows, match_found, match_sheet, account_row = self._search_for_matches(
+                df, reversed_expected_matches, 'expected',
+                dropbox_account_info, expected_matches, account_name, sheet_name,
+                sheet_index=sheet_index
+            )
+            if match_found:
+                return matching_rows, match_found, match_sheet, account_row
+
+            # Search for swapped names
+            logger.info(f"Searching for swapped names: {dropbox_account_name_parts.get('swapped_names', [])}")
+            matching_rows, match_found, match_sheet, account_row = self._search_for_matches(
+                df, dropbox_account_name_parts.get('swapped_names', []), 'swapped',
+                dropbox_account_info, expected_matches, account_name, sheet_name,
+                sheet_index=sheet_index
+            )
+            if match_found:
+                return matching_rows, match_found, match_sheet, account_row
+
+            # Search for normalized names
+            logger.info(f"Searching for normalized names: {dropbox_account_name_parts.get('normalized_names', [])}")
+            matching_rows, match_found, match_sheet, account_row = self._search_for_matches(
+                df, dropbox_account_name_parts.get('normalized_names', []), 'normalized',
+                dropbox_account_info, expected_matches, account_name, sheet_name,
+                sheet_index=sheet_index
+            )
+            if match_found:
+                return matching_rows, match_found, match_sheet, account_row
+
+        return matching_rows, match_found, match_sheet, account_row
+
+    def _extract_holiday_account_data(self, dropbox_account_info: Dict[str, Any], match_sheet: str, account_row: pd.Series) -> None:
+        """
+        Fill account_data from the matched workbook row and mark the search as found.
+        
+        Args:
+            dropbox_account_info: Dictionary containing account info and search results
+            match_sheet: Name of the sheet the row was found in
+            account_row: The matching row
+        """
+        logger.info(f"\nExtracting data from {match_sheet} sheet")
+        if match_sheet == "Client full info":
+            # Extract data from specific columns in "Client full info" sheet
+            dropbox_account_info['account_data'] = {
+                'name': f"{account_row.iloc[0]} {account_row.iloc[1]}",  # First name + Last name
+                'first_name': str(account_row.iloc[0]),
+                'last_name': str(account_row.iloc[1]),
+                'address': str(account_row.iloc[3]),  # Column D
+                'city': str(account_row.iloc[6]),     # Column G
+                'state': str(account_row.iloc[7]),    # Column H
+                'zip': str(account_row.iloc[8])       # Column I
+            }
+            if dropbox_account_info['drivers_license']:
+                dropbox_account_info['account_data']['drivers_license'] = dropbox_account_info['drivers_license']
+            # Update match status
+            dropbox_account_info['search_info']['status'] = 'found'
+            dropbox_account_info['search_info']['match_info']['match_status'] = "Match found"
+            dropbox_account_info['search_info']['match_info']['total_matches'] = 1
+            dropbox_account_info['search_info']['match_info']['total_no_matches'] = 0
+        elif match_sheet == "Client Mailing List":
+            # Extract data from Client Mailing List sheet using row values directly
+            row_values = [str(val) if not pd.isna(val) else '' for val in account_row.values]
+            logger.info(f"row_values: {row_values}")
+            dropbox_account_info['account_data'] = {
+                'name': f"{row_values[2]} {row_values[1]}".strip(),  # First name + Last name
+                'first_name': row_values[2],
+                'last_name': row_values[1],
+                'address': row_values[3],
+                'city': row_values[5],
+                'state': row_values[6],
+                'zip': row_values[7],
+                'email': row_values[11],
+                'phone': row_values[10]
+            }
+
+            if dropbox_account_info['drivers_license']:
+                dropbox_account_info['account_data']['drivers_license'] = dropbox_account_info['drivers_license']
+            # Update match status
+            dropbox_account_info['search_info']['status'] = 'found'
+            dropbox_account_info['search_info']['match_info']['match_status'] = "Match found"
+            dropbox_account_info['search_info']['match_info']['total_matches'] = 1
+            dropbox_account_info['search_info']['match_info']['total_no_matches'] = 0
+        else:
+            # Extract data from standard sheet format
+            dropbox_account_info['account_data'] = {
+                'name': str(account_row.get('Name', '')),
+                'first_name': str(account_row.get('First Name', '')),
+                'last_name': str(account_row.get('Last Name', '')),
+                'address': str(account_row.get('Address', '')),
+                'city': str(account_row.get('City', '')),
+                'state': str(account_row.get('State', '')),
+                'zip': str(account_row.get('Zip', '')),
+                'email': str(account_row.get('Email', '')),
+                'phone': str(account_row.get('Phone', '')) if 'Phone' in account_row else ''
+            }
+            if dropbox_account_info['drivers_license']:
+                dropbox_account_info['account_data']['drivers_license'] = dropbox_account_info['drivers_license']
+            # Update match status
+            dropbox_account_info['search_info']['status'] = 'found'
+            dropbox_account_info['search_info']['match_info']['match_status'] = "Match found"
+            dropbox_account_info['search_info']['match_info']['total_matches'] = 1
+            dropbox_account_info['search_info']['match_info']['total_no_matches'] = 0
+
+    def _log_holiday_no_match(self, dropbox_account_info: Dict[str, Any], account_name: str, excel_file: ParsedWorkbook) -> None:
+        """
+        Log why no holiday workbook row matched an account.
+        
+        Args:
+            dropbox_account_info: Dictionary containing account info and search results
+            account_name: Name of the account being searched
+            excel_file: The parsed workbook (or pd.ExcelFile) that was searched
+        """
+        dropbox_account_name_parts = dropbox_account_info['name_parts']
+        last_name = dropbox_account_name_parts.get('last_name', '').lower()
+        sheets = excel_file.sheet_names
+
+        # Log to analyzer.log
+        logger.info("\n*=== DROPBOX SEARCH - NO MATCH EXPLANATION ===")
+        logger.info(f"Account: {account_name}")
+        logger.info(f"Last name searched: {dropbox_account_name_parts.get('last_name', '')}")
+        logger.info(f"Normalized names: {dropbox_account_name_parts.get('normalized_names', [])}")
+        logger.info(f"**Expected matches: {dropbox_account_name_parts.get('expected_dropbox_matches', [])}")
+        logger.info(f"Found matches: {dropbox_account_info['search_info']['matches']}")
+        logger.info("\nSearch process:")
+        for sheet_name in sheets:
+            df = excel_file.parse(sheet_name)
+            logger.info(f"\nSheet: {sheet_name}")
+            logger.info(f"  - Dimensions: {df.shape[0]} rows x {df.shape[1]} columns")
+            # logger.info(f"  - Columns: {list(df.columns)}")
+            # logger.info(f"  - First row values: {[str(val) for val in df.iloc[0].values]}")
+            logger.info(f"  - Search method: Searched for last name '{last_name}' in all columns")
+            # Search for the last name in this sheet
+            if isinstance(excel_file, ParsedWorkbook):
+                matching_rows = df.iloc[excel_file.get_sheet_index(sheet_name).rows_containing(last_name)]
+            else:
+                df_str = df.astype(str).apply(lambda x: x.apply(self._clean_cell_value).str.lower())
+                mask = df_str.apply(lambda row: any(last_name in str(cell) for cell in row), axis=1)
+                matching_rows = df[mask]
+            if not matching_rows.empty:
+                logger.info(f"  - Found {len(matching_rows)} matching rows:")
+                for _, row in matching_rows.iterrows():
+                    row_values = [str(val) for val in row.values if not pd.isna(val)]
+                    logger.info(f"    * {row_values}")
+            else:
+                logger.info(f"  - Result: No matches found")
+        logger.info("=== END NO MATCH EXPLANATION ===\n")
+
+        # Log to report.log (without the detailed search process)
+        report_logger = logging.getLogger('report')
+        report_logger.info("\n=== DROPBOX SEARCH - NO MATCH EXPLANATION ===")
+        report_logger.info(f"Account: {account_name}")
+        report_logger.info(f"Last name searched: {dropbox_account_name_parts.get('last_name', '')}")
+        report_logger.info(f"Normalized names: {dropbox_account_name_parts.get('normalized_names', [])}")
+        report_logger.info(f"***Expected matches: {dropbox_account_name_parts.get('expected_dropbox_matches', [])}")
+        report_logger.info(f"Found matches: {dropbox_account_info['search_info']['matches']}")
+        report_logger.info("=== END NO MATCH EXPLANATION ===\n")
+
+
+def match_accounts_in_sheet(sheet_name: str, df: pd.DataFrame,
+                            accounts: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[bool, Optional[Dict[str, Any]], Optional[pd.Series]]]:
+    """
+    Search one sheet for every account (run in a worker process by the bulk search).
+
+    Args:
+        sheet_name: Name of the sheet
+        df: DataFrame of the sheet
+        accounts: (account_name, name_parts) pairs as produced by extract_name_parts
+
+    Returns:
+        List[Tuple]: Per account, in input order: whether the sheet matched, the search_info
+        recorded for the match (None otherwise) and the matching row (None otherwise)
+    """
+    matcher = HolidaySearchMixin()
+    sheet_index = SheetIndex(df)
+    results = []
+    for account_name, dropbox_account_name_parts in accounts:
+        dropbox_account_info = matcher._new_dropbox_account_info(dropbox_account_name_parts)
+        _, match_found, _, account_row = matcher._search_holiday_sheet(
+            df, sheet_name, dropbox_account_info, account_name, sheet_index
+        )
+        if match_found and account_row is not None:
+            results.append((True, dropbox_account_info['search_info'], account_row))
+        else:
+            results.append((False, None, None))
+    return results
@@ -0,0 +1,163 @@
+"""SQLite cache of Dropbox folder metadata used to warm-start the tree index."""
+
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+from dropbox.files import FileMetadata, FolderMetadata
+
+from .tree_index import DropboxTreeIndex, normalize_index_path
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    root TEXT PRIMARY KEY,
+    cursor TEXT NOT NULL,
+    built_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    root TEXT NOT NULL,
+    path_lower TEXT NOT NULL,
+    parent_lower TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    path_display TEXT,
+    id TEXT,
+    rev TEXT,
+    content_hash TEXT,
+    size INTEGER,
+    client_modified TEXT,
+    server_modified TEXT,
+    PRIMARY KEY (root, path_lower)
+);
+CREATE INDEX IF NOT EXISTS entries_parent ON entries (root, parent_lower);
+"""
+
+
+def _metadata_to_row(root: str, entry) -> Optional[tuple]:
+    """Convert a FileMetadata/FolderMetadata entry into an entries table row."""
+    path_lower = normalize_index_path(entry.path_lower)
+    parent_lower = os.path.dirname(path_lower)
+    if isinstance(entry, FolderMetadata):
+        return (root, path_lower, parent_lower, 'folder', entry.name, entry.path_display, entry.id,
+                None, None, None, None, None)
+    if isinstance(entry, FileMetadata):
+        return (root, path_lower, parent_lower, 'file', entry.name, entry.path_display, entry.id,
+                entry.rev, entry.content_hash, entry.size,
+                entry.client_modified.isoformat() if entry.client_modified else None,
+                entry.server_modified.isoformat() if entry.server_modified else None)
+    return None
+
+
+def _row_to_metadata(row: sqlite3.Row):
+    """Rebuild a FileMetadata/FolderMetadata entry from an entries table row."""
+    if row['kind'] == 'folder':
+        return FolderMetadata(name=row['name'], id=row['id'], path_lower=row['path_lower'],
+                              path_display=row['path_display'])
+    return FileMetadata(
+        name=row['name'],
+        id=row['id'],
+        client_modified=datetime.fromisoformat(row['client_modified']),
+        server_modified=datetime.fromisoformat(row['server_modified']),
+        rev=row['rev'],
+        size=row['size'],
+        path_lower=row['path_lower'],
+        path_display=row['path_display'],
+        content_hash=row['content_hash'],
+    )
+
+
+class DropboxMetadataCache:
+    """
+    Persist tree index snapshots (path, rev, content_hash, size, server_modified) in SQLite.
+
+    A saved snapshot is always revalidated with its saved cursor before it is used, so
+    only the changes since then are fetched.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def load_index(self, root_path: str) -> Optional[DropboxTreeIndex]:
+        """
+        Load the saved snapshot for a root folder.
+
+        Args:
+            root_path: Dropbox root folder
+
+        Returns:
+            Optional[DropboxTreeIndex]: The restored index, or None if nothing is saved
+        """
+        root = normalize_index_path(root_path)
+        try:
+            with self._connect() as conn:
+                snapshot = conn.execute('SELECT cursor, built_at FROM snapshots WHERE root = ?', (root,)).fetchone()
+                if not snapshot:
+                    return None
+                rows = conn.execute('SELECT * FROM entries WHERE root = ? ORDER BY rowid', (root,)).fetchall()
+            index = DropboxTreeIndex(root_path)
+            index.restore([_row_to_metadata(row) for row in rows], snapshot['cursor'], snapshot['built_at'])
+            logger.info(f"Loaded {len(rows)} cached Dropbox entries for {root_path} "
+                        f"(age: {time.time() - snapshot['built_at']:.0f} seconds)")
+            return index
+        except Exception as e:
+            logger.warning(f"Could not load Dropbox metadata cache for {root_path}: {str(e)}")
+            return None
+
+    def save_index(self, index: DropboxTreeIndex) -> bool:
+        """
+        Replace the saved snapshot for the index root with the current index contents.
+
+        Args:
+            index: A built tree index
+
+        Returns:
+            bool: True if the snapshot was saved, False otherwise
+        """
+        if not index.is_built():
+            return False
+        root = index.root_key
+        try:
+            rows = [row for row in (_metadata_to_row(root, entry) for entry in index.entries.values()) if row]
+            with self._connect() as conn:
+                conn.execute('DELETE FROM entries WHERE root = ?', (root,))
+                conn.executemany('INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+                conn.execute('INSERT OR REPLACE INTO snapshots (root, cursor, built_at) VALUES (?, ?, ?)',
+                             (root, index.cursor, index.built_at))
+            logger.info(f"Saved {len(rows)} Dropbox entries for {index.root_path} to {self.db_path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not save Dropbox metadata cache for {index.root_path}: {str(e)}")
+            return False
+
+    def clear(self, root_path: str = None) -> None:
+        """Drop the saved snapshot for one root folder, or for all of them."""
+        with self._connect() as conn:
+            if root_path:
+                root = normalize_index_path(root_path)
+                conn.execute('DELETE FROM entries WHERE root = ?', (root,))
+                conn.execute('DELETE FROM snapshots WHERE root = ?', (root,))
+            else:
+                conn.execute('DELETE FROM entries')
+                conn.execute('DELETE FROM snapshots')
@@ -0,0 +1,108 @@
+"""SQLite cache of driver's license OCR results keyed by file content hash."""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from src.config import DL_OCR_CACHE_DB
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever preprocessing, Tesseract configs or parsing change, so stale results are not reused
+DL_OCR_PIPELINE_VERSION = '4'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ocr_results (
+    content_hash TEXT NOT NULL,
+    pipeline_version TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (content_hash, pipeline_version)
+);
+"""
+
+
+class OcrResultCache:
+    """
+    Persist parsed driver's license fields per (content hash, pipeline version).
+
+    The content hash is the Dropbox ``content_hash`` of the file, so a lookup can be made
+    from file metadata alone, before the file is downloaded.
+    """
+
+    def __init__(self, db_path: str = DL_OCR_CACHE_DB, pipeline_version: str = DL_OCR_PIPELINE_VERSION):
+        self.db_path = db_path
+        self.pipeline_version = pipeline_version
+        self.hits = 0
+        self.misses = 0
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, content_hash: str) -> Optional[Dict[str, str]]:
+        """
+        Look up the OCR result for a file.
+
+        Args:
+            content_hash: Dropbox content_hash of the file
+
+        Returns:
+            Optional[Dict[str, str]]: The cached fields (possibly empty), or None on a miss
+        """
+        if not content_hash:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT result FROM ocr_results WHERE content_hash = ? AND pipeline_version = ?',
+                    (content_hash, self.pipeline_version)
+                ).fetchone()
+        except Exception as e:
+            logger.warning(f"Could not read OCR cache {self.db_path}: {str(e)}")
+            return None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, content_hash: str, result: Dict[str, str]) -> None:
+        """
+        Store the OCR result for a file.
+
+        Args:
+            content_hash: Dropbox content_hash of the file
+            result: Parsed driver's license fields
+        """
+        if not content_hash:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO ocr_results (content_hash, pipeline_version, result, created_at) '
+                    'VALUES (?, ?, ?, ?)',
+                    (content_hash, self.pipeline_version, json.dumps(result), time.time())
+                )
+        except Exception as e:
+            logger.warning(f"Could not write OCR cache {self.db_path}: {str(e)}")
+
+    def clear(self) -> None:
+        """Drop all cached OCR results."""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM ocr_results')
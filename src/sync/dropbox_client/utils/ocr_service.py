@@ -0,0 +1,105 @@
+"""Background driver's license OCR on a process pool, pipelined with the account loop."""
+
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Dict, Optional, Tuple
+
+from .dl_ocr import extract_dl_fields
+from src.config import DL_OCR_WORKERS, DL_OCR_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class DlOcrService:
+    """
+    Run driver's license OCR in worker processes while the caller keeps working.
+
+    Files are submitted per account as soon as they are available locally, and the result
+    is collected with ``result`` when the account needs it. Tesseract and pdf2image then
+    run on every core while the main process drives the browser.
+
+    Create the service on the main thread: files are submitted from the prefetch worker
+    threads, and workers are started with ``spawn`` so a child never inherits a lock held
+    by another thread (logging, executors, connection pools) at fork time.
+    """
+
+    def __init__(self, max_workers: int = DL_OCR_WORKERS, ocr_debug: bool = False):
+        self.max_workers = max_workers
+        self.ocr_debug = ocr_debug
+        self._executor: Optional[ProcessPoolExecutor] = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+        self._pending: Dict[str, Tuple[Optional[str], Future, float]] = {}
+        self._lock = threading.Lock()
+        self._timed_out = False
+        logger.info(f"Started driver's license OCR pool with {max_workers} workers")
+
+    def submit(self, account_name: str, file_path: str, content_hash: Optional[str] = None) -> None:
+        """
+        Start OCR of an account's driver's license in the background.
+
+        Args:
+            account_name: Account folder name the result is collected under
+            file_path: Local path to the driver's license file
+            content_hash: Dropbox content_hash of the file, returned with the result for caching
+        """
+        with self._lock:
+            if account_name in self._pending:
+                return
+            if self._executor is None:
+                logger.warning(f"Driver's license OCR pool is shut down, not submitting {file_path}")
+                return
+            future = self._executor.submit(extract_dl_fields, file_path, self.ocr_debug)
+            self._pending[account_name] = (content_hash, future, time.time())
+        logger.debug(f"Submitted driver's license OCR for {account_name}: {file_path}")
+
+    def is_pending(self, account_name: str) -> bool:
+        """Return True if OCR was submitted for the account and not collected yet."""
+        with self._lock:
+            return account_name in self._pending
+
+    def result(self, account_name: str, timeout: float = DL_OCR_TIMEOUT) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+        """
+        Wait for an account's OCR result and stop tracking it.
+
+        Args:
+            account_name: Account folder name passed to ``submit``
+            timeout: Seconds to wait before giving up, so a hung OCR process cannot block the caller
+
+        Returns:
+            Tuple[Optional[str], Optional[Dict[str, str]]]: The file's content_hash and the
+            extracted fields, or None for the fields if the OCR failed or timed out
+        """
+        with self._lock:
+            content_hash, future, submitted_at = self._pending.pop(account_name)
+        wait_start = time.time()
+        try:
+            dl_info = future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            self._timed_out = True
+            logger.error(f"Background driver's license OCR for {account_name} did not finish in {timeout} seconds")
+            return content_hash, None
+        except Exception as e:
+            logger.error(f"Background driver's license OCR failed for {account_name}: {str(e)}")
+            return content_hash, None
+        logger.info(f"Driver's license OCR for {account_name} finished "
+                    f"{time.time() - submitted_at:.2f} seconds after submission "
+                    f"(waited {time.time() - wait_start:.2f} seconds)")
+        return content_hash, dl_info
+
+    def shutdown(self) -> None:
+        """Cancel OCR that has not started and stop the worker processes."""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            pending = self._pending
+            self._pending = {}
+        # Cancel by hand: shutdown(cancel_futures=True) needs Python 3.9
+        for _, future, _ in pending.values():
+            future.cancel()
+        if executor is not None:
+            # Do not wait for a process that already failed to finish in time
+            executor.shutdown(wait=not self._timed_out)
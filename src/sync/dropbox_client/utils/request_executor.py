@@ -0,0 +1,170 @@
+"""Rate-limit-aware executor for concurrent Dropbox API calls."""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Tuple
+
+import requests
+from dropbox.exceptions import HttpError, InternalServerError, RateLimitError
+
+from src.config import DROPBOX_MAX_WORKERS, DROPBOX_REQUESTS_PER_SECOND, MAX_RETRIES
+
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying with exponential backoff (network hiccups and 5xx responses)
+TRANSIENT_ERRORS = (
+    InternalServerError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how many requests start per second."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds (shared by all threads)."""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now >= self.paused_until:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                    self.updated_at = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    self.updated_at = now
+                    wait = self.paused_until - now
+            time.sleep(wait)
+
+
+class DropboxRequestExecutor:
+    """
+    Run Dropbox calls on a bounded thread pool behind a shared token bucket.
+
+    Every call waits for a token before it starts. A ``RateLimitError`` pauses the whole
+    bucket for the server's ``backoff`` (Retry-After) before retrying, so concurrent workers
+    back off together. Transient network and 5xx errors are retried with jittered exponential
+    backoff. Other errors are raised to the caller unchanged.
+    """
+
+    def __init__(self, max_workers: int = DROPBOX_MAX_WORKERS, requests_per_second: float = DROPBOX_REQUESTS_PER_SECOND,
+                 max_retries: int = MAX_RETRIES, base_delay: float = 1.0, max_delay: float = 60.0):
+        self.max_workers = max(1, max_workers)
+        self.bucket = TokenBucket(requests_per_second)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='dropbox')
+            return self._pool
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call a Dropbox API function on the current thread with rate limiting and retries.
+
+        Args:
+            func: The Dropbox API function to call
+            *args: Arguments to pass to the function
+            **kwargs: Keyword arguments to pass to the function
+
+        Returns:
+            The result of the API call
+        """
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                return func(*args, **kwargs)
+            except RateLimitError as e:
+                delay = e.backoff if e.backoff is not None else self._backoff_delay(attempt + 1)
+                if attempt >= self.max_retries:
+                    raise
+                logger.warning(f"Dropbox rate limit hit in {getattr(func, '__name__', func)}, "
+                               f"pausing requests for {delay:.1f} seconds")
+                self.bucket.pause(delay)
+            except TRANSIENT_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"Transient Dropbox error in {getattr(func, '__name__', func)}: {str(e)}, "
+                               f"retrying in {delay:.1f} seconds")
+                time.sleep(delay)
+            except HttpError as e:
+                if e.status_code < 500 or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"Dropbox HTTP {e.status_code} in {getattr(func, '__name__', func)}, "
+                               f"retrying in {delay:.1f} seconds")
+                time.sleep(delay)
+            attempt += 1
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Schedule a rate-limited call on the thread pool and return its future."""
+        return self._get_pool().submit(self.call, func, *args, **kwargs)
+
+    def run_all(self, func: Callable, items: Iterable[Any]) -> List[Tuple[Any, Any, Exception]]:
+        """
+        Run ``func(item)`` for every item on the thread pool.
+
+        ``func`` is a plain callable that issues its own requests through ``call``, so one
+        task can combine several Dropbox calls (e.g. list a folder, then download its files).
+
+        Args:
+            func: Callable taking one item
+            items: Items to process
+
+        Returns:
+            List[Tuple]: (item, result, error) per item in input order; error is None on success
+        """
+        items = list(items)
+        futures = [self._get_pool().submit(func, item) for item in items]
+        results = []
+        for item, future in zip(items, futures):
+            try:
+                results.append((item, future.result(), None))
+            except Exception as e:
+                logger.error(f"Dropbox task failed for {item}: {str(e)}")
+                results.append((item, None, e))
+        return results
+
+    def shutdown(self) -> None:
+        """Wait for running tasks and release the worker threads."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -0,0 +1,142 @@
+"""Persisted list_folder cursors for incremental Dropbox runs."""
+
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Callable, List, Optional, Set, Tuple
+
+import dropbox
+from dropbox.exceptions import ApiError
+
+from .tree_index import normalize_index_path
+from src.config import DROPBOX_SYNC_STATE_FILE
+
+logger = logging.getLogger(__name__)
+
+
+def _read_state(state_file: str) -> dict:
+    """Read the whole state file, returning an empty dict if it is missing or invalid."""
+    if not os.path.exists(state_file):
+        return {}
+    try:
+        with open(state_file, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Could not read Dropbox sync state from {state_file}: {str(e)}")
+        return {}
+
+
+def _state_key(root_path: str, scope: str) -> str:
+    """Build the state file key for a root folder and the command that owns the cursor."""
+    return f"{scope}:{normalize_index_path(root_path)}"
+
+
+def load_sync_state(root_path: str, scope: str = 'cmd_runner', state_file: str = DROPBOX_SYNC_STATE_FILE) -> dict:
+    """
+    Load the saved sync state for a root folder.
+
+    Args:
+        root_path: Dropbox root folder the cursor was taken for
+        scope: Command owning the cursor, so each command tracks its own changes
+        state_file: Path to the JSON state file
+
+    Returns:
+        dict: State with 'cursor', 'pending_folders' and 'updated_at' keys (empty if none saved)
+    """
+    return _read_state(state_file).get(_state_key(root_path, scope), {})
+
+
+def save_sync_state(root_path: str, cursor: str, pending_folders: List[str] = None,
+                    scope: str = 'cmd_runner', state_file: str = DROPBOX_SYNC_STATE_FILE) -> bool:
+    """
+    Save the cursor for a root folder, together with folders still waiting to be processed.
+
+    Args:
+        root_path: Dropbox root folder the cursor was taken for
+        cursor: Cursor from a recursive files_list_folder call on the root
+        pending_folders: Account folders that changed but were not processed successfully
+        scope: Command owning the cursor, so each command tracks its own changes
+        state_file: Path to the JSON state file
+
+    Returns:
+        bool: True if the state was written, False otherwise
+    """
+    try:
+        state = _read_state(state_file)
+        state[_state_key(root_path, scope)] = {
+            'cursor': cursor,
+            'pending_folders': sorted(set(pending_folders or [])),
+            'updated_at': datetime.now().isoformat(),
+        }
+        state_dir = os.path.dirname(state_file)
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+        temp_file = f"{state_file}.tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp_file, state_file)
+        logger.info(f"Saved Dropbox sync cursor for {root_path} to {state_file}")
+        return True
+    except Exception as e:
+        logger.error(f"Error saving Dropbox sync state to {state_file}: {str(e)}")
+        return False
+
+
+def account_name_for_path(root_path: str, path_display: str) -> Optional[str]:
+    """
+    Get the account folder name (first path component below the root) for a changed entry.
+
+    Args:
+        root_path: Dropbox root folder
+        path_display: Display path of the changed entry
+
+    Returns:
+        Optional[str]: Account folder name, or None if the entry is not below the root
+    """
+    root_key = normalize_index_path(root_path)
+    if not path_display or not normalize_index_path(path_display).startswith(root_key + '/'):
+        return None
+    relative = '/' + path_display.strip('/')
+    relative = relative[len(root_key) + 1:]
+    return relative.split('/', 1)[0] or None
+
+
+def get_changed_account_names(dbx: dropbox.Dropbox, root_path: str, cursor: str,
+                              request: Callable = None) -> Tuple[Optional[Set[str]], Optional[str]]:
+    """
+    Collect the account folders touched since a saved cursor.
+
+    Args:
+        dbx: Dropbox client instance
+        root_path: Dropbox root folder the cursor was taken for
+        cursor: Cursor saved by a previous run
+        request: Optional wrapper used to issue API calls (e.g. DropboxClient._make_request)
+
+    Returns:
+        Tuple[Optional[Set[str]], Optional[str]]: Names of changed account folders and the new
+        cursor, or (None, None) if the cursor is no longer valid and a full run is needed
+    """
+    request = request or (lambda func, *args, **kwargs: func(*args, **kwargs))
+    changed = set()
+    total_entries = 0
+    try:
+        has_more = True
+        while has_more:
+            result = request(dbx.files_list_folder_continue, cursor)
+            for entry in result.entries:
+                total_entries += 1
+                account_name = account_name_for_path(root_path, entry.path_display)
+                if account_name:
+                    changed.add(account_name)
+            cursor = result.cursor
+            has_more = result.has_more
+        logger.info(f"Found {total_entries} changed entries in {len(changed)} account folders since last run")
+        return changed, cursor
+    except ApiError as e:
+        is_reset = getattr(e.error, 'is_reset', None)
+        if is_reset is not None and is_reset():
+            logger.warning("Saved Dropbox cursor was reset by the server, a full run is required")
+        else:
+            logger.error(f"Error reading Dropbox changes for {root_path}: {str(e)}")
+        return None, None
@@ -0,0 +1,222 @@
+"""In-memory index of a Dropbox folder tree built from a single recursive listing."""
+
+import logging
+import posixpath
+import time
+from typing import Callable, Dict, List, Optional
+
+import dropbox
+from dropbox.files import DeletedMetadata, FolderMetadata
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_index_path(path: str) -> str:
+    """
+    Normalize a Dropbox path into the lower-cased form used as index key.
+
+    Args:
+        path (str): Dropbox path, with or without leading/trailing slashes
+
+    Returns:
+        str: Lower-cased path with a single leading slash and no trailing slash
+    """
+    if not path:
+        return ''
+    path = '/' + path.strip().strip('/')
+    while '//' in path:
+        path = path.replace('//', '/')
+    return path.rstrip('/').lower()
+
+
+class DropboxTreeIndex:
+    """
+    Snapshot of every entry below a root folder, keyed by lower-cased path.
+
+    The index is filled from one paginated ``files_list_folder(root, recursive=True)``
+    walk, after which folder listings, account folder names and file lookups are
+    answered locally instead of with one ``files_list_folder`` call per folder.
+    """
+
+    def __init__(self, root_path: str):
+        self.root_path = root_path
+        self.root_key = normalize_index_path(root_path)
+        self.entries: Dict[str, object] = {}
+        self.children: Dict[str, List[str]] = {}
+        self.stale_folders = set()
+        self.cursor: Optional[str] = None
+        self.built_at: Optional[float] = None
+
+    def build(self, dbx: dropbox.Dropbox, request: Callable = None) -> bool:
+        """
+        Populate the index with one recursive listing of the root folder.
+
+        Args:
+            dbx: Dropbox client instance
+            request: Optional wrapper used to issue API calls (e.g. DropboxClient._make_request)
+
+        Returns:
+            bool: True if the whole tree was listed, False otherwise
+        """
+        request = request or (lambda func, *args, **kwargs: func(*args, **kwargs))
+        start_time = time.time()
+        try:
+            self.entries = {}
+            self.children = {self.root_key: []}
+            self.stale_folders = set()
+            result = request(dbx.files_list_folder, self.root_path, recursive=True)
+            self.apply_entries(result.entries)
+            pages = 1
+            while result.has_more:
+                result = request(dbx.files_list_folder_continue, result.cursor)
+                self.apply_entries(result.entries)
+                pages += 1
+            self.cursor = result.cursor
+            self.built_at = time.time()
+            logger.info(f"Built Dropbox tree index for {self.root_path}: {len(self.entries)} entries "
+                        f"in {pages} page(s), {self.built_at - start_time:.2f} seconds")
+            return True
+        except Exception as e:
+            logger.error(f"Error building Dropbox tree index for {self.root_path}: {str(e)}")
+            self.entries = {}
+            self.children = {}
+            self.cursor = None
+            self.built_at = None
+            return False
+
+    def restore(self, entries: List[object], cursor: str, built_at: float) -> None:
+        """
+        Rebuild the index from previously saved entries without calling the API.
+
+        Args:
+            entries: Metadata entries saved from an earlier snapshot
+            cursor: Cursor of the saved snapshot
+            built_at: Time the saved snapshot was taken
+        """
+        self.entries = {}
+        self.children = {self.root_key: []}
+        self.stale_folders = set()
+        self.apply_entries(entries)
+        self.cursor = cursor
+        self.built_at = built_at
+
+    def update(self, dbx: dropbox.Dropbox, request: Callable = None) -> Optional[List[object]]:
+        """
+        Bring the snapshot up to date by reading the changes since its cursor.
+
+        Args:
+            dbx: Dropbox client instance
+            request: Optional wrapper used to issue API calls (e.g. DropboxClient._make_request)
+
+        Returns:
+            Optional[List]: The changed entries (possibly empty), or None if the cursor
+            could not be continued and the index must be rebuilt
+        """
+        if not self.cursor:
+            return None
+        request = request or (lambda func, *args, **kwargs: func(*args, **kwargs))
+        changes = []
+        try:
+            cursor = self.cursor
+            has_more = True
+            while has_more:
+                result = request(dbx.files_list_folder_continue, cursor)
+                changes.extend(result.entries)
+                cursor = result.cursor
+                has_more = result.has_more
+            self.apply_entries(changes)
+            self.stale_folders = set()
+            self.cursor = cursor
+            self.built_at = time.time()
+            logger.info(f"Updated Dropbox tree index for {self.root_path} with {len(changes)} changed entries")
+            return changes
+        except Exception as e:
+            logger.warning(f"Could not update Dropbox tree index for {self.root_path}: {str(e)}")
+            return None
+
+    def is_built(self) -> bool:
+        """Return True once the index holds a complete snapshot."""
+        return self.built_at is not None
+
+    def apply_entries(self, entries: List[object]) -> None:
+        """
+        Add, replace or remove entries returned by a list_folder call.
+
+        Args:
+            entries: FileMetadata, FolderMetadata or DeletedMetadata entries
+        """
+        for entry in entries:
+            key = entry.path_lower
+            if key is None:
+                continue
+            key = normalize_index_path(key)
+            if key == self.root_key:
+                continue
+            if isinstance(entry, DeletedMetadata):
+                self.remove_entry(key)
+                continue
+            parent = posixpath.dirname(key)
+            siblings = self.children.setdefault(parent, [])
+            if key not in self.entries:
+                siblings.append(key)
+            self.entries[key] = entry
+            if isinstance(entry, FolderMetadata):
+                self.children.setdefault(key, [])
+
+    def remove_entry(self, key: str) -> None:
+        """Remove an entry and, for folders, everything below it."""
+        key = normalize_index_path(key)
+        for child in list(self.children.get(key, [])):
+            self.remove_entry(child)
+        self.children.pop(key, None)
+        if self.entries.pop(key, None) is not None:
+            siblings = self.children.get(posixpath.dirname(key), [])
+            if key in siblings:
+                siblings.remove(key)
+
+    def contains(self, path: str) -> bool:
+        """Return True if the path lies at or below the indexed root."""
+        key = normalize_index_path(path)
+        return key == self.root_key or key.startswith(self.root_key + '/')
+
+    def mark_stale(self, path: str) -> None:
+        """
+        Mark a folder as changed outside the index so listings fall back to the API.
+
+        Stale marks are not saved with the snapshot: a loaded snapshot is always updated
+        from its cursor, which brings in the folder's new contents.
+
+        Args:
+            path: Dropbox folder path that was modified (moves, copies, uploads)
+        """
+        key = normalize_index_path(path)
+        if self.contains(key):
+            self.stale_folders.add(key)
+
+    def get_entry(self, path: str) -> Optional[object]:
+        """Return the metadata for a path, or None if it is not indexed."""
+        return self.entries.get(normalize_index_path(path))
+
+    def list_folder(self, path: str) -> Optional[List[object]]:
+        """
+        Return the direct children of a folder from the snapshot.
+
+        Args:
+            path: Dropbox folder path
+
+        Returns:
+            Optional[List]: Child metadata entries, an empty list for a folder that does not
+            exist below the root, or None when the index cannot answer (not built, path
+            outside the root, or folder marked stale)
+        """
+        if not self.is_built():
+            return None
+        key = normalize_index_path(path)
+        if not self.contains(key) or key in self.stale_folders:
+            return None
+        return [self.entries[child] for child in self.children.get(key, [])]
+
+    def account_names(self) -> List[str]:
+        """Return the names of the folders directly below the root."""
+        entries = self.list_folder(self.root_key) or []
+        return [entry.name for entry in entries if isinstance(entry, FolderMetadata)]
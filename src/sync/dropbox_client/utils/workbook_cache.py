@@ -0,0 +1,200 @@
+"""Parsed holiday workbook cache keyed by the Dropbox file revision."""
+
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from dropbox.files import FileMetadata
+
+from .holiday_index import SheetIndex
+from src.config import HOLIDAY_WORKBOOK_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = 'manifest.json'
+
+
+class ParsedWorkbook:
+    """
+    Every sheet of an Excel workbook parsed once into DataFrames.
+
+    Exposes ``sheet_names`` and ``parse(sheet_name)`` like ``pd.ExcelFile``, so code that
+    reads sheets works with either object. Returned DataFrames are shared; callers must
+    not modify them in place.
+    """
+
+    def __init__(self, name: str, rev: Optional[str], sheets: Dict[str, pd.DataFrame], source_path: str = None):
+        self.name = name
+        self.rev = rev
+        self.sheets = sheets
+        self.source_path = source_path
+        self._indexes: Dict[str, SheetIndex] = {}
+        self._index_lock = threading.Lock()
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self.sheets)
+
+    def parse(self, sheet_name: str) -> pd.DataFrame:
+        """Return the parsed DataFrame for a sheet."""
+        return self.sheets[sheet_name]
+
+    def get_sheet_index(self, sheet_name: str) -> SheetIndex:
+        """Return the row index for a sheet, building it on first use."""
+        with self._index_lock:
+            if sheet_name not in self._indexes:
+                logger.info(f"Building row index for sheet: {sheet_name}")
+                self._indexes[sheet_name] = SheetIndex(self.sheets[sheet_name])
+            return self._indexes[sheet_name]
+
+
+def _safe_name(name: str) -> str:
+    """Turn a workbook name into a directory name."""
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', name).strip('_') or 'workbook'
+
+
+def _restore_missing_values(df: pd.DataFrame) -> pd.DataFrame:
+    """Map the nulls parquet returns in object columns back to NaN, as read_excel produces them."""
+    for column in df.columns:
+        if df[column].dtype == object:
+            df[column] = df[column].where(df[column].notna(), np.nan)
+    return df
+
+
+class WorkbookCache:
+    """
+    Keep parsed workbooks in memory for the run and on disk across runs.
+
+    Each revision is stored under ``<cache_dir>/<workbook>/<rev>/`` as one parquet file per
+    sheet (pickle when a sheet cannot be written as parquet, e.g. mixed-type columns or
+    non-string headers) plus a manifest recording the sheet order. Older revisions of the
+    same workbook are removed when a new one is saved.
+    """
+
+    def __init__(self, cache_dir: str = HOLIDAY_WORKBOOK_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._workbooks: Dict[tuple, ParsedWorkbook] = {}
+        self._lock = threading.Lock()
+
+    def _revision_dir(self, name: str, rev: str) -> str:
+        return os.path.join(self.cache_dir, _safe_name(name), rev)
+
+    def _load_from_disk(self, name: str, rev: str) -> Optional[ParsedWorkbook]:
+        """Load a saved revision, or None if it is missing or unreadable."""
+        revision_dir = self._revision_dir(name, rev)
+        manifest_path = os.path.join(revision_dir, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            sheets = {}
+            for sheet in manifest['sheets']:
+                sheet_path = os.path.join(revision_dir, sheet['file'])
+                if sheet['format'] == 'parquet':
+                    sheets[sheet['name']] = _restore_missing_values(pd.read_parquet(sheet_path))
+                else:
+                    sheets[sheet['name']] = pd.read_pickle(sheet_path)
+            logger.info(f"Loaded parsed workbook {name} (rev {rev}) from {revision_dir}")
+            return ParsedWorkbook(name, rev, sheets, source_path=revision_dir)
+        except Exception as e:
+            logger.warning(f"Could not load parsed workbook {name} (rev {rev}): {str(e)}")
+            return None
+
+    def _save_to_disk(self, workbook: ParsedWorkbook) -> bool:
+        """Persist a parsed workbook and drop older revisions of it."""
+        workbook_dir = os.path.join(self.cache_dir, _safe_name(workbook.name))
+        revision_dir = self._revision_dir(workbook.name, workbook.rev)
+        try:
+            os.makedirs(revision_dir, exist_ok=True)
+            manifest = {'name': workbook.name, 'rev': workbook.rev, 'sheets': []}
+            for index, (sheet_name, df) in enumerate(workbook.sheets.items()):
+                file_name = f"sheet_{index}.parquet"
+                try:
+                    df.to_parquet(os.path.join(revision_dir, file_name))
+                    sheet_format = 'parquet'
+                except (ValueError, TypeError, NotImplementedError) as e:
+                    # Columns pyarrow cannot convert (e.g. mixed object types); a missing parquet
+                    # engine (ImportError) is not caught, so it is reported instead of hidden
+                    logger.debug(f"Sheet {sheet_name} not stored as parquet ({str(e)}), using pickle")
+                    file_name = f"sheet_{index}.pkl"
+                    df.to_pickle(os.path.join(revision_dir, file_name))
+                    sheet_format = 'pickle'
+                manifest['sheets'].append({'name': sheet_name, 'file': file_name, 'format': sheet_format})
+            # The manifest is written last so a partially saved revision is never loaded
+            temp_manifest = os.path.join(revision_dir, f"{MANIFEST_FILE}.tmp")
+            with open(temp_manifest, 'w') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(temp_manifest, os.path.join(revision_dir, MANIFEST_FILE))
+            for entry in os.listdir(workbook_dir):
+                if entry != workbook.rev:
+                    shutil.rmtree(os.path.join(workbook_dir, entry), ignore_errors=True)
+            logger.info(f"Saved parsed workbook {workbook.name} (rev {workbook.rev}) to {revision_dir}")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not save parsed workbook {workbook.name}: {str(e)}")
+            return False
+
+    def load(self, metadata: FileMetadata, download: Callable[[FileMetadata], Optional[str]]) -> Optional[ParsedWorkbook]:
+        """
+        Return the parsed workbook for a Dropbox file revision.
+
+        The in-memory copy is used first, then the on-disk copy for the same ``rev``. Only
+        when neither exists is the file downloaded (through ``download``) and parsed.
+
+        Args:
+            metadata: FileMetadata of the workbook
+            download: Callable returning a local path to the workbook's bytes, or None
+
+        Returns:
+            Optional[ParsedWorkbook]: The parsed workbook, or None if it could not be read
+        """
+        key = (metadata.path_lower or metadata.name, metadata.rev)
+        with self._lock:
+            workbook = self._workbooks.get(key)
+            if workbook is not None:
+                return workbook
+
+            if metadata.rev:
+                workbook = self._load_from_disk(metadata.name, metadata.rev)
+
+            if workbook is None:
+                local_path = download(metadata)
+                if not local_path:
+                    return None
+                try:
+                    excel_file = pd.ExcelFile(local_path)
+                    sheets = {sheet_name: excel_file.parse(sheet_name) for sheet_name in excel_file.sheet_names}
+                except Exception as e:
+                    logger.error(f"Error reading Excel file {metadata.name}: {str(e)}")
+                    return None
+                workbook = ParsedWorkbook(metadata.name, metadata.rev, sheets, source_path=local_path)
+                logger.info(f"Parsed workbook {metadata.name} (rev {metadata.rev}) with sheets: {workbook.sheet_names}")
+                if metadata.rev:
+                    self._save_to_disk(workbook)
+
+            self._workbooks[key] = workbook
+            return workbook
+
+    def clear(self) -> None:
+        """Forget parsed workbooks held in memory and on disk."""
+        with self._lock:
+            self._workbooks = {}
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+_workbook_cache: Optional[WorkbookCache] = None
+
+
+def get_workbook_cache() -> WorkbookCache:
+    """Return the process-wide workbook cache, creating it on first use."""
+    global _workbook_cache
+    if _workbook_cache is None:
+        _workbook_cache = WorkbookCache()
+    return _workbook_cache
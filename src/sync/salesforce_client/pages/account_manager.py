@@ -1,4 +1,4 @@
-from typing import Callable, Optional, Dict, List, Union, Any
+from typing import Callable, Optional, Dict, List, Tuple, Union, Any
 import logging
 import re
 import time
@@ -9,11 +9,14 @@ import traceback
 from . import file_manager
 from .base_page import BasePage
 from playwright.sync_api import Page, TimeoutError
-from src.config import SALESFORCE_URL
+from src.config import SALESFORCE_URL, SALESFORCE_CAPTURE_RESPONSES, SALESFORCE_SEARCH_BACKEND
 import sys
 import os
 from .accounts_page import AccountsPage
 from ..utils.selectors import Selectors
+from ..utils.dom_extract import ACCOUNT_ROW_SELECTOR, extract_account_rows
+from ..utils.response_capture import LIST_VIEW_SOURCES, LightningResponseCapture
+from ..utils.soql_search import SalesforceRestClient, SoqlAccountSearch
 from sync.utils.name_utils import _load_special_cases, _is_special_case, _get_special_case_rules, extract_name_parts
 
 class LoggingHelper:
@@ -134,6 +137,15 @@ class AccountManager(BasePage):
         self.special_cases = _load_special_cases()
         if not hasattr(self, 'log_helper') or self.log_helper is None:
             self.log_helper = LoggingHelper()
+        # Records of the list view and search responses, read instead of the rendered table
+        self.response_capture = LightningResponseCapture.for_page(page) if SALESFORCE_CAPTURE_RESPONSES else None
+        # 'ui' searches through the search boxes, 'soql' with a REST API query (see search_by_last_name)
+        self.search_backend = SALESFORCE_SEARCH_BACKEND
+        self._soql_search = None
+        # Local snapshot of the list view searched before the browser (see salesforce_search_account)
+        self.account_directory = None
+        # Saved last-name search results (see search_by_last_name)
+        self.search_cache = None
         
         # Get the root logger and set it as the logger for this instance
         self.logger = logging.getLogger()
@@ -215,8 +227,8 @@ class AccountManager(BasePage):
                     
                 self.log_helper.log(self.logger, 'info', f"Attempt {attempt}/{max_attempts}: Navigating to list view URL: {url}")
                 
-                # Navigate to the URL with increased timeout
-                self.page.goto(url, timeout=30000)  # Increased timeout to 30 seconds
+                # Navigate to the URL (client-side when the app is loaded)
+                self.navigator.goto(url)
                 
                 # Wait for network to be idle with increased timeout
                 # try:
@@ -268,8 +280,8 @@ class AccountManager(BasePage):
             
             # Wait for the page to be fully loaded
             self.log_helper.log(self.logger, 'info', "Waiting for page to be fully loaded...")
-            self.page.wait_for_load_state("networkidle")
             self.page.wait_for_load_state("domcontentloaded")
+            self.waits.dom_settled()
             
             # Try to find the search button first
             self.log_helper.log(self.logger, 'info', "Looking for search button...")
@@ -302,9 +314,10 @@ class AccountManager(BasePage):
             if search_button:
                 self.log_helper.log(self.logger, 'info', "Clicking search button...")
                 try:
+                    dom_mark = self.waits.mark()
                     search_button.click()
                     self.log_helper.log(self.logger, 'info', "Successfully clicked search button")
-                    self.page.wait_for_timeout(1000)  # Wait for search input to appear
+                    self.waits.dom_settled(since=dom_mark, timeout=1000)  # Search input appears
                 except Exception as e:
                     self.log_helper.log(self.logger, 'error', f"Failed to click search button: {str(e)}")
             
@@ -366,8 +379,6 @@ class AccountManager(BasePage):
                 self.log_helper.log(self.logger, 'error', f"Failed to click search input: {str(e)}")
                 return False
             
-            self.page.wait_for_timeout(1000)
-            
             # Clear any existing text
             self.log_helper.log(self.logger, 'info', "Clearing existing text...")
             try:
@@ -377,8 +388,6 @@ class AccountManager(BasePage):
                 self.log_helper.log(self.logger, 'error', f"Failed to clear search input: {str(e)}")
                 return False
             
-            self.page.wait_for_timeout(500)
-            
             # Fill the input with the search term
             self.log_helper.log(self.logger, 'info', f"Filling search input with: {search_term}")
             try:
@@ -388,10 +397,9 @@ class AccountManager(BasePage):
                 self.log_helper.log(self.logger, 'error', f"Failed to fill search input: {str(e)}")
                 return False
             
-            self.page.wait_for_timeout(500)
-            
             # Press Enter
             self.log_helper.log(self.logger, 'info', "Pressing Enter...")
+            dom_mark = self.waits.mark()
             try:
                 search_input.press("Enter")
                 self.log_helper.log(self.logger, 'info', "Successfully pressed Enter")
@@ -400,7 +408,7 @@ class AccountManager(BasePage):
                 return False
             
             # Wait for the search to complete
-            self.page.wait_for_timeout(2000)
+            self.waits.search_results_stable(dom_mark)
             
             self.log_helper.log(self.logger, 'info', "Search completed successfully")
             return True
@@ -425,9 +433,7 @@ class AccountManager(BasePage):
                 self.log_helper.dedent()
                 return False
             
-            # Wait for results to load
-            self.page.wait_for_timeout(2000)
-            
+            # enter_search_term waited for the results to settle
             self.log_helper.dedent()
             return True
         except Exception as e:
@@ -457,7 +463,7 @@ class AccountManager(BasePage):
                 return []
             
             # Wait for search results to load
-            self.page.wait_for_timeout(2000)
+            self.waits.list_view_rows_rendered()
             
             # Define selectors
             container_selectors = [
@@ -553,12 +559,27 @@ class AccountManager(BasePage):
             self.log_helper.log(self.logger, 'info', f"INFO: search_account ***searching for search term: {search_term}")
 
             # Enter search term
+            mark = self.response_capture.mark() if self.response_capture else None
+            dom_mark = self.waits.mark()
             search_input = self.page.locator("input[placeholder='Search this list...']")
             search_input.fill(search_term)
             search_input.press("Enter")
             self.log_helper.log(self.logger, 'info', f"Pressed Enter for search term: {search_term}")
-            self.log_helper.log(self.logger, 'info', f"Waiting for 2 second(s)...")
-            self.page.wait_for_timeout(2000)
+
+            # Read the results from the list search response as soon as it lands
+            if self.response_capture:
+                records = self.response_capture.wait_for_records(
+                    mark, LIST_VIEW_SOURCES, ['Account'], request_contains=search_term)
+                if records is not None:
+                    found_account_names = [account['name'] for account in self._accounts_from_records(records)]
+                    self.log_helper.log(self.logger, 'info', f"Found {len(found_account_names)} accounts in search response for search term: {search_term}: {found_account_names}")
+                    self.log_helper.dedent()
+                    self.log_helper.log_timing(self.logger, f"search_account for term: {search_term}")
+                    return found_account_names
+                self.log_helper.log(self.logger, 'info', "No search response captured, reading the results table")
+
+            self.log_helper.log(self.logger, 'info', "Waiting for the search results to settle...")
+            self.waits.search_results_stable(dom_mark)
             
             # After pressing Enter, check for empty content before checking for rows
             try:
@@ -704,19 +725,21 @@ class AccountManager(BasePage):
                 search_input.fill("--")
                 self.log_helper.log(self.logger, 'info', "Filled search input with '--'")
                 
+                dom_mark = self.waits.mark()
                 search_input.press("Enter")
                 self.log_helper.log(self.logger, 'info', "Pressed Enter")
                 
-                self.page.wait_for_timeout(1000)  # Wait for search to complete
+                self.waits.search_results_stable(dom_mark)
                 self.log_helper.log(self.logger, 'info', "Waited for search to complete")
                 
                 # Click the refresh button
                 refresh_button = self.page.locator('button[name="refreshButton"]').first
                 if refresh_button:
                     self.log_helper.log(self.logger, 'info', "Found refresh button")
+                    dom_mark = self.waits.mark()
                     refresh_button.click()
                     self.log_helper.log(self.logger, 'info', "Clicked refresh button")
-                    self.page.wait_for_timeout(1000)  # Wait for refresh to complete
+                    self.waits.list_view_rows_rendered(since=dom_mark)
                 else:
                     self.log_helper.log(self.logger, 'warning', "Refresh button not found")
                 
@@ -842,17 +865,13 @@ class AccountManager(BasePage):
             
             # Ensure the search input is visible and clickable
             search_input.scroll_into_view_if_needed()
-            self.page.wait_for_timeout(500)  # Short wait for scroll to complete
             
             # Click the search input to ensure it's focused
             search_input.click()
-            self.page.wait_for_timeout(500)  # Short wait for focus
             
-            # Clear and fill the search input
+            # Clear and fill the search input (fill returns once the value is set)
             search_input.fill("")
-            self.page.wait_for_timeout(500)  # Short wait for clear
             search_input.fill(account_name)
-            self.page.wait_for_timeout(500)  # Short wait for fill
             
             # Verify the text was entered correctly
             actual_text = search_input.input_value()
@@ -863,6 +882,7 @@ class AccountManager(BasePage):
                 return False
             
             # Press Enter and wait for results
+            dom_mark = self.waits.mark()
             self.page.keyboard.press("Enter")
             
             # Wait for search results
@@ -872,8 +892,8 @@ class AccountManager(BasePage):
                 self.page.wait_for_selector('.slds-spinner_container', state='hidden', timeout=5000)
                 self.log_helper.log(self.logger, 'info', "Loading spinner disappeared")
                 
-                # Wait a moment for results to appear
-                self.page.wait_for_timeout(1000)  # Reduced wait time
+                # Wait for the results to replace the previous rows
+                self.waits.search_results_stable(dom_mark)
                 
                 # Check for the exact account name
                 account_link = self.page.locator(f'a[title="{account_name}"]').first
@@ -956,7 +976,6 @@ class AccountManager(BasePage):
             save_button = self.page.locator('button:has-text("Save")').first
             if save_button and save_button.is_visible():
                 save_button.scroll_into_view_if_needed()
-                self.page.wait_for_timeout(500)
                 save_button.click()
                 self.log_helper.log(self.logger, 'info', "Successfully clicked visible Save button")
                 self.log_helper.dedent()
@@ -972,7 +991,6 @@ class AccountManager(BasePage):
                     if text and text.strip() == "Save" and enabled:
                         if visible:
                             button.scroll_into_view_if_needed()
-                            self.page.wait_for_timeout(500)
                             button.click()
                             self.log_helper.log(self.logger, 'info', "Successfully clicked visible Save button")
                             self.log_helper.dedent()
@@ -1147,11 +1165,10 @@ class AccountManager(BasePage):
                             except Exception as e:
                                 self.log_helper.log(self.logger, 'info', f"DOM content load timeout: {str(e)}")
                                 
-                            try:
-                                self.page.wait_for_load_state('networkidle', timeout=10000)
-                                self.log_helper.log(self.logger, 'info', "Network is idle")
-                            except Exception as e:
-                                self.log_helper.log(self.logger, 'info', f"Network idle timeout: {str(e)}")
+                            if self.waits.dom_settled(timeout=10000):
+                                self.log_helper.log(self.logger, 'info', "Page has settled")
+                            else:
+                                self.log_helper.log(self.logger, 'info', "Page did not settle in 10 seconds")
                                 
                         except Exception as e:
                             self.log_helper.log(self.logger, 'info', f"URL did not change: {str(e)}")
@@ -1334,7 +1351,7 @@ class AccountManager(BasePage):
             self.log_helper.log(self.logger, 'info', f"Navigating to URL: {url}")
             
             # Navigate to the URL
-            self.page.goto(url)
+            self.navigator.goto(url)
             # self.page.wait_for_load_state('networkidle')
             
             # Verify we're on the correct account page
@@ -1367,7 +1384,7 @@ class AccountManager(BasePage):
         try:
             url = f"{SALESFORCE_URL}/lightning/r/Account/{self.current_account_id}/view"
             self.log_helper.log(self.logger, 'info', f"Navigating to URL: {url}")
-            self.page.goto(url)
+            self.navigator.goto(url)
             # self.page.wait_for_load_state('networkidle')
             # checking url 
             current_url = self.page.url
@@ -1452,6 +1469,8 @@ class AccountManager(BasePage):
             # Navigate to files section
             self.log_helper.log(self.logger, 'info', "Navigating to files section")
             self.log_helper.log(self.logger, 'info', f"account_id: {account_id}")
+            # The Files rows (including those loaded by scrolling) are read from their responses
+            mark = self.response_capture.mark() if self.response_capture else None
             num_files = self.navigate_to_account_files_and_get_number_of_files(account_id, scroll_to_bottom_of_account_files=True)
     
             # Use FileManager to get file names
@@ -1460,7 +1479,7 @@ class AccountManager(BasePage):
             
             # Check if we have files (either a positive integer or a string like "50+")
             if (isinstance(num_files, int) and num_files > 0) or (isinstance(num_files, str) and '+' in str(num_files)):
-                return file_manager_instance.get_all_file_names()
+                return file_manager_instance.get_all_file_names(since=mark)
             else:
                 return []
             
@@ -1475,6 +1494,53 @@ class AccountManager(BasePage):
             return self.account_has_files(account['id'])
         return condition
 
+    def _parse_account_row(self, row: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """
+        Build an account from the raw values of a list view row.
+        
+        Args:
+            row: Row values from extract_account_rows ('header', 'name', 'href')
+            
+        Returns:
+            Optional[Dict[str, str]]: Account dictionary with 'name' and 'id' keys, or None for
+            header rows and rows without an account link
+        """
+        # Skip header rows and rows without a <th scope="row"> a or <td:first-child a> link
+        if row['header'] or row['name'] is None:
+            return None
+        name = row['name'].strip()
+        href = row['href']
+        # ***Account name: Irasis Abislaiman-Saade href: /lightning/r/001Dn00000VskmFIAR/view
+        account_id = href.split('/')[-2] if href else None
+        self.log_helper.log(self.logger, 'debug', f"***Account name: {name} found")
+        self.log_helper.log(self.logger, 'debug', f"***Account id: {account_id} found")
+        if name and account_id:
+            return {
+                'name': name,
+                'id': account_id
+            }
+        return None
+
+    def _accounts_from_records(self, records: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        Build accounts from captured Account records.
+        
+        Args:
+            records: Records from LightningResponseCapture ('api_name', 'id', 'fields')
+            
+        Returns:
+            List[Dict[str, str]]: Account dictionaries with 'name' and 'id' keys, in response order
+        """
+        accounts = []
+        for record in records:
+            name = ' '.join(str(record['fields'].get('Name') or '').split())
+            if name:
+                accounts.append({
+                    'name': name,
+                    'id': record['id']
+                })
+        return accounts
+
     def _get_accounts_base(self, view_name: str = "All Clients") -> List[Dict[str, str]]:
         """
         Get all accounts from the current list view.
@@ -1488,6 +1554,11 @@ class AccountManager(BasePage):
         self.log_helper.indent()
         try:
             self.log_helper.log(self.logger, 'debug', f"Getting accounts base: {view_name}")
+            # Rows loaded by the navigation below are read from its list response, unless the
+            # page is already on the list view and nothing will be requested
+            list_view_url = f"{SALESFORCE_URL}/lightning/o/Account/list?filterName={view_name.replace(' ', '')}"
+            capture = self.response_capture if self.response_capture and self.page.url != list_view_url else None
+            mark = capture.mark() if capture else None
             # Navigate to accounts page
             self.log_helper.log(self.logger, 'debug', f"Navigating to Accounts page: {SALESFORCE_URL}/lightning/o/Account/list?filterName=__Recent")
             if not self.navigate_to_accounts_list_page():
@@ -1501,6 +1572,15 @@ class AccountManager(BasePage):
                 self.log_helper.dedent()
                 return []
 
+            if capture:
+                records = capture.wait_for_records(mark, LIST_VIEW_SOURCES, ['Account'])
+                if records is not None:
+                    accounts = self._accounts_from_records(records)
+                    self.log_helper.log(self.logger, 'debug', f"***Found {len(accounts)} accounts in list view response")
+                    self.log_helper.dedent()
+                    return accounts
+                self.log_helper.log(self.logger, 'debug', "No list view response captured, reading the table")
+
             # Wait for table to be visible
             self.log_helper.log(self.logger, 'debug', f"Waiting for table to be visible")
             try:
@@ -1518,9 +1598,9 @@ class AccountManager(BasePage):
             # Wait for table to be populated and visible
             self.log_helper.log(self.logger, 'debug', f"Waiting for table to be populated and visible")
             try:
-                # Wait for the table to be fully loaded
-                self.log_helper.log(self.logger, 'debug', "Waiting for network to be idle")
-                self.page.wait_for_load_state('networkidle', timeout=10000)
+                # Wait for the rows to be rendered
+                self.log_helper.log(self.logger, 'debug', "Waiting for list view rows")
+                self.waits.list_view_rows_rendered(timeout=10000)
                 
                 # Wait for the loading spinner to disappear (if present)
                 try:
@@ -1550,19 +1630,18 @@ class AccountManager(BasePage):
                     }
                 """)
                 
-                # Get all rows
-                self.log_helper.log(self.logger, 'debug', "Getting all table rows")
-                rows = self.page.locator('table[role="grid"] tr').all()
-                if not rows:
+                # Check that the table has rows
+                self.log_helper.log(self.logger, 'debug', "Counting table rows")
+                row_count = self.page.locator(ACCOUNT_ROW_SELECTOR).count()
+                if not row_count:
                     self.log_helper.log(self.logger, 'error', "No rows found in table")
                     self.log_helper.dedent()
                     return []
                 
-                self.log_helper.log(self.logger, 'debug', f"Found {len(rows)} rows in table")
-                
-                # Additional wait to ensure table is fully rendered
-                self.log_helper.log(self.logger, 'debug', "Waiting for table to stabilize")
-                self.page.wait_for_timeout(2000)
+                self.log_helper.log(self.logger, 'debug', f"Found {row_count} rows in table")
+
+                # Read every row in one call
+                rows = extract_account_rows(self.page, ACCOUNT_ROW_SELECTOR)
                 
             except Exception as e:
                 self.log_helper.log(self.logger, 'error', f"Error waiting for table rows: {str(e)}")
@@ -1571,50 +1650,11 @@ class AccountManager(BasePage):
 
             accounts = []
             
-            for idx, row in enumerate(rows):
-                try:
-                    # Log the outer HTML of the row for debugging
-                    try:
-                        outer_html = row.evaluate('el => el.outerHTML')
-                        # self.logger.debug(f"Row {idx} outer HTML: {outer_html}")
-                        for handler in logging.getLogger().handlers:
-                            handler.flush()
-                    except Exception as e:
-                        self.log_helper.log(self.logger, 'warning', f"Could not get outer HTML for row {idx}: {e}")
-                    # Skip header rows
-                    first_cell = row.locator('th, td').nth(0)
-                    if first_cell.count() > 0:
-                        tag = first_cell.evaluate('el => el.tagName.toLowerCase()')
-                        scope = first_cell.get_attribute('scope')
-                        if tag == 'th' and (scope == 'col' or (first_cell.get_attribute('role') == 'cell' and scope == 'col')):
-                            continue
-                    # Try to get account name and ID from <th scope="row"> a
-                    name_cell = row.locator('th[scope="row"] a')
-                    if name_cell.count() == 0:
-                        # Fallback to <td:first-child a>
-                        name_cell = row.locator('td:first-child a')
-                    if name_cell.count() == 0:
-                        continue
-                    try:
-                        name = name_cell.nth(0).text_content(timeout=10000).strip()
-                        href = name_cell.nth(0).get_attribute('href')
-                        # ***Account name: Irasis Abislaiman-Saade href: /lightning/r/001Dn00000VskmFIAR/view
-
-                        account_id = href.split('/')[-2] if href else None
-                        if name and account_id:
-                            accounts.append({
-                                'name': name,
-                                'id': account_id
-                            })
-                        self.log_helper.log(self.logger, 'debug', f"***Account name: {name} found")
-                        self.log_helper.log(self.logger, 'debug', f"***Account id: {account_id} found")
-                       
-                    except Exception as e:
-                        self.log_helper.log(self.logger, 'warning', f"Error getting text content for row: {str(e)}")
-                        continue
-                except Exception as e:
-                    self.log_helper.log(self.logger, 'warning', f"Error processing account row: {str(e)}")
-                    continue
+            for row in rows:
+                account = self._parse_account_row(row)
+                if account:
+                    accounts.append(account)
+            self.log_helper.log(self.logger, 'debug', f"***Found {len(accounts)} accounts in {len(rows)} rows")
             
             self.log_helper.dedent()
             return accounts
@@ -1723,8 +1763,8 @@ class AccountManager(BasePage):
             
             # Wait for the page to be fully loaded
             self.log_helper.log(self.logger, 'info', "Waiting for page to be fully loaded")
-            self.page.wait_for_load_state('networkidle', timeout=10000)
             self.page.wait_for_load_state('domcontentloaded', timeout=10000)
+            self.waits.dom_settled(timeout=10000)
             
             # Get account details from the page
             account_info = {}
@@ -1819,8 +1859,8 @@ class AccountManager(BasePage):
                 return []
 
             # Wait for the page to load
-            self.page.wait_for_load_state('networkidle', timeout=10000)
             self.page.wait_for_load_state('domcontentloaded', timeout=10000)
+            self.waits.dom_settled(timeout=10000)
 
             # Click the Relationships tab
             tab_selectors = [
@@ -1921,13 +1961,6 @@ class AccountManager(BasePage):
             
             # Wait for page to load completely and stabilize
             self.log_helper.log(self.logger, 'info', "Step 4: Waiting for page to load and stabilize")
-            try:
-                self.log_helper.log(self.logger, 'info', "Waiting for network to be idle...")
-                self.page.wait_for_load_state('networkidle', timeout=10000)
-                self.log_helper.log(self.logger, 'info', "Network is idle")
-            except Exception as e:
-                self.log_helper.log(self.logger, 'warning', f"Network idle timeout, but continuing: {str(e)}")
-                
             try:
                 self.log_helper.log(self.logger, 'info', "Waiting for DOM content to load...")
                 self.page.wait_for_load_state('domcontentloaded', timeout=10000)
@@ -1935,8 +1968,9 @@ class AccountManager(BasePage):
             except Exception as e:
                 self.log_helper.log(self.logger, 'warning', f"DOM content load timeout, but continuing: {str(e)}")
                 
-            self.log_helper.log(self.logger, 'info', "Waiting additional 2 seconds for page to stabilize...")
-            self.page.wait_for_timeout(2000)
+            self.log_helper.log(self.logger, 'info', "Waiting for the page to stabilize...")
+            if not self.waits.dom_settled(timeout=10000):
+                self.log_helper.log(self.logger, 'warning', "Page did not settle in 10 seconds, but continuing")
             
             # Log the current page state
             self.log_helper.log(self.logger, 'info', f"Current URL after page load: {self.page.url}")
@@ -2020,7 +2054,6 @@ class AccountManager(BasePage):
                 self.log_helper.log(self.logger, 'info', "Attempting to click delete button...")
                 delete_btn.scroll_into_view_if_needed()
                 self.log_helper.log(self.logger, 'info', "Scrolled delete button into view")
-                self.page.wait_for_timeout(1000)  # Wait for scroll to complete
                 delete_btn.click()
                 self.log_helper.log(self.logger, 'info', "Clicked left-panel Delete button.")
             except Exception as e:
@@ -2029,8 +2062,6 @@ class AccountManager(BasePage):
                 self.log_helper.dedent()
                 return False
 
-            self.page.wait_for_timeout(1000)
-
             # Step 2: Wait for the modal and confirm deletion
             self.log_helper.log(self.logger, 'info', "Waiting for delete confirmation modal...")
             try:
@@ -2078,7 +2109,6 @@ class AccountManager(BasePage):
 
                 self.log_helper.log(self.logger, 'info', "Found modal delete button, attempting to click...")
                 modal_delete_btn.scroll_into_view_if_needed()
-                self.page.wait_for_timeout(1000)  # Wait for scroll to complete
                 modal_delete_btn.click()
                 self.log_helper.log(self.logger, 'info', "Clicked modal Delete button.")
             except Exception as e:
@@ -2098,10 +2128,10 @@ class AccountManager(BasePage):
             # Wait for deletion confirmation (toast)
             try:
                 self.log_helper.log(self.logger, 'info', "Waiting for deletion confirmation toast...")
-                toast = self.page.wait_for_selector('div.slds-notify_toast, div.slds-notify--toast', timeout=15000)
-                if toast:
-                    toast_text = toast.text_content()
-                    self.log_helper.log(self.logger, 'info', f"Found toast message: {toast_text}")
+                toast_text = self.waits.toast_shown(timeout=15000)
+                if toast_text is None:
+                    raise TimeoutError("No toast shown within 15 seconds")
+                self.log_helper.log(self.logger, 'info', f"Found toast message: {toast_text}")
                 self.log_helper.log(self.logger, 'info', f"Successfully deleted account: {full_name}")
                 self.log_helper.dedent()
                 self.log_helper.log_timing(self.logger, f"delete_account for: {full_name}")
@@ -2128,7 +2158,48 @@ class AccountManager(BasePage):
 
 
     def salesforce_search_account(self, folder_name: str, view_name: str = "All Clients", dropbox_account_name_parts: dict = None) -> Dict[str, Any]:
-        """Perform a fuzzy search based on a folder name."""
+        """Perform a fuzzy search based on a folder name.
+        
+        With a current account directory, candidates come from the local snapshot and the
+        browser is only searched when they give no exact match.
+        """
+        start_time = time.time()
+        last_name = (dropbox_account_name_parts or {}).get('last_name', '')
+        result = None
+        if self.account_directory is not None and self.account_directory.is_fresh(view_name):
+            result = self._match_last_name_search(
+                folder_name, view_name, dropbox_account_name_parts,
+                self.account_directory.search_by_last_name(last_name, view_name), 'Account Directory'
+            )
+            if result['status'] != 'match':
+                self.logger.info(f"No exact match in account directory for '{folder_name}' (status: {result['status']}), confirming in the browser")
+                result = None
+        
+        if result is None:
+            # Search by last name first
+            self.logger.info(f"\nSearching in view: {view_name}")
+            result = self._match_last_name_search(
+                folder_name, view_name, dropbox_account_name_parts,
+                self.search_by_last_name(last_name, view_name=view_name), 'Last Name'
+            )
+        if 'total' in result['timing']:
+            result['timing']['total'] = time.time() - start_time
+        return result
+
+    def _match_last_name_search(self, folder_name: str, view_name: str, dropbox_account_name_parts: dict,
+                                search_result: List[str], search_type: str) -> Dict[str, Any]:
+        """Match the accounts found for a folder's last name against its expected names.
+        
+        Args:
+            folder_name: Dropbox account folder name
+            view_name: The list view searched
+            dropbox_account_name_parts: Name parts of the folder (extract_name_parts)
+            search_result: Account names found for the last name
+            search_type: Label of the search recorded in 'search_attempts'
+            
+        Returns:
+            Dict[str, Any]: Search result with 'status', 'matches' and 'match_info'
+        """
         start_time = time.time()
         result = {
             'folder_name': folder_name,
@@ -2167,9 +2238,6 @@ class AccountManager(BasePage):
             self.logger.info(f"    Swapped names: {result['swapped_names']}")
             self.logger.info(f"    Expected matches: {result['expected_salesforce_matches']}")
             
-            # Search by last name first
-            self.logger.info(f"\nSearching in view: {view_name}")
-            search_result = self.search_by_last_name(last_name, view_name=view_name)
             self.logger.info(f"Type of search_result: {type(search_result)}")
             self.logger.info(f"Value of search_result: {search_result}")
             self.logger.info(f"\nSearch results for last name '{last_name}':")
@@ -2179,7 +2247,7 @@ class AccountManager(BasePage):
             
             # Store the search attempt
             search_attempt = {
-                'type': 'Last Name',
+                'type': search_type,
                 'query': last_name,
                 'matching_accounts': search_result,
                 'view': view_name
@@ -2281,6 +2349,8 @@ class AccountManager(BasePage):
         """
         Search for accounts by last name.
         
+        With a search cache, folders sharing a last name reuse the first search's result.
+        
         Args:
             last_name: The last name to search for
             view_name: The name of the list view to use
@@ -2288,26 +2358,92 @@ class AccountManager(BasePage):
         Returns:
             List[str]: List of matching account names
         """
+        if self.search_cache is not None:
+            return self.search_cache.get_or_search(self.search_backend, view_name, last_name,
+                                                   lambda name: self._search_by_last_name(name, view_name))
+        return self._search_by_last_name(last_name, view_name)[0]
+
+    def _search_by_last_name(self, last_name: str, view_name: str) -> Tuple[List[str], str]:
+        """
+        Search Salesforce for accounts by last name with the configured search backend.
+
+        Returns:
+            Tuple[List[str], str]: Matching account names and the backend that found them
+            ('ui' when the SOQL search failed and the UI search ran instead)
+        """
         self.log_helper.indent()
+        used_backend = self.search_backend
         try:
             self.log_helper.log(self.logger, 'info', f"INFO: ***search_by_last_name: searching for last name: {last_name}")
-            # Search for the last name using dashboard search first
-            matching_accounts = self.dashboard_search_account(last_name, view_name=view_name)
-            
-            # If no matches found with dashboard search, try regular search
-            if not matching_accounts:
-                self.log_helper.log(self.logger, 'info', "No matches found with dashboard search, trying regular search...")
-                matching_accounts = self.search_account(last_name, view_name=view_name)
+            matching_accounts = None
+            if self.search_backend == 'soql':
+                matching_accounts = self.soql_search_by_last_name(last_name)
+                if matching_accounts is None:
+                    self.log_helper.log(self.logger, 'warning', "SOQL search failed, searching through the UI...")
+            
+            if matching_accounts is None:
+                used_backend = 'ui'
+                # Search for the last name using dashboard search first
+                matching_accounts = self.dashboard_search_account(last_name, view_name=view_name)
+                
+                # If no matches found with dashboard search, try regular search
+                if not matching_accounts:
+                    self.log_helper.log(self.logger, 'info', "No matches found with dashboard search, trying regular search...")
+                    matching_accounts = self.search_account(last_name, view_name=view_name)
             
             self.log_helper.log(self.logger, 'info', f"Found {len(matching_accounts)} matching accounts:")
             for account in matching_accounts:
                 self.log_helper.log(self.logger, 'info', f"  - {account}")
             self.log_helper.dedent()
-            return matching_accounts
+            return matching_accounts, used_backend
         except Exception as e:
             self.log_helper.log(self.logger, 'error', f"Error searching by last name: {str(e)}")
             self.log_helper.dedent()
-            return []
+            return [], used_backend
+
+    def _get_soql_search(self) -> SoqlAccountSearch:
+        if self._soql_search is None:
+            self._soql_search = SoqlAccountSearch(SalesforceRestClient(self.page))
+        return self._soql_search
+
+    def resolve_account_ids(self, account_names: List[str]) -> Dict[str, str]:
+        """
+        Look up the IDs of accounts by exact name with batched SOQL queries.
+        
+        Args:
+            account_names: Account names, e.g. the first match of each account search
+            
+        Returns:
+            Dict[str, str]: Account ID per name found (empty if the queries failed)
+        """
+        try:
+            account_ids = self._get_soql_search().resolve_account_ids(account_names)
+            self.log_helper.log(self.logger, 'info', f"Resolved {len(account_ids)} of {len(set(account_names))} account IDs")
+            return account_ids
+        except Exception as e:
+            self.log_helper.log(self.logger, 'error', f"Error resolving account IDs: {str(e)}")
+            return {}
+
+    def soql_search_by_last_name(self, last_name: str) -> Optional[List[str]]:
+        """
+        Search for accounts by last name with a SOQL query over the browser session.
+        
+        Unlike the UI search, the query is not limited to a list view.
+        
+        Args:
+            last_name: The last name to search for
+            
+        Returns:
+            Optional[List[str]]: Matching account names, or None if the query failed
+        """
+        start_time = time.time()
+        try:
+            accounts = self._get_soql_search().search_by_last_name(last_name)
+            self.log_helper.log(self.logger, 'info', f"SOQL search for '{last_name}' found {len(accounts)} accounts in {time.time() - start_time:.2f} seconds")
+            return [account['name'] for account in accounts]
+        except Exception as e:
+            self.log_helper.log(self.logger, 'error', f"Error in SOQL search for '{last_name}': {str(e)}")
+            return None
 
     def deprecated_search_by_full_name(self, full_name: str) -> List[str]:
         self.log_helper.indent()
@@ -2333,10 +2469,10 @@ class AccountManager(BasePage):
         try:
             self.logger.info("Refreshing page")
             self.page.reload()
-            # Wait for network to be idle
-            self.page.wait_for_load_state('networkidle', timeout=20000)
             # Wait for DOM content to be loaded
             self.page.wait_for_load_state('domcontentloaded', timeout=20000)
+            # Wait for the app to finish rendering
+            self.waits.dom_settled(timeout=20000)
             self.logger.info("Successfully refreshed page")
             return True
         except Exception as e:
@@ -2437,10 +2573,10 @@ class AccountManager(BasePage):
             # If not on the correct page, navigate to it
             self.log_helper.log(self.logger, 'info', f"Not on account view page, navigating to account {account_id}")
             account_url = f"{SALESFORCE_URL}/lightning/r/Account/{account_id}/view"
-            self.page.goto(account_url)
+            self.navigator.goto(account_url)
             
             # Wait for the page to load
-            self.page.wait_for_load_state('networkidle')
+            self.waits.dom_settled(timeout=10000)
             
             # Verify we're on the correct page
             current_url = self.page.url
@@ -2540,7 +2676,7 @@ class AccountManager(BasePage):
         dashboard_url = f"{SALESFORCE_URL}/lightning/n/command__Dashboard"
         try:
             self.log_helper.log(self.logger, 'info', f"Navigating to dashboard: {dashboard_url}")
-            self.page.goto(dashboard_url, timeout=30000)
+            self.navigator.goto(dashboard_url)
             self.page.wait_for_load_state('domcontentloaded', timeout=10000)
             self.log_helper.log(self.logger, 'info', "Successfully navigated to dashboard")
             self.log_helper.dedent()
@@ -3,6 +3,8 @@ import logging
 import time
 from typing import Optional, Any, List
 from ..utils.selectors import Selectors
+from ..utils.navigator import LightningNavigator
+from ..utils.waits import PageWaits
 from src.config import SALESFORCE_URL
 
 class BasePage:
@@ -12,6 +14,10 @@ class BasePage:
         self.page = page
         self.debug_mode = debug_mode
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Shared by every page object of the page, so route and counters are per tab
+        self.navigator = LightningNavigator.for_page(page)
+        # Named conditions to wait for after an action, instead of fixed sleeps
+        self.waits = PageWaits.for_page(page)
         
     def navigate_to_salesforce(self) -> bool:
         """Navigate to the base Salesforce URL.
@@ -21,7 +27,7 @@ class BasePage:
         """
         try:
             self.logger.info(f"Navigating to Salesforce URL: {SALESFORCE_URL}")
-            self.page.goto(SALESFORCE_URL)
+            self.navigator.goto(SALESFORCE_URL)
             # self.page.wait_for_load_state('networkidle', timeout=20000)
             # self.page.wait_for_load_state('domcontentloaded', timeout=20000)
             self.logger.info("Successfully navigated to Salesforce")
@@ -61,8 +67,8 @@ class BasePage:
             except Exception:
                 try:
                     # Try scrolling into view and clicking
+                    # Scrolling waits for the element to be stable
                     element.scroll_into_view_if_needed()
-                    time.sleep(1)  # Wait for scroll
                     element.click()
                     return True
                 except Exception as e:
@@ -100,4 +106,4 @@ class BasePage:
                 if attempt == max_retries - 1:
                     raise
                 self.logger.warning(f"Operation failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
-                time.sleep(delay * (2 ** attempt)) 
\ No newline at end of file
+                time.sleep(delay / 1000 * (2 ** attempt)) 
\ No newline at end of file
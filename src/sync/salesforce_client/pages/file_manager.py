@@ -2,13 +2,20 @@ from typing import List, Optional, Union, Dict
 import os
 import logging
 from .base_page import BasePage
-from playwright.sync_api import Page
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 import re
 import sys
 from ..utils.debug_utils import debug_prompt
 from ..utils.file_utils import get_file_type, parse_search_file_pattern
+from ..utils.dom_extract import FILE_ROW_SCRIPT, FILE_ROW_SELECTOR, extract_file_rows
+from ..utils.response_capture import RELATED_LIST_SOURCES, LightningResponseCapture
+from ..utils.soql_search import SalesforceRestClient, fetch_linked_files
+from src.config import SALESFORCE_CAPTURE_RESPONSES
 from dropbox.files import FileMetadata
 
+# Objects the Files related list returns its rows as
+FILE_RECORD_OBJECTS = ('AttachedContentDocument', 'ContentDocument')
+
 class SalesforceFileManager(BasePage):
     """Handles file-related operations in Salesforce."""
     
@@ -16,6 +23,8 @@ class SalesforceFileManager(BasePage):
         logging.info(f"****Initializing FileManager")
         super().__init__(page, debug_mode)
         self.current_account_id = None
+        # Records of the Files related list responses, read instead of the rendered table
+        self.response_capture = LightningResponseCapture.for_page(page) if SALESFORCE_CAPTURE_RESPONSES else None
 
     def scroll_to_bottom_of_page(self):
         """Scroll to the bottom of the page to load all files."""
@@ -48,8 +57,10 @@ class SalesforceFileManager(BasePage):
                 
                 # Use mouse wheel to scroll down
                 self.logger.info("Scrolling down using mouse wheel...")
+                dom_mark = self.waits.mark()
                 self.page.mouse.wheel(0, viewport_height)
-                self.page.wait_for_timeout(1000)  # Wait for scroll to complete
+                # More rows load if there are any; without them the page does not change
+                self.waits.dom_settled(since=dom_mark, timeout=1000)
                 
                 # Get the new count
                 new_count = self.extract_files_count_from_status()
@@ -73,8 +84,9 @@ class SalesforceFileManager(BasePage):
                     else:
                         # Try one more scroll even if count didn't increase
                         self.logger.info("Count didn't increase, trying one more scroll...")
+                        dom_mark = self.waits.mark()
                         self.page.mouse.wheel(0, viewport_height)
-                        self.page.wait_for_timeout(1000)
+                        self.waits.dom_settled(since=dom_mark, timeout=1000)
                         new_count = self.extract_files_count_from_status()
                         self.logger.info(f"New file count after extra scroll: {new_count}")
                         if new_count == previous_counts[-1]:
@@ -119,9 +131,95 @@ class SalesforceFileManager(BasePage):
             self.logger.info(f"Error checking files count: {str(e)}")
         return 0
 
+    def _parse_file_info(self, file_name: Optional[str], type_text: Optional[str]) -> Optional[dict]:
+        """Build file name and type information from the raw text of a table row.
+        
+        Args:
+            file_name: Text of the row's span.itemTitle (None if the row has none)
+            type_text: Text of the row's type cell (None if the row has none)
+            
+        Returns:
+            dict: Dictionary containing:
+                - name: The clean file name
+                - type: The file type
+                - full_name: The full file name with type
+        """
+        file_name = (file_name or '').strip()
+        if not file_name:
+            self.logger.debug("No text content found in title span")
+            return None
+        
+        # Get file type from the type column
+        file_type = 'Unknown'
+        if type_text is None:
+            # If there is no type cell, try file extension
+            file_type = get_file_type(file_name)
+        else:
+            type_text = type_text.strip()
+            if type_text:
+                # Extract just the file type by matching the beginning of the string
+                # that matches the raw file name
+                if file_name in type_text:
+                    file_type = type_text.split(file_name)[0].strip()
+                    
+                    # Convert common file type formats to standard format
+                    file_type = file_type.lower()
+                    if 'pdf' in file_type:
+                        file_type = 'PDF'
+                    elif 'doc' in file_type:
+                        file_type = 'DOC'
+                    elif any(excel_type in file_type for excel_type in ['xls', 'excel spreadsheet']):
+                        file_type = 'XLS'
+                    elif 'txt' in file_type:
+                        file_type = 'TXT'
+                    elif any(img_type in file_type for img_type in ['jpg', 'jpeg', 'png', 'image file']):
+                        file_type = 'IMG'
+                else:
+                    file_type = type_text
+        
+        return self._build_file_info(file_name, file_type, type_text)
+
+    def _parse_file_record(self, fields: Dict) -> Optional[dict]:
+        """Build file name and type information from the fields of a captured Files record.
+        
+        Args:
+            fields: Record fields ('Title', 'FileExtension', 'FileType')
+            
+        Returns:
+            dict: Same as _parse_file_info, or None if the record has no title
+        """
+        file_name = str(fields.get('Title') or '').strip()
+        if not file_name:
+            return None
+        extension = str(fields.get('FileExtension') or fields.get('FileType') or '').strip().lower()
+        if not extension:
+            return self._build_file_info(file_name, 'Unknown', None)
+        # Same types as the table's type column: known types standardized, others as given
+        file_type = get_file_type(f"{file_name}.{extension}")
+        if file_type == 'Unknown':
+            file_type = extension
+        return self._build_file_info(file_name, file_type, extension)
+
+    def _build_file_info(self, file_name: str, file_type: str, type_text: Optional[str]) -> dict:
+        """Clean a file name and combine it with its type (see _parse_file_info)."""
+        # Clean the file name by removing any existing numbers and file types
+        clean_name = re.sub(r'^\d+\.\s*', '', file_name)
+        clean_name = re.sub(r'\s*\[\w+\]\s*$', '', clean_name)
+        
+        result = {
+            'name': clean_name,
+            'type': file_type,
+            'full_name': f"{clean_name} [{file_type}]"
+        }
+        self.logger.debug(f"File info from '{file_name}' / '{type_text}': {result}")
+        return result
+
     def _extract_file_info_from_row(self, row) -> dict:
         """Extract file name and type information from a table row.
         
+        Reads the row's title and type text in one call; use ``extract_file_rows`` to read
+        a whole table at once.
+        
         Args:
             row: The table row element
             
@@ -132,73 +230,8 @@ class SalesforceFileManager(BasePage):
                 - full_name: The full file name with type
         """
         try:
-            # Get file name
-            self.logger.info("Looking for span.itemTitle in row...")
-            title_span = row.locator('span.itemTitle').first
-            if not title_span:
-                self.logger.info("No span.itemTitle found in row")
-                return None
-                
-            self.logger.info("Getting text content from title span...")
-            file_name = title_span.text_content(timeout=3000).strip()
-            if not file_name:
-                self.logger.info("No text content found in title span")
-                return None
-            
-            self.logger.info(f"Raw file name from span: '{file_name}'")
-            
-            # Get file type from the type column
-            file_type = 'Unknown'
-            try:
-                self.logger.info("Attempting to get file type from type column...")
-                type_cell = row.locator('th:nth-child(2) span a div').first
-                if type_cell:
-                    type_text = type_cell.text_content(timeout=1000).strip()
-                    self.logger.info(f"Raw type text from cell: '{type_text}'")
-                    if type_text:
-                        # Extract just the file type by matching the beginning of the string
-                        # that matches the raw file name
-                        if file_name in type_text:
-                            file_type = type_text.split(file_name)[0].strip()
-                            self.logger.info(f"Extracted file type from type column: '{file_type}'")
-                            
-                            # Convert common file type formats to standard format
-                            file_type = file_type.lower()
-                            if 'pdf' in file_type:
-                                file_type = 'PDF'
-                            elif 'doc' in file_type:
-                                file_type = 'DOC'
-                            elif any(excel_type in file_type for excel_type in ['xls', 'excel spreadsheet']):
-                                file_type = 'XLS'
-                            elif 'txt' in file_type:
-                                file_type = 'TXT'
-                            elif any(img_type in file_type for img_type in ['jpg', 'jpeg', 'png', 'image file']):
-                                file_type = 'IMG'
-                            self.logger.info(f"Converted file type to standard format: '{file_type}'")
-                        else:
-                            file_type = type_text
-                            self.logger.info(f"Using full type text as file type: '{file_type}'")
-            except Exception as e:
-                self.logger.info(f"Failed to get type from column, falling back to extension: {str(e)}")
-                # If we can't get the type from the cell, try file extension
-                file_type = get_file_type(file_name)
-                self.logger.info(f"Determined file type from extension: '{file_type}'")
-            
-            # Clean the file name by removing any existing numbers and file types
-            self.logger.info("Cleaning file name...")
-            clean_name = re.sub(r'^\d+\.\s*', '', file_name)
-            self.logger.info(f"After removing leading numbers: '{clean_name}'")
-            clean_name = re.sub(r'\s*\[\w+\]\s*$', '', clean_name)
-            self.logger.info(f"After removing trailing type tags: '{clean_name}'")
-            
-            result = {
-                'name': clean_name,
-                'type': file_type,
-                'full_name': f"{clean_name} [{file_type}]"
-            }
-            self.logger.info(f"Final file info: {result}")
-            return result
-            
+            raw = row.evaluate(FILE_ROW_SCRIPT)
+            return self._parse_file_info(raw['title'], raw['type_text'])
         except Exception as e:
             self.logger.warning(f"Error extracting file info from row: {str(e)}")
             return None
@@ -219,12 +252,12 @@ class SalesforceFileManager(BasePage):
             self.logger.info("Waiting for table header...")
             self.page.wait_for_selector('span[title="Title"]', timeout=5000)
             
-            # Wait a bit for content to load
-            self.page.wait_for_timeout(1000)
+            # Wait for the rows to render
+            self.waits.list_view_rows_rendered(timeout=1000)
             
-            # Get all file rows
+            # Get all file rows in one call
             self.logger.info("Getting all file rows from table...")
-            file_rows = self.page.locator('table.slds-table tbody tr').all()
+            file_rows = extract_file_rows(self.page, 'table.slds-table tbody tr')
             if not file_rows:
                 self.logger.info("No file rows found")
                 return False
@@ -234,7 +267,7 @@ class SalesforceFileManager(BasePage):
             # Search through each row
             for i, row in enumerate(file_rows, 1):
                 self.logger.info(f"Processing row {i}/{len(file_rows)}")
-                file_info = self._extract_file_info_from_row(row)
+                file_info = self._parse_file_info(row['title'], row['type_text'])
                 if not file_info:
                     self.logger.info(f"Skipping row {i} - no file info extracted")
                     continue
@@ -278,10 +311,14 @@ class SalesforceFileManager(BasePage):
             self.logger.info("Error screenshot saved as file-search-error.png")
             return False
 
-    def get_all_file_names(self) -> List[str]:
+    def get_all_file_names(self, since: Optional[int] = None) -> List[str]:
         """
         Get all file names from the current files page.
         
+        Args:
+            since: Response capture mark taken before navigating to the Files page; when given,
+                the names are read from the Files responses loaded since then if any were captured
+        
         Returns:
             List[str]: List of file names found in the format "1. filename [TYPE]"
         """
@@ -294,22 +331,29 @@ class SalesforceFileManager(BasePage):
                 self.logger.error(f"Not on Files page. Current URL: {current_url}")
                 return []
             
+            if self.response_capture and since is not None:
+                records = self.response_capture.records_since(since, RELATED_LIST_SOURCES, FILE_RECORD_OBJECTS)
+                if records:
+                    file_names = []
+                    for record in records:
+                        file_info = self._parse_file_record(record['fields'])
+                        if file_info:
+                            file_names.append(f"{file_info['full_name']}")
+                    self.logger.info(f"Read {len(file_names)} file names from {len(records)} captured Files records")
+                    return file_names
+                self.logger.info("No Files records captured, reading the files table")
+            
             # Wait for the files table to be visible and at least one file row to appear
             max_attempts = 5
+            file_rows = []
             for attempt in range(max_attempts):
                 try:
                     # Use the same selector as in navigation and deletion methods
                     table = self.page.wait_for_selector('div.slds-card__body table, div.slds-scrollable_y table, div[role="main"] table', timeout=6000)
-                    file_rows = self.page.locator('div.slds-card__body table tbody tr, div.slds-scrollable_y table tbody tr, div[role="main"] table tbody tr').all()
-                    if file_rows and len(file_rows) > 0:
-                        # Optionally, check if at least one row has a visible span.itemTitle
-                        has_title = False
-                        for row in file_rows:
-                            if row.locator('span.itemTitle').count() > 0:
-                                has_title = True
-                                break
-                        if has_title:
-                            break
+                    # Read every row in one call; ready once at least one row has a span.itemTitle
+                    file_rows = extract_file_rows(self.page, FILE_ROW_SELECTOR)
+                    if any(row['title'] is not None for row in file_rows):
+                        break
                     self.logger.info(f"Attempt {attempt+1}/{max_attempts}: Table or file rows not ready, retrying...")
                     self.page.wait_for_timeout(1000)
                 except Exception as e:
@@ -319,34 +363,14 @@ class SalesforceFileManager(BasePage):
                 self.logger.error("Files table or file rows did not become visible after multiple attempts.")
                 return []
 
-            # Get all file rows immediately (after waiting)
-            file_rows = self.page.locator('div.slds-card__body table tbody tr, div.slds-scrollable_y table tbody tr, div[role="main"] table tbody tr').all()
-            if not file_rows:
-                self.logger.error("No file rows found after waiting")
-                return []
-            
-            self.logger.info(f"Found {len(file_rows)} file rows")
-            
-            # Get file information with minimal waits
-            logging.info("Getting file information with minimal waits")
-            file_names = []
             total_rows = len(file_rows)
-            self.logger.info(f"Starting to process {total_rows} file rows...")
+            self.logger.info(f"Found {total_rows} file rows")
             
+            file_names = []
             for i, row in enumerate(file_rows, 1):
-                try:
-                    # Log progress every 10 files or at the start
-                    if i == 1 or i % 10 == 0:
-                        self.logger.info(f"Processing file {i}/{total_rows} ({(i/total_rows)*100:.1f}%)")
-                    
-                    # Use _extract_file_info_from_row to get file info
-                    file_info = self._extract_file_info_from_row(row)
-                    if file_info:
-                        file_names.append(f"{file_info['full_name']}")
-                        self.logger.info(f"Successfully processed file {i}: {file_info['full_name']}")
-                except Exception as e:
-                    self.logger.warning(f"Error getting file info for row {i}: {str(e)}")
-                    continue
+                file_info = self._parse_file_info(row['title'], row['type_text'])
+                if file_info:
+                    file_names.append(f"{file_info['full_name']}")
             
             self.logger.info(f"Completed processing {len(file_names)}/{total_rows} files successfully")
             return file_names
@@ -355,6 +379,39 @@ class SalesforceFileManager(BasePage):
             self.logger.error(f"Error getting file names: {str(e)}")
             return []
 
+    def get_bulk_files(self, account_ids: List[str]) -> Optional[Dict[str, List[dict]]]:
+        """
+        Get the files of many accounts with batched ContentDocumentLink queries.
+        
+        The file info matches get_all_file_names, so each account's 'full_name' values can
+        be passed to compare_salesforce_files without opening its Files page.
+        
+        Args:
+            account_ids: Salesforce account IDs
+            
+        Returns:
+            Optional[Dict[str, List[dict]]]: Per account ID, file info dictionaries ('name',
+            'type', 'full_name', 'size', 'checksum'), or None if the queries failed
+        """
+        self.logger.info(f"Getting files of {len(account_ids)} accounts in bulk")
+        try:
+            linked_files = fetch_linked_files(SalesforceRestClient(self.page), account_ids)
+        except Exception as e:
+            self.logger.error(f"Error getting files in bulk: {str(e)}")
+            return None
+        
+        files = {}
+        for account_id, records in linked_files.items():
+            files[account_id] = []
+            for record in records:
+                file_info = self._parse_file_record(record)
+                if file_info:
+                    file_info['size'] = record['ContentSize']
+                    file_info['checksum'] = record['Checksum']
+                    files[account_id].append(file_info)
+        self.logger.info(f"Found {sum(len(account_files) for account_files in files.values())} files for {len(files)} accounts")
+        return files
+
     def _verify_files_url(self, url: str) -> bool:
         """Verify that the current URL is a valid Files page URL."""
         return bool(re.match(r'.*Account/\w+/related/AttachedContentDocuments/view.*', url))
@@ -522,8 +579,8 @@ class SalesforceFileManager(BasePage):
             self.logger.info("Waiting for table header...")
             self.page.wait_for_selector('span[title=\"Title\"]', timeout=5000)
 
-            # Wait a bit for content to load
-            self.page.wait_for_timeout(2000)  # Increased wait time
+            # Wait for the rows to render
+            self.waits.list_view_rows_rendered(timeout=2000)
 
             # Get all file rows (only visible ones)
             self.logger.info("Getting all file rows from table...")
@@ -562,8 +619,9 @@ class SalesforceFileManager(BasePage):
                     # Hover over the row to reveal action buttons
                     self.logger.info(f"Hovering over row {i} to reveal action buttons...")
                     try:
+                        dom_mark = self.waits.mark()
                         row.hover()
-                        self.page.wait_for_timeout(500)
+                        self.waits.dom_settled(since=dom_mark, timeout=500)
                     except Exception as e:
                         self.logger.warning(f"Failed to hover over row {i}: {str(e)}")
 
@@ -615,7 +673,12 @@ class SalesforceFileManager(BasePage):
                         try:
                             self.logger.info(f"Attempting to click dropdown (attempt {attempt + 1}/{max_retries})...")
                             dropdown.click(timeout=5000)
-                            self.page.wait_for_timeout(1000)  # Wait for dropdown to appear
+                            # Wait for the menu to appear; if it is slow, the lookup below still
+                            # reads whatever items are there instead of closing the menu to retry
+                            try:
+                                self.page.locator('a[role="menuitem"]').first.wait_for(state='visible', timeout=1000)
+                            except PlaywrightTimeoutError:
+                                self.logger.info("Dropdown menu not visible after 1 second, looking for the menu items anyway")
                             # Take a screenshot after clicking dropdown
                             self.page.screenshot(path=f"dropdown-opened-row{i}.png")
                             self.logger.info(f"Screenshot saved as dropdown-opened-row{i}.png")
@@ -631,8 +694,8 @@ class SalesforceFileManager(BasePage):
                                     break
                             if delete_menuitem:
                                 self.logger.info("Found 'Delete' menu item. Clicking...")
+                                # The confirmation dialog is waited for below
                                 delete_menuitem.click(timeout=5000)
-                                self.page.wait_for_timeout(1000)
                                 break
                             else:
                                 self.logger.error("Could not find 'Delete' menu item after opening dropdown.")
@@ -699,7 +762,10 @@ class SalesforceFileManager(BasePage):
                         self.logger.info("Found visible and enabled Delete button in modal. Attempting to click...")
                         delete_button.scroll_into_view_if_needed()
                         delete_button.click(timeout=5000)
-                        self.page.wait_for_timeout(2000)  # Wait for deletion to complete
+                        # Wait for deletion to complete
+                        toast_text = self.waits.toast_shown(timeout=2000)
+                        if toast_text:
+                            self.logger.info(f"Toast: {toast_text}")
                     except Exception as e:
                         self.logger.error(f"Error clicking Delete button in modal: {str(e)}")
                         self.page.screenshot(path=f"delete-button-click-error-modal-row{i}.png")
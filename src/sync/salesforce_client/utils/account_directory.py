@@ -0,0 +1,202 @@
+"""Local snapshot of a Salesforce account list view, indexed for last-name lookups."""
+
+import logging
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Set
+
+from .soql_search import SalesforceRestClient
+from src.config import SALESFORCE_ACCOUNT_DIRECTORY_DB, SALESFORCE_ACCOUNT_DIRECTORY_TTL
+
+logger = logging.getLogger(__name__)
+
+# Records per UI API list-records page (the API maximum)
+LIST_RECORDS_PAGE_SIZE = 2000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    view_name TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    record_type TEXT,
+    PRIMARY KEY (view_name, account_id)
+);
+CREATE TABLE IF NOT EXISTS name_tokens (
+    view_name TEXT NOT NULL,
+    token TEXT NOT NULL,
+    account_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_name_tokens ON name_tokens (view_name, token);
+CREATE TABLE IF NOT EXISTS snapshots (
+    view_name TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL,
+    account_count INTEGER NOT NULL
+);
+"""
+
+
+def _words(name: str) -> List[str]:
+    return [word.strip("'-") for word in re.findall(r"[\w'-]+", name.lower()) if word.strip("'-")]
+
+
+def name_tokens(name: str) -> Set[str]:
+    """
+    Blocking tokens of an account name: its words and the parts of hyphenated words.
+
+    "Maria Lopez-Garcia Household" gives maria, lopez-garcia, lopez, garcia and household,
+    so a search for either part of a hyphenated last name finds the account.
+    """
+    tokens = set()
+    for word in _words(name):
+        tokens.add(word)
+        tokens.update(part for part in re.split(r"[-']", word) if part)
+    return tokens
+
+
+def fetch_list_view_accounts(client: SalesforceRestClient, view_name: str) -> List[Dict[str, Any]]:
+    """
+    Read every account of a list view through the UI API, page by page.
+
+    Args:
+        client: REST client of the logged-in session
+        view_name: List view label; its API name is the label without spaces, as in the
+            list view URLs (e.g. "All Clients" -> AllClients)
+
+    Returns:
+        List[Dict[str, Any]]: Accounts with 'id', 'name' and 'record_type' (None without record types)
+
+    Raises:
+        RuntimeError: If a request fails
+    """
+    path = f"/ui-api/list-records/Account/{view_name.replace(' ', '')}"
+    params = {'pageSize': str(LIST_RECORDS_PAGE_SIZE), 'optionalFields': 'Account.Name'}
+    accounts = []
+    while True:
+        data = client.get_json(path, params=params)
+        for record in data.get('records', []):
+            name = ((record.get('fields') or {}).get('Name') or {}).get('value')
+            if not name:
+                continue
+            accounts.append({
+                'id': record['id'],
+                'name': ' '.join(name.split()),
+                'record_type': (record.get('recordTypeInfo') or {}).get('name')
+            })
+        logger.info(f"Read {len(accounts)} accounts from list view {view_name}")
+        if not data.get('nextPageToken'):
+            return accounts
+        params = dict(params, pageToken=data['nextPageToken'])
+
+
+class AccountDirectory:
+    """
+    Accounts of a list view stored in SQLite, with an index of name tokens.
+
+    Replaces a live search by a local lookup: ``search_by_last_name`` returns the accounts
+    whose names contain every word of the last name. A snapshot is considered current for
+    ``ttl`` seconds after it was taken.
+    """
+
+    def __init__(self, db_path: str = SALESFORCE_ACCOUNT_DIRECTORY_DB, ttl: int = SALESFORCE_ACCOUNT_DIRECTORY_TTL):
+        self.db_path = db_path
+        self.ttl = ttl
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def snapshot_age(self, view_name: str) -> Optional[float]:
+        """Return the age in seconds of the view's snapshot, or None if there is none."""
+        with self._connect() as conn:
+            row = conn.execute('SELECT refreshed_at FROM snapshots WHERE view_name = ?', (view_name,)).fetchone()
+        return time.time() - row[0] if row else None
+
+    def is_fresh(self, view_name: str) -> bool:
+        """Return True if the view has a snapshot younger than the TTL."""
+        age = self.snapshot_age(view_name)
+        return age is not None and age < self.ttl
+
+    def replace(self, view_name: str, accounts: List[Dict[str, Any]]) -> None:
+        """
+        Replace the view's snapshot in one transaction.
+
+        Args:
+            view_name: List view label
+            accounts: Accounts with 'id', 'name' and 'record_type'
+        """
+        with self._connect() as conn:
+            conn.execute('DELETE FROM accounts WHERE view_name = ?', (view_name,))
+            conn.execute('DELETE FROM name_tokens WHERE view_name = ?', (view_name,))
+            conn.executemany(
+                'INSERT OR REPLACE INTO accounts (view_name, account_id, name, record_type) VALUES (?, ?, ?, ?)',
+                [(view_name, account['id'], account['name'], account.get('record_type')) for account in accounts]
+            )
+            conn.executemany(
+                'INSERT INTO name_tokens (view_name, token, account_id) VALUES (?, ?, ?)',
+                [(view_name, token, account['id']) for account in accounts for token in name_tokens(account['name'])]
+            )
+            conn.execute(
+                'INSERT OR REPLACE INTO snapshots (view_name, refreshed_at, account_count) VALUES (?, ?, ?)',
+                (view_name, time.time(), len(accounts))
+            )
+        logger.info(f"Saved {len(accounts)} accounts of {view_name} to {self.db_path}")
+
+    def refresh(self, client: SalesforceRestClient, view_name: str) -> int:
+        """
+        Snapshot the list view again.
+
+        Args:
+            client: REST client of the logged-in session
+            view_name: List view label
+
+        Returns:
+            int: Number of accounts saved
+
+        Raises:
+            RuntimeError: If the list view could not be read (the old snapshot is kept)
+        """
+        start_time = time.time()
+        accounts = fetch_list_view_accounts(client, view_name)
+        self.replace(view_name, accounts)
+        logger.info(f"Refreshed account directory for {view_name} in {time.time() - start_time:.2f} seconds")
+        return len(accounts)
+
+    def search_by_last_name(self, last_name: str, view_name: str) -> List[str]:
+        """
+        Find the accounts whose names contain every word of a last name.
+
+        Args:
+            last_name: Last name to look up
+            view_name: List view label of the snapshot
+
+        Returns:
+            List[str]: Account names, ordered by name
+        """
+        words = sorted(set(_words(last_name)))
+        if not words:
+            return []
+        placeholders = ', '.join('?' for _ in words)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f'SELECT accounts.name FROM name_tokens '
+                f'JOIN accounts ON accounts.view_name = name_tokens.view_name AND accounts.account_id = name_tokens.account_id '
+                f'WHERE name_tokens.view_name = ? AND name_tokens.token IN ({placeholders}) '
+                f'GROUP BY accounts.account_id HAVING COUNT(DISTINCT name_tokens.token) = ? '
+                f'ORDER BY accounts.name',
+                (view_name, *words, len(words))
+            ).fetchall()
+        return list(dict.fromkeys(row[0] for row in rows))
@@ -0,0 +1,159 @@
+"""
+Blocking of Lightning assets the automation never reads.
+
+Every Lightning navigation requests images, icon sprites, fonts and telemetry beacons. The
+page classes only read the DOM and the data responses, so ``AssetBlocker`` fails those
+requests before they are sent.
+
+Interception uses the DevTools Fetch domain on a CDP session of the page rather than
+``page.route``: Playwright disables the HTTP cache of a page that has routes, which would
+make every full Lightning load download its scripts again. Fetch patterns also select by
+resource type, so only candidate requests pause for the handler.
+"""
+
+import logging
+import threading
+import weakref
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional
+
+from playwright.sync_api import Page
+
+from src.config import SALESFORCE_BLOCK_ASSETS_ALLOW
+
+logger = logging.getLogger(__name__)
+
+# DevTools resource types never read by the page classes
+BLOCKED_RESOURCE_TYPES = ('Image', 'Font', 'Media', 'Ping')
+
+# Analytics and telemetry requests, blocked whatever their resource type
+BLOCKED_URL_PATTERNS = (
+    'InstrumentationBeacon',
+    'ui-telemetry',
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+)
+
+# Requests that are never blocked: data responses and file content
+ALLOWED_URL_PATTERNS = (
+    '/aura?r=',
+    '/ui-api/',
+    '/services/data/',
+    '/sfc/servlet.shepherd/',
+)
+
+# Typical transfer size per blocked request, for the bytes-saved estimate (a blocked
+# request is never sent, so its actual size is unknown)
+ESTIMATED_BYTES = {
+    'Image': 15_000,
+    'Font': 50_000,
+    'Media': 200_000,
+    'Ping': 1_000,
+    'Other': 2_000,
+}
+
+_shared: Optional['AssetBlocker'] = None
+_shared_lock = threading.Lock()
+
+
+class AssetBlocker:
+    """
+    Fail requests for images, fonts, media and analytics on the pages it is installed on.
+
+    Requests matching a ``SALESFORCE_BLOCK_ASSETS_ALLOW`` fragment always go through, and so
+    do data and file requests that are not telemetry (a beacon can be an aura request). Blocked requests are counted per
+    resource type; one blocker is shared by all pages of a run (``shared``) so the report
+    covers the page pool's tabs too.
+    """
+
+    def __init__(self, allow: Optional[Iterable[str]] = None):
+        """
+        Args:
+            allow: Extra URL fragments that are never blocked
+        """
+        self.allow = tuple(allow if allow is not None else SALESFORCE_BLOCK_ASSETS_ALLOW)
+        self.blocked = Counter()
+        self._lock = threading.Lock()
+        self._pages: 'weakref.WeakSet[Page]' = weakref.WeakSet()
+
+    @classmethod
+    def shared(cls) -> 'AssetBlocker':
+        """Return the run's blocker, creating it on first use."""
+        global _shared
+        with _shared_lock:
+            if _shared is None:
+                _shared = cls()
+            return _shared
+
+    @classmethod
+    def installed(cls) -> Optional['AssetBlocker']:
+        """Return the run's blocker, or None if no page has blocking installed."""
+        return _shared
+
+    def install(self, page: Page) -> bool:
+        """
+        Start blocking on a page (once per page).
+
+        Must be called from the thread that owns the page, which then handles its paused
+        requests during its Playwright calls.
+
+        Args:
+            page: Playwright page of a Chromium browser
+
+        Returns:
+            bool: True if blocking is active on the page
+        """
+        if page in self._pages:
+            return True
+        try:
+            session = page.context.new_cdp_session(page)
+            session.on('Fetch.requestPaused', lambda event: self._handle(session, event))
+            patterns = [{'resourceType': resource_type, 'requestStage': 'Request'}
+                        for resource_type in BLOCKED_RESOURCE_TYPES]
+            patterns += [{'urlPattern': f'*{pattern}*', 'requestStage': 'Request'} for pattern in BLOCKED_URL_PATTERNS]
+            session.send('Fetch.enable', {'patterns': patterns})
+        except Exception as e:
+            logger.warning(f"Could not block assets on {page.url}: {str(e)}")
+            return False
+        self._pages.add(page)
+        logger.debug(f"Blocking images, fonts, media and analytics requests on {page.url}")
+        return True
+
+    def is_allowed(self, url: str) -> bool:
+        """Return True if a paused request must go through."""
+        if any(pattern in url for pattern in self.allow):
+            return True
+        if any(pattern in url for pattern in BLOCKED_URL_PATTERNS):
+            return False
+        return any(pattern in url for pattern in ALLOWED_URL_PATTERNS)
+
+    def _handle(self, session: Any, event: Dict[str, Any]) -> None:
+        request_id = event['requestId']
+        url = event['request']['url']
+        try:
+            if self.is_allowed(url):
+                session.send('Fetch.continueRequest', {'requestId': request_id})
+                return
+            resource_type = event.get('resourceType')
+            with self._lock:
+                self.blocked[resource_type if resource_type in ESTIMATED_BYTES else 'Other'] += 1
+            session.send('Fetch.failRequest', {'requestId': request_id, 'errorReason': 'BlockedByClient'})
+        except Exception as e:
+            # The page may have navigated away or closed while the request was paused
+            logger.debug(f"Could not handle paused request {url}: {str(e)}")
+
+    @property
+    def requests_saved(self) -> int:
+        """Number of requests blocked."""
+        return sum(self.blocked.values())
+
+    @property
+    def bytes_saved(self) -> int:
+        """Estimated bytes not downloaded, from typical sizes per resource type."""
+        return sum(ESTIMATED_BYTES[resource_type] * count for resource_type, count in self.blocked.items())
+
+    def summary(self) -> str:
+        """One-line blocking counts for logging."""
+        by_type = ', '.join(f"{count} {resource_type.lower()}" for resource_type, count in self.blocked.most_common())
+        return f"{self.requests_saved} requests blocked ({by_type or 'none'}), ~{self.bytes_saved / 1_000_000:.1f} MB saved"
@@ -6,14 +6,25 @@ import os
 import sys
 from playwright.sync_api import sync_playwright, Browser, Page
 import logging
-from src.config import SALESFORCE_URL, SALESFORCE_USERNAME, SALESFORCE_PASSWORD, CHROME_DEBUG_PORT
+from typing import Optional
+from src.config import SALESFORCE_URL, SALESFORCE_USERNAME, SALESFORCE_PASSWORD, CHROME_DEBUG_PORT, SALESFORCE_BLOCK_ASSETS
+from .asset_blocker import AssetBlocker
 
-def get_salesforce_page(playwright) -> tuple[Browser, Page]:
+def find_salesforce_page(browser: Browser) -> Optional[Page]:
+    """Return the first open Salesforce Lightning page of a connected browser, or None."""
+    for context in browser.contexts:
+        for page in context.pages:
+            if "lightning.force.com" in page.url:
+                return page
+    return None
+
+def get_salesforce_page(playwright, block_assets: bool = SALESFORCE_BLOCK_ASSETS) -> tuple[Browser, Page]:
     """
     Connect to an existing Chrome browser and return the first Salesforce page found.
     
     Args:
         playwright: The Playwright instance
+        block_assets: Abort image, font, media and analytics requests in the page's context
         
     Returns:
         tuple[Browser, Page]: A tuple containing the browser and page objects
@@ -34,15 +45,7 @@ def get_salesforce_page(playwright) -> tuple[Browser, Page]:
             ) from e
         
         # Find Salesforce page
-        salesforce_page = None
-        for context in browser.contexts:
-            for page in context.pages:
-                if "lightning.force.com" in page.url:
-                    salesforce_page = page
-                    break
-            if salesforce_page:
-                break
-                
+        salesforce_page = find_salesforce_page(browser)
         if not salesforce_page:
             browser.close()
             raise RuntimeError(
@@ -50,6 +53,8 @@ def get_salesforce_page(playwright) -> tuple[Browser, Page]:
                 f"at {SALESFORCE_URL}"
             )
             
+        if block_assets:
+            AssetBlocker.shared().install(salesforce_page)
         return browser, salesforce_page
         
     except Exception as e:
@@ -58,4 +63,38 @@ def get_salesforce_page(playwright) -> tuple[Browser, Page]:
         logging.error(f"Error connecting to Chrome browser: {str(e)}")
         if 'browser' in locals():
             browser.close()
-        raise RuntimeError(f"Failed to connect to Chrome browser: {str(e)}") 
\ No newline at end of file
+        raise RuntimeError(f"Failed to connect to Chrome browser: {str(e)}") 
+
+def open_salesforce_page(browser: Browser, block_assets: Optional[bool] = None) -> Page:
+    """
+    Open a new tab in the context of the logged-in Salesforce page.
+    
+    The tab shares the existing session's cookies, so it needs no login of its own. The
+    browser connection is the caller's (see ``get_salesforce_page``) and is reused for
+    every tab it opens.
+    
+    Args:
+        browser: A browser connected over CDP from the calling thread
+        block_assets: Abort image, font, media and analytics requests in the tab (default:
+            if the run's Salesforce page blocks them)
+        
+    Returns:
+        Page: The new page
+        
+    Raises:
+        RuntimeError: If no Salesforce page is open in the browser
+    """
+    if block_assets is None:
+        block_assets = AssetBlocker.installed() is not None
+    salesforce_page = find_salesforce_page(browser)
+    if not salesforce_page:
+        raise RuntimeError(
+            "No Salesforce page found. Please make sure you have a Salesforce page open "
+            f"at {SALESFORCE_URL}"
+        )
+    # Blocking is installed on the new tab only; the existing page belongs to another thread
+    page = salesforce_page.context.new_page()
+    if block_assets:
+        AssetBlocker.shared().install(page)
+    page.goto(SALESFORCE_URL)
+    return page
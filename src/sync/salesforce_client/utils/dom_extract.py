@@ -0,0 +1,81 @@
+"""
+Bulk extraction of Salesforce table rows.
+
+Each function reads every row of a table with one ``page.evaluate`` call and returns
+plain dictionaries, so a table costs one CDP round trip instead of several per row. The
+values are raw text; the page classes apply their parsing rules in Python.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from playwright.sync_api import Page
+
+logger = logging.getLogger(__name__)
+
+# Rows of the related Files list (the same tables the Files page waits for)
+FILE_ROW_SELECTOR = 'div.slds-card__body table tbody tr, div.slds-scrollable_y table tbody tr, div[role="main"] table tbody tr'
+# Rows of an Accounts list view
+ACCOUNT_ROW_SELECTOR = 'table[role="grid"] tr'
+
+# Title and type cell text of a Files row, or null when the element is missing
+FILE_ROW_SCRIPT = """
+(row) => {
+    const title = row.querySelector('span.itemTitle');
+    const typeCell = row.querySelector('th:nth-child(2) span a div');
+    return {
+        title: title ? title.textContent : null,
+        type_text: typeCell ? typeCell.textContent : null
+    };
+}
+"""
+
+FILE_ROWS_SCRIPT = f"""
+(rowSelector) => Array.from(document.querySelectorAll(rowSelector)).map({FILE_ROW_SCRIPT})
+"""
+
+# Header flag, account name and link of an Accounts list view row
+ACCOUNT_ROWS_SCRIPT = """
+(rowSelector) => Array.from(document.querySelectorAll(rowSelector)).map(row => {
+    const firstCell = row.querySelector('th, td');
+    const header = !!firstCell && firstCell.tagName.toLowerCase() === 'th' && firstCell.getAttribute('scope') === 'col';
+    const link = row.querySelector('th[scope="row"] a') || row.querySelector('td:first-child a');
+    return {
+        header: header,
+        name: link ? link.textContent : null,
+        href: link ? link.getAttribute('href') : null
+    };
+})
+"""
+
+
+def extract_file_rows(page: Page, row_selector: str = FILE_ROW_SELECTOR) -> List[Dict[str, Any]]:
+    """
+    Read the title and type text of every Files table row.
+
+    Args:
+        page: Playwright page showing a Files list
+        row_selector: CSS selector matching the table rows
+
+    Returns:
+        List[Dict[str, Any]]: Per row, in table order: 'title' and 'type_text' (None if missing)
+    """
+    rows = page.evaluate(FILE_ROWS_SCRIPT, row_selector)
+    logger.debug(f"Extracted {len(rows)} file rows in one call")
+    return rows
+
+
+def extract_account_rows(page: Page, row_selector: str = ACCOUNT_ROW_SELECTOR) -> List[Dict[str, Any]]:
+    """
+    Read the header flag, account name and href of every Accounts list view row.
+
+    Args:
+        page: Playwright page showing an Accounts list view
+        row_selector: CSS selector matching the table rows
+
+    Returns:
+        List[Dict[str, Any]]: Per row, in table order: 'header', 'name' and 'href' (None if missing)
+    """
+    rows = page.evaluate(ACCOUNT_ROWS_SCRIPT, row_selector)
+    logger.debug(f"Extracted {len(rows)} account rows in one call")
+    return rows
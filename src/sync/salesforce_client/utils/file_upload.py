@@ -8,6 +8,8 @@ from ..pages.accounts_page import AccountsPage
 import logging
 from ..pages.file_manager import SalesforceFileManager
 from ..pages.account_manager import AccountManager
+from .navigator import LightningNavigator
+from .waits import PageWaits
 from typing import Optional
 
 
@@ -58,9 +60,9 @@ def upload_account_file(page: Page, file_to_upload: str, expected_items: int = 1
         page.wait_for_selector('div.progress-indicator', timeout=3000, state='hidden')
         logging.info("File upload completed")
         
-        # Refresh the page to ensure we're in a clean state
+        # Refresh the Files list (client-side when the Lightning app allows it)
         logging.info("Refreshing page...")
-        page.reload()
+        LightningNavigator.for_page(page).refresh_view()
         logging.info("Page refreshed")
         # logging.info("Waiting load state...")
         # page.wait_for_load_state('networkidle')
@@ -84,8 +86,10 @@ def upload_account_file(page: Page, file_to_upload: str, expected_items: int = 1
         files = page.wait_for_selector('h1[title="Files"].slds-page-header__title', timeout=6000)
         if files:
             logging.info("Files page is visible")
-            # Wait a moment for the files to appear
-           
+            # A client-side refresh keeps the old count on screen until the list reloads
+            if PageWaits.for_page(page).file_count_updated(expected=expected_items, timeout=6000) is None:
+                logging.info("Files count did not reach the expected number, checking the current count")
+
             # Check for the number of items
             items_text = page.locator('span[aria-live="polite"].countSortedByFilteredBy').first.text_content()
             logging.info(f"Items text: {items_text}")
@@ -222,8 +226,10 @@ def upload_account_files(page: Page, account: dict, debug_mode: bool = True, max
                             
                             current_try += 1
                             if current_try <= max_tries:
-                                logging.info(f"Retrying in 2 seconds...")
-                                time.sleep(2)
+                                # Salesforce may still be counting the upload: retry once the count
+                                # reaches the expected number, or after 2 seconds
+                                logging.info(f"Retrying in up to 2 seconds...")
+                                PageWaits.for_page(page).file_count_updated(expected=expected_items, timeout=2000)
                                 
                         except Exception as e:
                             logging.error(f"Error during upload attempt {current_try}: {str(e)}")
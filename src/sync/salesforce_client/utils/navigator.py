@@ -0,0 +1,230 @@
+"""
+Route-aware navigation of a Salesforce Lightning page.
+
+A full Lightning load costs several seconds, most of it booting the app. The navigator
+reads the current route from the page URL, skips navigation that would not change it and
+otherwise asks the running app to navigate client-side. It falls back to a full load only
+when the app is not usable (not loaded, too many client-side navigations since the last
+load, or the client-side navigation did not arrive).
+"""
+
+import logging
+import re
+import threading
+import weakref
+from typing import NamedTuple, Optional
+from urllib.parse import parse_qs, urlparse
+
+from playwright.sync_api import Page
+
+from src.config import (
+    SALESFORCE_URL, SALESFORCE_SOFT_NAVIGATION, SALESFORCE_MAX_SOFT_NAVIGATIONS, SALESFORCE_NAVIGATION_TIMEOUT_MS
+)
+
+logger = logging.getLogger(__name__)
+
+# Fire Lightning's navigateToURL event; false when the page is not a running Lightning app
+NAVIGATE_SCRIPT = """
+(path) => {
+    if (!window.$A || !$A.get) return false;
+    const event = $A.get('e.force:navigateToURL');
+    if (!event) return false;
+    event.setParams({url: path});
+    event.fire();
+    return true;
+}
+"""
+
+# Fire Lightning's refreshView event, which reloads the current view's data
+REFRESH_SCRIPT = """
+() => {
+    if (!window.$A || !$A.get) return false;
+    const event = $A.get('e.force:refreshView');
+    if (!event) return false;
+    event.fire();
+    return true;
+}
+"""
+
+_registry: 'weakref.WeakKeyDictionary[Page, LightningNavigator]' = weakref.WeakKeyDictionary()
+_registry_lock = threading.Lock()
+
+
+class Route(NamedTuple):
+    """Lightning route: kind is 'home', 'list', 'record', 'related' or 'other'."""
+    kind: str
+    object_name: Optional[str] = None
+    record_id: Optional[str] = None
+    detail: Optional[str] = None  # list view filter name or related list name
+
+
+def parse_route(url: str) -> Route:
+    """
+    Parse a Lightning URL into a route.
+
+    Args:
+        url: Page URL
+
+    Returns:
+        Route: The route; 'other' for URLs outside the routes the page classes use
+    """
+    parsed = urlparse(url)
+    path = parsed.path.rstrip('/')
+    if path in ('', '/lightning', '/lightning/page/home'):
+        return Route('home')
+    match = re.match(r'^/lightning/o/(\w+)/list$', path)
+    if match:
+        filter_name = parse_qs(parsed.query).get('filterName', [None])[0]
+        return Route('list', match.group(1), detail=filter_name)
+    match = re.match(r'^/lightning/r/(?:(\w+)/)?(\w{15,18})/related/(\w+)/view$', path)
+    if match:
+        return Route('related', match.group(1), match.group(2)[:15], match.group(3))
+    match = re.match(r'^/lightning/r/(?:(\w+)/)?(\w{15,18})/view$', path)
+    if match:
+        return Route('record', match.group(1), match.group(2)[:15])
+    return Route('other', detail=path)
+
+
+def _same_route(current: Route, target: Route) -> bool:
+    """Return True if the routes show the same view ('other' routes are never assumed to)."""
+    if current.kind != target.kind or current.kind == 'other':
+        return False
+    # Record URLs may omit the object name
+    same_object = current.object_name == target.object_name or not current.object_name or not target.object_name
+    return same_object and current.record_id == target.record_id and current.detail == target.detail
+
+
+def _arrived(current: Route, target: Route) -> bool:
+    """Return True if a navigation to target has reached current (same path for 'other' routes)."""
+    if current.kind == 'other' and target.kind == 'other':
+        return current.detail == target.detail
+    return _same_route(current, target)
+
+
+class LightningNavigator:
+    """
+    Navigate one page between Lightning routes with as few full loads as possible.
+
+    Counts skipped, client-side and full navigations so a run can report them.
+    """
+
+    def __init__(self, page: Page, soft_navigation: bool = SALESFORCE_SOFT_NAVIGATION,
+                 max_soft_navigations: int = SALESFORCE_MAX_SOFT_NAVIGATIONS,
+                 timeout: int = SALESFORCE_NAVIGATION_TIMEOUT_MS):
+        """
+        Args:
+            page: Playwright page of the Lightning app
+            soft_navigation: Navigate client-side when possible (False always loads the URL)
+            max_soft_navigations: Client-side navigations before the next one is a full load,
+                which bounds the app's memory growth
+            timeout: Milliseconds to wait for a client-side navigation to reach its URL
+        """
+        self.page = page
+        self.soft_navigation = soft_navigation
+        self.max_soft_navigations = max_soft_navigations
+        self.timeout = timeout
+        self.skipped = 0
+        self.soft_navigations = 0
+        self.full_loads = 0
+        self._soft_since_load = 0
+
+    @classmethod
+    def for_page(cls, page: Page) -> 'LightningNavigator':
+        """Return the page's navigator, creating it on first use so counters are shared."""
+        with _registry_lock:
+            navigator = _registry.get(page)
+            if navigator is None:
+                navigator = cls(page)
+                _registry[page] = navigator
+            return navigator
+
+    @property
+    def current_route(self) -> Route:
+        """Route of the page's current URL."""
+        return parse_route(self.page.url)
+
+    def _is_stale(self) -> bool:
+        """Return True if the app should be loaded again instead of navigated client-side."""
+        if not self.soft_navigation:
+            return True
+        if self._soft_since_load >= self.max_soft_navigations:
+            logger.info(f"{self._soft_since_load} client-side navigations since the last load, reloading the app")
+            return True
+        if '/lightning/' not in self.page.url:
+            return True
+        return False
+
+    def _load(self, url: str) -> None:
+        self.page.goto(url)
+        self.full_loads += 1
+        self._soft_since_load = 0
+
+    def goto(self, url: str, force_reload: bool = False) -> bool:
+        """
+        Show a Lightning URL, navigating only if the page is not already on its route.
+
+        Args:
+            url: Absolute URL (or path) of the route
+            force_reload: Load the URL even if the page is on its route
+
+        Returns:
+            bool: True if the page is on the URL's route
+        """
+        if not url.startswith('http'):
+            url = f"{SALESFORCE_URL}{url}"
+        target = parse_route(url)
+        same_host = urlparse(self.page.url).netloc == urlparse(url).netloc
+        if not force_reload and same_host and _same_route(self.current_route, target):
+            self.skipped += 1
+            logger.debug(f"Already on {target}, not navigating")
+            return True
+
+        if not force_reload and not self._is_stale():
+            parsed = urlparse(url)
+            path = parsed.path + (f"?{parsed.query}" if parsed.query else '')
+            try:
+                if self.page.evaluate(NAVIGATE_SCRIPT, path):
+                    self.page.wait_for_url(lambda page_url: _arrived(parse_route(page_url), target), timeout=self.timeout)
+                    self.soft_navigations += 1
+                    self._soft_since_load += 1
+                    logger.debug(f"Navigated client-side to {path}")
+                    return True
+                logger.debug("Lightning app not available for client-side navigation")
+            except Exception as e:
+                logger.info(f"Client-side navigation to {path} failed, loading the page: {str(e)}")
+
+        self._load(url)
+        logger.debug(f"Loaded {url}")
+        return _arrived(self.current_route, target)
+
+    def ensure_home(self) -> bool:
+        """Show the Lightning home page (a full load only if the app is stale)."""
+        return self.goto(f"{SALESFORCE_URL}/lightning/page/home")
+
+    def refresh_view(self) -> bool:
+        """
+        Reload the current view's data, client-side when possible.
+
+        Returns:
+            bool: True if the view was refreshed (False if the page could not be reloaded)
+        """
+        if not self._is_stale():
+            try:
+                if self.page.evaluate(REFRESH_SCRIPT):
+                    logger.debug("Refreshed the view client-side")
+                    return True
+            except Exception as e:
+                logger.info(f"Client-side refresh failed, reloading the page: {str(e)}")
+        try:
+            self.page.reload()
+            self.full_loads += 1
+            self._soft_since_load = 0
+            return True
+        except Exception as e:
+            logger.error(f"Error reloading page: {str(e)}")
+            return False
+
+    def summary(self) -> str:
+        """One-line navigation counts for logging."""
+        return (f"navigations: {self.skipped} skipped, {self.soft_navigations} client-side, "
+                f"{self.full_loads} full loads")
@@ -0,0 +1,157 @@
+"""
+Pool of Salesforce pages for processing accounts in parallel over one Chrome browser.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from playwright.sync_api import Browser, Page, sync_playwright
+
+from .browser import get_salesforce_page, open_salesforce_page
+from src.config import SALESFORCE_PAGE_MAX_ATTEMPTS, SALESFORCE_PAGE_RECYCLE_AFTER
+
+logger = logging.getLogger(__name__)
+
+
+class SalesforcePagePool:
+    """
+    Dispatch work items to N tabs of the connected Chrome browser.
+
+    Playwright's sync API objects belong to the thread that created them, so each worker
+    thread starts its own Playwright driver and connects once over CDP to the same Chrome.
+    It opens its tabs in the logged-in Salesforce context on that connection and closes the
+    connection when it exits. Items are taken from a shared queue.
+
+    A failed item is retried (up to ``max_attempts``, possibly on another tab), and the tab
+    it failed on is closed and replaced, so one broken page does not affect other items.
+    Tabs are also replaced after ``recycle_after`` items to bound memory growth.
+    """
+
+    def __init__(self, size: int, setup: Callable[[Page], Any], task: Callable[[Any, Hashable], Any],
+                 max_attempts: int = SALESFORCE_PAGE_MAX_ATTEMPTS, recycle_after: int = SALESFORCE_PAGE_RECYCLE_AFTER):
+        """
+        Args:
+            size: Number of pages (worker threads)
+            setup: Called once per opened page; returns the per-page context passed to ``task``
+                (e.g. an AccountManager and SalesforceFileManager for the page)
+            task: Called as ``task(context, item)`` to process one item
+            max_attempts: Attempts per item before its error is recorded
+            recycle_after: Items processed by a page before it is replaced (0 never replaces)
+        """
+        self.size = size
+        self.setup = setup
+        self.task = task
+        self.max_attempts = max_attempts
+        self.recycle_after = recycle_after
+        self._queue: queue.Queue = queue.Queue()
+        self._attempts: Dict[Hashable, int] = {}
+        self._results: Dict[Hashable, Tuple[Any, Optional[Exception]]] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self, playwright) -> Browser:
+        browser, _ = get_salesforce_page(playwright, block_assets=False)
+        return browser
+
+    def _disconnect(self, browser: Optional[Browser]) -> None:
+        if browser is None:
+            return
+        try:
+            # Closing a browser connected over CDP only drops the connection; Chrome keeps running
+            browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing pool browser connection: {str(e)}")
+
+    def _open_page(self, browser: Browser) -> Tuple[Page, Any]:
+        page = open_salesforce_page(browser)
+        return page, self.setup(page)
+
+    def _close_page(self, page: Optional[Page]) -> None:
+        if page is None:
+            return
+        try:
+            page.close()
+        except Exception as e:
+            logger.debug(f"Error closing pool page: {str(e)}")
+
+    def _worker(self, worker_id: int) -> None:
+        browser = None
+        page = None
+        context = None
+        processed = 0
+        with sync_playwright() as playwright:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                with self._lock:
+                    self._attempts[item] = self._attempts.get(item, 0) + 1
+                    attempt = self._attempts[item]
+                try:
+                    if browser is None:
+                        browser = self._connect(playwright)
+                        logger.info(f"Page worker {worker_id}: connected to Chrome")
+                    if page is None:
+                        page, context = self._open_page(browser)
+                        processed = 0
+                        logger.info(f"Page worker {worker_id}: opened page")
+                    start_time = time.time()
+                    result = self.task(context, item)
+                    with self._lock:
+                        self._results[item] = (result, None)
+                    processed += 1
+                    logger.info(f"Page worker {worker_id}: processed {item} in {time.time() - start_time:.2f} seconds")
+                except Exception as e:
+                    logger.warning(f"Page worker {worker_id}: {item} failed (attempt {attempt}/{self.max_attempts}): {str(e)}")
+                    if attempt < self.max_attempts:
+                        self._queue.put(item)
+                    else:
+                        with self._lock:
+                            self._results[item] = (None, e)
+                    # The page may be in an unknown state: replace it before the next item
+                    self._close_page(page)
+                    page = None
+                    # Reconnect only if the connection itself was lost (e.g. Chrome restarted)
+                    if browser is not None and not browser.is_connected():
+                        self._disconnect(browser)
+                        browser = None
+                    continue
+                if self.recycle_after and processed >= self.recycle_after:
+                    logger.info(f"Page worker {worker_id}: recycling page after {processed} items")
+                    self._close_page(page)
+                    page = None
+            self._close_page(page)
+            self._disconnect(browser)
+
+    def run(self, items: Iterable[Hashable]) -> Dict[Hashable, Tuple[Any, Optional[Exception]]]:
+        """
+        Process all items and wait for the workers to finish.
+
+        Args:
+            items: Work items (e.g. account folder names); must be hashable
+
+        Returns:
+            Dict[Hashable, Tuple[Any, Optional[Exception]]]: Per item, the task's result and
+            None, or None and the last error if every attempt failed
+        """
+        items = list(items)
+        for item in items:
+            self._queue.put(item)
+        start_time = time.time()
+        workers = [
+            threading.Thread(target=self._worker, args=(worker_id,), name=f"salesforce-page-{worker_id}", daemon=True)
+            for worker_id in range(1, min(self.size, len(items)) + 1)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        failed = [item for item, (_, error) in self._results.items() if error]
+        logger.info(f"Processed {len(items) - len(failed)} of {len(items)} items on {len(workers)} pages "
+                    f"in {time.time() - start_time:.2f} seconds")
+        if failed:
+            logger.warning(f"Page pool failed for: {failed}")
+        return dict(self._results)
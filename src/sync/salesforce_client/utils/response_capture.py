@@ -0,0 +1,303 @@
+"""
+Capture of Salesforce Lightning data responses.
+
+Lightning loads list view rows, list searches and related lists through aura actions and
+UI API requests. ``LightningResponseCapture`` listens to a page's responses and parses the
+records out of those JSON payloads, so the page classes can read rows as soon as the
+response lands instead of waiting for the table to render and scraping it.
+"""
+
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+from playwright.sync_api import Page, Response, TimeoutError
+
+from src.config import SALESFORCE_RESPONSE_TIMEOUT_MS
+
+logger = logging.getLogger(__name__)
+
+# Sources (aura action descriptors or UI API paths) returning the rows of a list view or list search
+LIST_VIEW_SOURCES = (
+    'ListViewDataManagerController/ACTION$getItems',
+    'ACTION$getListRecordsByName',
+    'ACTION$postListRecordsByName',
+    '/ui-api/list-records/',
+)
+# Sources returning the rows of a related list (e.g. an account's Files)
+RELATED_LIST_SOURCES = (
+    'RelatedListContainerDataProviderController/ACTION$getRecords',
+    'ACTION$getRelatedListRecords',
+    'ACTION$postRelatedListRecords',
+    '/ui-api/related-list-records/',
+)
+
+# Object key prefixes, for payloads that give a record Id without naming its object
+ID_PREFIXES = {
+    '001': 'Account',
+    '068': 'ContentVersion',
+    '069': 'ContentDocument',
+    '06A': 'ContentDocumentLink',
+}
+
+# Aura responses are prefixed to prevent JSON hijacking
+AURA_PREFIX = 'while(1);'
+
+_registry: 'weakref.WeakKeyDictionary[Page, LightningResponseCapture]' = weakref.WeakKeyDictionary()
+_registry_lock = threading.Lock()
+
+
+def _field_value(value: Any) -> Any:
+    """Return the value of a UI API field ({'value': ..., 'displayValue': ...}) or a plain value."""
+    if isinstance(value, dict):
+        value = value.get('value')
+    return None if isinstance(value, (dict, list)) else value
+
+
+def _as_record(node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Recognize a UI API record or an SObject-style dictionary."""
+    if isinstance(node.get('apiName'), str) and isinstance(node.get('fields'), dict) and node.get('id'):
+        fields = {name: _field_value(value) for name, value in node['fields'].items()}
+        return {'api_name': node['apiName'], 'id': node['id'], 'fields': fields}
+
+    record_id = node.get('Id')
+    if not isinstance(record_id, str) or len(record_id) not in (15, 18):
+        return None
+    attributes = node.get('attributes')
+    if isinstance(attributes, dict) and attributes.get('type'):
+        api_name = attributes['type']
+    else:
+        api_name = ID_PREFIXES.get(record_id[:3])
+    if not api_name:
+        return None
+    fields = {name: value for name, value in node.items()
+              if name != 'attributes' and not isinstance(value, (dict, list))}
+    return {'api_name': api_name, 'id': record_id, 'fields': fields}
+
+
+# Keys under which Lightning payloads return their list of result rows
+RECORD_LIST_KEYS = ('records', 'result')
+
+
+def extract_records(payload: Any) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Find the result rows of a Lightning JSON payload.
+
+    Only the items of the payload's ``records``/``result`` list (or of the payload itself,
+    when it is a list) are rows. Records nested inside a row, such as the Parent or
+    Household account of a lookup field, are not returned as rows of their own.
+
+    Args:
+        payload: Parsed aura action return value or UI API response
+
+    Returns:
+        Tuple[List[Dict[str, Any]], bool]: Records in payload order, each with 'api_name', 'id'
+        and 'fields', and whether the payload holds a list of records (True for an empty
+        result, so "no rows" can be told apart from "not a records response")
+    """
+    records: List[Dict[str, Any]] = []
+    seen = set()
+    has_records_list = False
+
+    def collect(items: List[Any]) -> None:
+        nonlocal has_records_list
+        found = [_as_record(item) for item in items if isinstance(item, dict)]
+        found = [record for record in found if record]
+        # A list of something else (e.g. a "result" of names) is not a records response
+        if items and not found:
+            return
+        has_records_list = True
+        for record in found:
+            if record['id'] not in seen:
+                seen.add(record['id'])
+                records.append(record)
+
+    def walk(node: Any) -> None:
+        if isinstance(node, list):
+            for item in node:
+                walk(item)
+            return
+        # A record outside a result list is not a row, and neither is anything inside it
+        if not isinstance(node, dict) or _as_record(node):
+            return
+        for key, value in node.items():
+            if key in RECORD_LIST_KEYS and isinstance(value, list):
+                collect(value)
+            elif isinstance(value, (dict, list)):
+                walk(value)
+
+    if isinstance(payload, list):
+        collect(payload)
+    else:
+        walk(payload)
+    return records, has_records_list
+
+
+def _aura_actions(post_data: Optional[str]) -> Dict[str, Tuple[str, str]]:
+    """Map the action ids of an aura request to their controller descriptor and JSON params."""
+    if not post_data:
+        return {}
+    try:
+        message = json.loads(parse_qs(post_data).get('message', ['{}'])[0])
+    except ValueError:
+        return {}
+    return {
+        action.get('id'): (action.get('descriptor', ''), json.dumps(action.get('params'), ensure_ascii=False))
+        for action in message.get('actions') or []
+    }
+
+
+def _matches(source: str, sources: Iterable[str]) -> bool:
+    source = source.lower()
+    return any(candidate.lower() in source for candidate in sources)
+
+
+class LightningResponseCapture:
+    """
+    Collect the records of a page's aura and UI API responses.
+
+    The response listener only queues candidate responses; bodies are read when the caller
+    asks for records (``mark``, ``records_since``, ``wait_for_records``), because reading a
+    body is itself a Playwright call. Each response becomes one or more batches of records
+    tagged with their source and a sequence number, so a caller can take a ``mark`` before
+    an action and read only the records that action loaded.
+    """
+
+    def __init__(self, page: Page, max_batches: int = 200):
+        """
+        Args:
+            page: Playwright page to listen on
+            max_batches: Queued responses and parsed batches kept (oldest are dropped)
+        """
+        self.page = page
+        self._responses: Deque[Response] = deque(maxlen=max_batches)
+        self._batches: Deque[Dict[str, Any]] = deque(maxlen=max_batches)
+        self._sequence = 0
+        page.on('response', self._on_response)
+
+    @classmethod
+    def for_page(cls, page: Page) -> 'LightningResponseCapture':
+        """Return the page's capture, creating it on first use so a page has one listener."""
+        with _registry_lock:
+            capture = _registry.get(page)
+            if capture is None:
+                capture = cls(page)
+                _registry[page] = capture
+            return capture
+
+    @staticmethod
+    def _is_data_response(response: Response) -> bool:
+        url = response.url
+        return ('/aura' in url or '/ui-api/' in url) and response.request.resource_type in ('xhr', 'fetch')
+
+    def _on_response(self, response: Response) -> None:
+        if self._is_data_response(response):
+            self._responses.append(response)
+
+    def _drain(self) -> None:
+        """Parse the queued responses into batches."""
+        while self._responses:
+            response = self._responses.popleft()
+            try:
+                self._parse_response(response)
+            except Exception as e:
+                logger.debug(f"Could not parse response {response.url}: {str(e)}")
+
+    def _parse_response(self, response: Response) -> None:
+        if not response.ok:
+            return
+        body = response.text()
+        if body.startswith(AURA_PREFIX):
+            body = body[len(AURA_PREFIX):]
+        payload = json.loads(body)
+        if '/aura' in response.url:
+            actions = _aura_actions(response.request.post_data)
+            for action in payload.get('actions') or []:
+                if action.get('state') == 'SUCCESS':
+                    descriptor, params = actions.get(action.get('id'), ('', ''))
+                    self._add_batch(descriptor, params, action.get('returnValue'))
+        else:
+            self._add_batch(urlparse(response.url).path, unquote(response.url), payload)
+
+    def _add_batch(self, source: str, request: str, payload: Any) -> None:
+        records, has_records_list = extract_records(payload)
+        if not has_records_list:
+            return
+        self._sequence += 1
+        self._batches.append({'sequence': self._sequence, 'source': source, 'request': request, 'records': records})
+        logger.debug(f"Captured {len(records)} records from {source}")
+
+    def mark(self) -> int:
+        """Return a marker; records loaded after it are returned by ``records_since``."""
+        self._drain()
+        return self._sequence
+
+    def records_since(self, mark: int, sources: Iterable[str], api_names: Optional[Iterable[str]] = None,
+                      request_contains: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the records loaded after a mark by the given sources.
+
+        Args:
+            mark: Value returned by ``mark``
+            sources: Aura descriptor or UI API path fragments to accept (e.g. LIST_VIEW_SOURCES)
+            api_names: Object names to keep (None keeps every object)
+            request_contains: Only accept responses whose request (URL or aura action params)
+                contains this text, e.g. a search term
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Records (each with 'api_name', 'id' and 'fields'),
+            possibly empty, or None if no matching response has landed yet
+        """
+        self._drain()
+        batches = [batch for batch in self._batches
+                   if batch['sequence'] > mark and _matches(batch['source'], sources)
+                   and (not request_contains or request_contains.lower() in batch['request'].lower())]
+        if not batches:
+            return None
+        api_names = set(api_names) if api_names else None
+        records = []
+        seen = set()
+        for batch in batches:
+            for record in batch['records']:
+                if api_names and record['api_name'] not in api_names:
+                    continue
+                if record['id'] in seen:
+                    continue
+                seen.add(record['id'])
+                records.append(record)
+        return records
+
+    def wait_for_records(self, mark: int, sources: Iterable[str], api_names: Optional[Iterable[str]] = None,
+                         request_contains: Optional[str] = None,
+                         timeout: int = SALESFORCE_RESPONSE_TIMEOUT_MS) -> Optional[List[Dict[str, Any]]]:
+        """
+        Wait until a matching response lands after a mark and return its records.
+
+        Args:
+            mark: Value returned by ``mark`` before the action that loads the records
+            sources: Aura descriptor or UI API path fragments to accept
+            api_names: Object names to keep (None keeps every object)
+            request_contains: Only accept responses whose request contains this text
+            timeout: Milliseconds to wait for the response
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: As ``records_since``; None if nothing matching
+            landed in time (e.g. Lightning served the rows from its client cache)
+        """
+        deadline = time.time() + timeout / 1000
+        while True:
+            records = self.records_since(mark, sources, api_names, request_contains)
+            if records is not None:
+                return records
+            remaining = (deadline - time.time()) * 1000
+            if remaining <= 0:
+                return None
+            try:
+                self.page.wait_for_event('response', predicate=self._is_data_response, timeout=remaining)
+            except TimeoutError:
+                return None
@@ -0,0 +1,151 @@
+"""SQLite cache of Salesforce last-name search results, shared by folders with the same last name."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.config import SALESFORCE_SEARCH_CACHE_DB, SALESFORCE_SEARCH_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS last_name_searches (
+    backend TEXT NOT NULL,
+    view_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (backend, view_name, last_name)
+);
+"""
+
+
+class LastNameSearchCache:
+    """
+    Reuse the accounts found for a last name across folders and runs.
+
+    Spouses, "X Family" folders and name variants share a last name, so the search runs
+    once per distinct last name: later folders get the saved result until it is older than
+    ``ttl`` seconds. Concurrent searches for the same last name (page pool tabs) wait for
+    the first one instead of searching again. Empty results are not saved, so a failed or
+    premature search is retried. Results are kept per search backend, since the SOQL and UI
+    searches do not match names the same way.
+    """
+
+    def __init__(self, db_path: str = SALESFORCE_SEARCH_CACHE_DB, ttl: int = SALESFORCE_SEARCH_CACHE_TTL):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._locks: Dict[tuple, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        with self._connect() as conn:
+            # Results saved before the backend was part of the key cannot be attributed; drop them
+            columns = [row[1] for row in conn.execute('PRAGMA table_info(last_name_searches)')]
+            if columns and 'backend' not in columns:
+                conn.execute('DROP TABLE last_name_searches')
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(backend: str, view_name: str, last_name: str) -> tuple:
+        return backend, view_name, ' '.join(last_name.lower().split())
+
+    def get(self, backend: str, view_name: str, last_name: str) -> Optional[List[str]]:
+        """
+        Look up the saved result of a last-name search.
+
+        Args:
+            backend: Search backend used ('ui' or 'soql')
+            view_name: List view searched
+            last_name: Last name searched (case and spacing are ignored)
+
+        Returns:
+            Optional[List[str]]: Account names found, or None if there is no current result
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT result, created_at FROM last_name_searches '
+                    'WHERE backend = ? AND view_name = ? AND last_name = ?',
+                    self._key(backend, view_name, last_name)
+                ).fetchone()
+        except Exception as e:
+            logger.warning(f"Could not read search cache {self.db_path}: {str(e)}")
+            return None
+        if row is None or time.time() - row[1] >= self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def put(self, backend: str, view_name: str, last_name: str, account_names: List[str]) -> None:
+        """
+        Save the result of a last-name search.
+
+        Args:
+            backend: Search backend used ('ui' or 'soql')
+            view_name: List view searched
+            last_name: Last name searched
+            account_names: Account names found
+        """
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO last_name_searches (backend, view_name, last_name, result, created_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (*self._key(backend, view_name, last_name), json.dumps(account_names), time.time())
+                )
+        except Exception as e:
+            logger.warning(f"Could not write search cache {self.db_path}: {str(e)}")
+
+    def get_or_search(self, backend: str, view_name: str, last_name: str,
+                      search: Callable[[str], Tuple[List[str], str]]) -> List[str]:
+        """
+        Return the saved result for a last name, or run the search and save its result.
+
+        Args:
+            backend: Search backend the search uses ('ui' or 'soql')
+            view_name: List view searched
+            last_name: Last name to search for
+            search: Runs the search, called with the last name; returns the account names and
+                the backend that actually produced them (e.g. 'ui' when a SOQL search fell back),
+                which is the backend the result is saved under
+
+        Returns:
+            List[str]: Account names found
+        """
+        key = self._key(backend, view_name, last_name)
+        with self._locks_lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            account_names = self.get(backend, view_name, last_name)
+            if account_names is not None:
+                self.hits += 1
+                logger.info(f"Reusing search result for last name '{last_name}': {len(account_names)} accounts")
+                return account_names
+            self.misses += 1
+            account_names, used_backend = search(last_name)
+            if account_names:
+                self.put(used_backend, view_name, last_name, account_names)
+            return account_names
+
+    def clear(self) -> None:
+        """Drop all saved search results."""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM last_name_searches')
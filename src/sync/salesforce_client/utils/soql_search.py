@@ -0,0 +1,244 @@
+"""
+SOQL queries over the logged-in browser session.
+
+Queries the Salesforce REST API through ``page.request``, which shares the browser
+context's cookies, so an account search or a file listing is one HTTP request instead of
+navigating pages and waiting for them to render.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from playwright.sync_api import Page
+
+from src.config import SALESFORCE_API_URL, SALESFORCE_API_VERSION, SALESFORCE_SOQL_BATCH_SIZE, SALESFORCE_SOQL_LIMIT
+
+logger = logging.getLogger(__name__)
+
+
+def escape_soql(value: str, like: bool = False) -> str:
+    """
+    Escape a value for use inside a quoted SOQL string literal.
+
+    Args:
+        value: Raw value
+        like: Also escape the LIKE wildcards % and _
+
+    Returns:
+        str: The escaped value
+    """
+    value = value.replace('\\', '\\\\').replace("'", "\\'")
+    if like:
+        value = value.replace('%', '\\%').replace('_', '\\_')
+    return value
+
+
+def _chunks(values: List[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _in_list(values: Iterable[str]) -> str:
+    return ', '.join(f"'{escape_soql(value)}'" for value in values)
+
+
+class SalesforceRestClient:
+    """
+    Run SOQL queries with the browser's Salesforce session.
+
+    The REST API only accepts the session as a bearer token, so the ``sid`` cookie of the
+    API host is read from the browser context and sent in the Authorization header.
+    """
+
+    def __init__(self, page: Page, api_url: str = SALESFORCE_API_URL, api_version: str = SALESFORCE_API_VERSION):
+        """
+        Args:
+            page: Playwright page of the logged-in Salesforce context
+            api_url: Base URL of the org's API host (e.g. https://example.my.salesforce.com)
+            api_version: REST API version, without the leading "v"
+        """
+        self.page = page
+        self.api_url = api_url.rstrip('/')
+        self.api_version = api_version
+        self._session_id: Optional[str] = None
+
+    def _get_session_id(self) -> str:
+        for cookie in self.page.context.cookies([self.api_url]):
+            if cookie['name'] == 'sid':
+                return cookie['value']
+        raise RuntimeError(f"No Salesforce session cookie (sid) found for {self.api_url}; is the browser logged in?")
+
+    def get_json(self, path: str, params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        GET a REST API resource.
+
+        Args:
+            path: Path under /services/data/vXX (e.g. '/ui-api/list-records/Account/AllClients')
+            params: Query parameters
+
+        Returns:
+            Dict[str, Any]: The parsed JSON response
+
+        Raises:
+            RuntimeError: If there is no session cookie or the API returns an error
+        """
+        return self._get(f"{self.api_url}/services/data/v{self.api_version}{path}", params=params)
+
+    def _get(self, url: str, params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        for attempt in range(2):
+            if self._session_id is None:
+                self._session_id = self._get_session_id()
+            response = self.page.request.get(url, params=params, headers={
+                'Authorization': f'Bearer {self._session_id}',
+                'Accept': 'application/json'
+            })
+            # The session may have been refreshed since the cookie was read: read it once more
+            if response.status == 401 and attempt == 0:
+                self._session_id = None
+                continue
+            if not response.ok:
+                raise RuntimeError(f"Salesforce request failed with HTTP {response.status}: {response.text()[:500]}")
+            return response.json()
+        raise RuntimeError("Salesforce request failed: session is not authorized for the REST API")
+
+    def query(self, soql: str) -> List[Dict[str, Any]]:
+        """
+        Run a SOQL query and return every record, following ``nextRecordsUrl`` pages.
+
+        Args:
+            soql: SOQL query
+
+        Returns:
+            List[Dict[str, Any]]: Records as returned by the API (fields plus 'attributes')
+
+        Raises:
+            RuntimeError: If there is no session cookie or the API returns an error
+        """
+        logger.debug(f"SOQL: {soql}")
+        data = self.get_json('/query', params={'q': soql})
+        records = list(data.get('records', []))
+        while not data.get('done', True) and data.get('nextRecordsUrl'):
+            data = self._get(f"{self.api_url}{data['nextRecordsUrl']}")
+            records.extend(data.get('records', []))
+        return records
+
+
+class SoqlAccountSearch:
+    """
+    Find accounts by last name with one SOQL query.
+
+    Person accounts are matched on LastName and other accounts (e.g. "Smith Household") on
+    Name, like the global search does. Orgs without person accounts have no LastName
+    field; after the first INVALID_FIELD error only Name is queried.
+    """
+
+    def __init__(self, client: SalesforceRestClient, limit: int = SALESFORCE_SOQL_LIMIT):
+        """
+        Args:
+            client: REST client of the logged-in session
+            limit: Maximum number of accounts returned per search
+        """
+        self.client = client
+        self.limit = limit
+        self.person_accounts = True
+
+    def search_by_last_name(self, last_name: str) -> List[Dict[str, str]]:
+        """
+        Query accounts whose last name is, or whose name contains, the given last name.
+
+        Args:
+            last_name: Last name to search for
+
+        Returns:
+            List[Dict[str, str]]: Accounts with 'name' and 'id' keys, ordered by name
+
+        Raises:
+            RuntimeError: If the query fails
+        """
+        name_filter = f"Name LIKE '%{escape_soql(last_name, like=True)}%'"
+        if self.person_accounts:
+            where = f"LastName = '{escape_soql(last_name)}' OR {name_filter}"
+        else:
+            where = name_filter
+        soql = f"SELECT Id, Name FROM Account WHERE {where} ORDER BY Name LIMIT {self.limit}"
+        try:
+            records = self.client.query(soql)
+        except RuntimeError as e:
+            if self.person_accounts and 'INVALID_FIELD' in str(e):
+                logger.info("Account has no LastName field (no person accounts), searching Name only")
+                self.person_accounts = False
+                return self.search_by_last_name(last_name)
+            raise
+        return [{'name': record['Name'], 'id': record['Id']} for record in records if record.get('Name')]
+
+    def resolve_account_ids(self, names: Iterable[str], batch_size: int = SALESFORCE_SOQL_BATCH_SIZE) -> Dict[str, str]:
+        """
+        Look up the Ids of accounts by exact name, with one query per batch of names.
+
+        Args:
+            names: Account names (e.g. the first match of each account search)
+            batch_size: Names per query
+
+        Returns:
+            Dict[str, str]: Account Id per name found; for duplicate names, the oldest account
+
+        Raises:
+            RuntimeError: If a query fails
+        """
+        names = sorted(set(name for name in names if name))
+        account_ids: Dict[str, str] = {}
+        for batch in _chunks(names, batch_size):
+            records = self.client.query(
+                f"SELECT Id, Name FROM Account WHERE Name IN ({_in_list(batch)}) ORDER BY CreatedDate"
+            )
+            for record in records:
+                if record['Name'] in account_ids:
+                    logger.warning(f"Several accounts are named '{record['Name']}'; using {account_ids[record['Name']]}")
+                    continue
+                account_ids[record['Name']] = record['Id']
+        return account_ids
+
+
+def fetch_linked_files(client: SalesforceRestClient, account_ids: Iterable[str],
+                       batch_size: int = SALESFORCE_SOQL_BATCH_SIZE) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Fetch the files linked to a set of accounts with batched ContentDocumentLink queries.
+
+    Args:
+        client: REST client of the logged-in session
+        account_ids: Salesforce account Ids
+        batch_size: Account Ids per query
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Per account Id (every requested Id, possibly with no
+        files), the linked files with 'ContentDocumentId', 'Title', 'FileExtension',
+        'FileType', 'ContentSize' and 'Checksum' (MD5 of the latest version)
+
+    Raises:
+        RuntimeError: If a query fails
+    """
+    account_ids = sorted(set(account_ids))
+    files: Dict[str, List[Dict[str, Any]]] = {account_id: [] for account_id in account_ids}
+    for batch in _chunks(account_ids, batch_size):
+        records = client.query(
+            "SELECT LinkedEntityId, ContentDocumentId, ContentDocument.Title, ContentDocument.FileExtension, "
+            "ContentDocument.FileType, ContentDocument.ContentSize, ContentDocument.LatestPublishedVersion.Checksum "
+            f"FROM ContentDocumentLink WHERE LinkedEntityId IN ({_in_list(batch)})"
+        )
+        for record in records:
+            document = record.get('ContentDocument') or {}
+            latest_version = document.get('LatestPublishedVersion') or {}
+            # Ids in the response are 18 characters; map them back to the requested form
+            account_id = record['LinkedEntityId']
+            if account_id not in files:
+                account_id = next((requested for requested in batch if account_id.startswith(requested)), account_id)
+            files.setdefault(account_id, []).append({
+                'ContentDocumentId': record.get('ContentDocumentId'),
+                'Title': document.get('Title'),
+                'FileExtension': document.get('FileExtension'),
+                'FileType': document.get('FileType'),
+                'ContentSize': document.get('ContentSize'),
+                'Checksum': latest_version.get('Checksum')
+            })
+        logger.info(f"Fetched {len(records)} file links for {len(batch)} accounts")
+    return files
@@ -0,0 +1,286 @@
+"""
+Named, event-driven waits for Salesforce Lightning pages.
+
+Each wait ends as soon as its condition holds instead of sleeping a fixed time. DOM
+activity is tracked by one MutationObserver per document, which records how many times the
+page changed and when it last did; a wait for "the table has settled" is a condition on
+those values, polled by ``page.wait_for_function`` (on an interval rather than animation
+frames, which do not run in the page pool's background tabs). Like
+``LightningResponseCapture``, a caller takes a ``mark`` before an action so the wait only
+accepts changes made after it.
+
+Every wait has a timeout and returns a falsy value when it expires instead of raising, so
+callers keep their existing checks after the wait.
+"""
+
+import logging
+import re
+import threading
+import time
+import weakref
+from collections import Counter
+from typing import List, Optional
+
+from playwright.sync_api import Page, TimeoutError
+
+from src.config import SALESFORCE_WAIT_TIMEOUT_MS, SALESFORCE_WAIT_QUIET_MS
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds between checks of a condition
+POLLING_MS = 100
+
+# Selectors shared by the conditions
+SPINNER_SELECTOR = '.slds-spinner_container, lightning-spinner'
+TABLE_SELECTOR = 'table.slds-table'
+TABLE_ROW_SELECTOR = f'{TABLE_SELECTOR} tbody tr'
+EMPTY_LIST_SELECTOR = 'div.emptyContent'
+COUNT_STATUS_SELECTOR = ('span[aria-live="polite"].countSortedByFilteredBy, span.countSortedByFilteredBy[role="status"], '
+                         'span[aria-label="Files"]')
+TOAST_SELECTOR = 'div.forceToastMessage, div.slds-notify_toast, div.slds-notify--toast'
+
+# Install the document's mutation tracker (once per document) and return
+# [document id, change count, results table change count]. A change counts for the results
+# table when it happens inside a list table or adds or removes a table or "no items" message.
+TRACKER_SCRIPT = """
+(args) => {
+    if (!window.__syncWaitTracker) {
+        const tracker = {id: Math.random(), count: 0, rows: 0, last: performance.now()};
+        const isResults = (node) => node.nodeType === 1 &&
+            (node.matches(args.results) || !!node.querySelector(args.results));
+        const touchesRows = (record) => {
+            const target = record.target.nodeType === 1 ? record.target : record.target.parentElement;
+            if (target && target.closest(args.table)) return true;
+            return Array.from(record.addedNodes).some(isResults) || Array.from(record.removedNodes).some(isResults);
+        };
+        new MutationObserver((records) => {
+            tracker.count += 1;
+            tracker.last = performance.now();
+            if (records.some(touchesRows)) tracker.rows += 1;
+        }).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+        window.__syncWaitTracker = tracker;
+    }
+    const tracker = window.__syncWaitTracker;
+    return [tracker.id, tracker.count, tracker.rows];
+}
+"""
+
+# Shared helpers of the condition scripts, prepended to each one
+_HELPERS = """
+    const visible = (el) => !!(el && (el.offsetWidth || el.offsetHeight || el.getClientRects().length));
+    const anyVisible = (selector) => Array.from(document.querySelectorAll(selector)).some(visible);
+    const tracker = window.__syncWaitTracker;
+    // A new document since the mark has changed by definition
+    const changed = !tracker || args.since === null || tracker.id !== args.since[0] || tracker.count > args.since[1];
+    const rowsChanged = !tracker || args.since === null || tracker.id !== args.since[0] || tracker.rows > args.since[2];
+    const quiet = !tracker || performance.now() - tracker.last >= args.quietMs;
+"""
+
+DOM_SETTLED_SCRIPT = """
+(args) => {""" + _HELPERS + """
+    return changed && quiet;
+}
+"""
+
+LIST_ROWS_SCRIPT = """
+(args) => {""" + _HELPERS + """
+    if (!changed || !quiet || anyVisible(args.spinner)) return false;
+    return document.querySelectorAll(args.rows).length > 0 || anyVisible(args.empty);
+}
+"""
+
+# Like LIST_ROWS_SCRIPT, but only a change of the results table itself counts: unrelated
+# mutations (the search box, a toast) must not pass while the previous rows are still shown
+SEARCH_RESULTS_SCRIPT = """
+(args) => {""" + _HELPERS + """
+    if (!rowsChanged || !quiet || anyVisible(args.spinner)) return false;
+    return document.querySelectorAll(args.rows).length > 0 || anyVisible(args.empty);
+}
+"""
+
+FILE_COUNT_SCRIPT = """
+(args) => {
+    const status = document.querySelector(args.status);
+    const text = status ? status.textContent.trim() : '';
+    const match = text.match(/(\\d+)\\+?\\s+items?/);
+    if (!match) return false;
+    if (args.previous !== null && text === args.previous) return false;
+    if (args.expected !== null && parseInt(match[1], 10) < args.expected) return false;
+    return true;
+}
+"""
+
+_registry: 'weakref.WeakKeyDictionary[Page, PageWaits]' = weakref.WeakKeyDictionary()
+_registry_lock = threading.Lock()
+
+
+class PageWaits:
+    """
+    Conditions a page object waits for after an action.
+
+    Counts the waits per condition, how many timed out and the time spent waiting, so a run
+    can report them.
+    """
+
+    def __init__(self, page: Page, timeout: int = SALESFORCE_WAIT_TIMEOUT_MS, quiet_ms: int = SALESFORCE_WAIT_QUIET_MS):
+        """
+        Args:
+            page: Playwright page to wait on
+            timeout: Default milliseconds before a wait gives up
+            quiet_ms: Milliseconds without DOM changes after which the page is considered settled
+        """
+        self.page = page
+        self.timeout = timeout
+        self.quiet_ms = quiet_ms
+        self.waits = Counter()
+        self.timeouts = Counter()
+        self.seconds = 0.0
+
+    @classmethod
+    def for_page(cls, page: Page) -> 'PageWaits':
+        """Return the page's waits, creating them on first use so counters are shared."""
+        with _registry_lock:
+            waits = _registry.get(page)
+            if waits is None:
+                waits = cls(page)
+                _registry[page] = waits
+            return waits
+
+    def mark(self) -> Optional[List]:
+        """
+        Return a marker of the page's DOM changes; waits given it only accept later changes.
+
+        Returns:
+            Optional[List]: Document id, change count and results table change count, or None if
+            the page could not be evaluated
+        """
+        try:
+            return self.page.evaluate(TRACKER_SCRIPT, {
+                'table': TABLE_SELECTOR, 'results': f'{TABLE_SELECTOR}, {EMPTY_LIST_SELECTOR}'
+            })
+        except Exception as e:
+            logger.debug(f"Could not install the DOM change tracker: {str(e)}")
+            return None
+
+    def _wait_for(self, name: str, script: str, args: dict, timeout: Optional[int]) -> bool:
+        start_time = time.time()
+        self.waits[name] += 1
+        try:
+            self.page.wait_for_function(script, arg=args, polling=POLLING_MS,
+                                        timeout=timeout if timeout is not None else self.timeout)
+            return True
+        except TimeoutError:
+            self.timeouts[name] += 1
+            logger.debug(f"Wait '{name}' timed out after {time.time() - start_time:.2f} seconds")
+            return False
+        finally:
+            self.seconds += time.time() - start_time
+
+    def dom_settled(self, since: Optional[List] = None, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until the page has changed after a mark and then stopped changing.
+
+        Args:
+            since: Value of ``mark`` before the action (None only waits for the page to be quiet)
+            timeout: Milliseconds to wait (default: the waits' timeout)
+
+        Returns:
+            bool: True if the page settled in time
+        """
+        self.mark()
+        return self._wait_for('dom settled', DOM_SETTLED_SCRIPT,
+                              {'since': since, 'quietMs': self.quiet_ms}, timeout)
+
+    def list_view_rows_rendered(self, since: Optional[List] = None, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until a list view shows its rows (or its "no items" message) and has settled.
+
+        Args:
+            since: Value of ``mark`` before the action that loads the rows
+            timeout: Milliseconds to wait (default: the waits' timeout)
+
+        Returns:
+            bool: True if the rows rendered in time
+        """
+        self.mark()
+        return self._wait_for('list view rows rendered', LIST_ROWS_SCRIPT, {
+            'since': since, 'quietMs': self.quiet_ms, 'spinner': SPINNER_SELECTOR,
+            'rows': TABLE_ROW_SELECTOR, 'empty': EMPTY_LIST_SELECTOR
+        }, timeout)
+
+    def search_results_stable(self, since: Optional[List], timeout: Optional[int] = None) -> bool:
+        """
+        Wait until a search submitted after a mark has replaced the rows and they stopped changing.
+
+        Only changes to the results table (or its "no items" message) after the mark count, so
+        the rows of the previous search are not taken for the new results.
+
+        Args:
+            since: Value of ``mark`` taken before the search was submitted
+            timeout: Milliseconds to wait (default: the waits' timeout)
+
+        Returns:
+            bool: True if the results settled in time
+        """
+        self.mark()
+        return self._wait_for('search results stable', SEARCH_RESULTS_SCRIPT, {
+            'since': since, 'quietMs': self.quiet_ms, 'spinner': SPINNER_SELECTOR,
+            'rows': TABLE_ROW_SELECTOR, 'empty': EMPTY_LIST_SELECTOR
+        }, timeout)
+
+    def count_status_text(self) -> Optional[str]:
+        """Return the list's item count status text (e.g. "3 items • Sorted by ..."), or None."""
+        try:
+            status = self.page.locator(COUNT_STATUS_SELECTOR).first
+            return status.text_content(timeout=1000).strip() if status.count() else None
+        except Exception:
+            return None
+
+    def file_count_updated(self, previous: Optional[str] = None, expected: Optional[int] = None,
+                           timeout: Optional[int] = None) -> Optional[int]:
+        """
+        Wait until the item count status shows a new or large enough count.
+
+        Args:
+            previous: Status text before the action (from ``count_status_text``); the wait
+                ends when the text differs
+            expected: Minimum item count to wait for
+            timeout: Milliseconds to wait (default: the waits' timeout)
+
+        Returns:
+            Optional[int]: The item count shown, or None if the condition did not hold in time
+        """
+        if not self._wait_for('file count status updated', FILE_COUNT_SCRIPT, {
+            'status': COUNT_STATUS_SELECTOR, 'previous': previous, 'expected': expected
+        }, timeout):
+            return None
+        match = re.search(r'(\d+)\+?\s+items?', self.count_status_text() or '')
+        return int(match.group(1)) if match else None
+
+    def toast_shown(self, timeout: Optional[int] = None) -> Optional[str]:
+        """
+        Wait for a Lightning toast (e.g. "File was deleted.") and return its text.
+
+        Args:
+            timeout: Milliseconds to wait (default: the waits' timeout)
+
+        Returns:
+            Optional[str]: The toast text, or None if no toast appeared in time
+        """
+        start_time = time.time()
+        self.waits['toast shown'] += 1
+        try:
+            toast = self.page.wait_for_selector(TOAST_SELECTOR, state='visible',
+                                                timeout=timeout if timeout is not None else self.timeout)
+            return (toast.text_content() or '').strip() if toast else None
+        except TimeoutError:
+            self.timeouts['toast shown'] += 1
+            return None
+        finally:
+            self.seconds += time.time() - start_time
+
+    def summary(self) -> str:
+        """One-line wait counts for logging."""
+        total = sum(self.waits.values())
+        return (f"{total} waits ({sum(self.timeouts.values())} timed out) "
+                f"in {self.seconds:.1f} seconds")
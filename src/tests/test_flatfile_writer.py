@@ -0,0 +1,77 @@
+"""
+FlatFile writer journal recovery tests.
+
+A run that stops before closing its FlatFileWriter leaves the journal behind; the next
+run's ``prepare_flatfile_from_template`` must resume from it instead of starting over
+from the template.
+"""
+
+import logging
+import os
+
+import pandas as pd
+import pytest
+
+from src.sync.cmd_runner import prepare_flatfile_from_template
+from src.sync.dropbox_client.utils.flatfile_writer import FlatFileWriter
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_XLSX = os.path.join('data', 'FlatFile.5.2025.xlsx')
+JOURNAL = f"{OUTPUT_XLSX}.journal"
+
+
+@pytest.fixture
+def template_path(tmp_path, monkeypatch):
+    """A FlatFile template with one client, in a working directory of its own."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / 'FlatFile_template.xlsx'
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        pd.DataFrame([{'First Name': 'Ann', 'Last Name': 'Template', 'Email': 'ann@example.com'}]).to_excel(
+            writer, sheet_name='Clients', index=False)
+        pd.DataFrame([{'Note': 'kept'}]).to_excel(writer, sheet_name='Notes', index=False)
+    return str(path)
+
+
+def _names(writer):
+    return sorted((row['First Name'], row['Last Name']) for row in writer.rows)
+
+
+def test_unclosed_writer_rows_are_recovered(template_path):
+    writer = prepare_flatfile_from_template(template_path, logger, logger)
+    writer.flush_every = 0
+    writer.upsert({'First Name': 'Bob', 'Last Name': 'Flushed'})
+    writer.flush()
+    writer.upsert({'First Name': 'Cy', 'Last Name': 'Buffered'})
+    # The run stops here without close()
+    assert os.path.exists(JOURNAL)
+
+    resumed = prepare_flatfile_from_template(template_path, logger, logger)
+    assert _names(resumed) == [('Ann', 'Template'), ('Bob', 'Flushed'), ('Cy', 'Buffered')]
+    assert 'Notes' in resumed.sheets
+
+    assert resumed.close()
+    assert not os.path.exists(JOURNAL)
+    clients = pd.read_excel(OUTPUT_XLSX, sheet_name='Clients')
+    assert len(clients) == 3
+
+
+def test_closed_writer_starts_next_run_from_template(template_path):
+    writer = prepare_flatfile_from_template(template_path, logger, logger)
+    writer.upsert({'First Name': 'Bob', 'Last Name': 'Closed'})
+    assert writer.close()
+
+    fresh = prepare_flatfile_from_template(template_path, logger, logger)
+    assert _names(fresh) == [('Ann', 'Template')]
+    assert not os.path.exists(OUTPUT_XLSX)
+
+
+def test_writer_without_run_keeps_existing_output_rows(template_path):
+    # update_flatfile_with_account_info builds one such writer per call when no run writer is given
+    for first_name in ('Bob', 'Cy'):
+        writer = FlatFileWriter(template_path, OUTPUT_XLSX, flush_every=0, resume=True)
+        writer.upsert({'First Name': first_name, 'Last Name': 'Single'})
+        assert writer.close()
+
+    clients = pd.read_excel(OUTPUT_XLSX, sheet_name='Clients')
+    assert sorted(clients['First Name']) == ['Ann', 'Bob', 'Cy']
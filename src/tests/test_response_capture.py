@@ -0,0 +1,78 @@
+"""
+Tests of record extraction from Lightning data responses.
+
+``extract_records`` replaces the table scrape when response capture is on, so only the
+rows of a list view, search or related list may come back, never the accounts those rows
+reference.
+"""
+
+from src.sync.salesforce_client.utils.response_capture import extract_records
+
+HOUSEHOLD_ID = '001000000000002AAA'
+PARENT_ID = '001000000000003AAA'
+
+
+def _ui_record(record_id, name, fields=None):
+    record_fields = {'Name': {'value': name, 'displayValue': None}}
+    record_fields.update(fields or {})
+    return {'apiName': 'Account', 'id': record_id, 'fields': record_fields, 'childRelationships': {}}
+
+
+def test_aura_list_view_rows_without_nested_lookups():
+    return_value = {
+        'result': [
+            {'attributes': {'type': 'Account'}, 'Id': '001000000000001AAA', 'Name': 'Smith, John',
+             'Parent': {'attributes': {'type': 'Account'}, 'Id': PARENT_ID, 'Name': 'Smith Holdings'},
+             'Household__r': {'Id': HOUSEHOLD_ID, 'Name': 'Smith Household'}},
+            {'attributes': {'type': 'Account'}, 'Id': '001000000000004AAA', 'Name': 'Smith, Jane'},
+        ],
+        'totalCount': 2,
+    }
+    records, has_records_list = extract_records(return_value)
+    assert has_records_list
+    assert [record['fields']['Name'] for record in records] == ['Smith, John', 'Smith, Jane']
+    assert 'Parent' not in records[0]['fields']
+
+
+def test_ui_api_list_records_without_nested_lookups():
+    parent = _ui_record(PARENT_ID, 'Smith Holdings')
+    payload = {
+        'count': 1,
+        'records': [_ui_record('001000000000001AAA', 'Smith, John', {
+            'Parent': {'value': parent, 'displayValue': 'Smith Holdings'},
+            'ParentId': {'value': PARENT_ID, 'displayValue': None},
+        })],
+        'listInfoETag': 'etag',
+    }
+    records, has_records_list = extract_records(payload)
+    assert has_records_list
+    assert [record['id'] for record in records] == ['001000000000001AAA']
+    assert records[0]['fields'] == {'Name': 'Smith, John', 'Parent': None, 'ParentId': PARENT_ID}
+
+
+def test_wrapped_related_list_records():
+    payload = {'relatedListRecords': {'records': [
+        {'attributes': {'type': 'ContentDocumentLink'}, 'Id': '06A000000000001AAA',
+         'ContentDocument': {'Id': '069000000000001AAA', 'Title': 'License'}},
+    ]}}
+    records, _ = extract_records(payload)
+    assert [record['api_name'] for record in records] == ['ContentDocumentLink']
+
+
+def test_list_payload_items_are_rows():
+    records, has_records_list = extract_records([
+        {'Id': '001000000000001AAA', 'Name': 'Smith, John'},
+        {'Id': '001000000000001AAA', 'Name': 'Smith, John'},
+    ])
+    assert has_records_list
+    assert [record['api_name'] for record in records] == ['Account']
+
+
+def test_empty_result_is_a_records_response():
+    assert extract_records({'records': []}) == ([], True)
+
+
+def test_payloads_without_a_records_list():
+    # A single record (e.g. a record page load) and a result of plain values are not rows
+    assert extract_records(_ui_record('001000000000001AAA', 'Smith, John')) == ([], False)
+    assert extract_records({'result': ['Smith', 'Jones']}) == ([], False)